@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from enum import Enum
 from typing import Tuple
 
 import pandas as pd
@@ -13,11 +15,13 @@ from jobspy.google import Google
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
 from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
+from jobspy.model import JobType, Location, JobResponse, Country, JOB_FIELDS
 from jobspy.model import SalarySource, ScraperInput, Site
 from jobspy.util import (
     set_logger_level,
-    extract_salary,
+    extract_salaries,
+    compress_description,
+    description_text,
     create_logger,
     get_enum_from_value,
     map_str_to_site,
@@ -25,6 +29,13 @@ from jobspy.util import (
     desired_order,
 )
 from jobspy.ziprecruiter import ZipRecruiter
+from jobspy.export import (
+    compact_job_dtypes,
+    job_schema,
+    materialize_descriptions,
+    to_arrow_table,
+    write_parquet,
+)
 
 
 # Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
@@ -45,17 +56,56 @@ def scrape_jobs(
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
     linkedin_company_ids: list[int] | None = None,
+    ziprecruiter_fetch_description: bool = True,
+    naukri_concurrent_pages: bool = False,
+    naukri_fetch_description: bool = False,
+    bdjobs_fetch_description: bool = True,
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    output: str = "pandas",
+    output_path: str | None = None,
+    compact_dtypes: bool = False,
+    lazy_descriptions: bool = False,
+    validate: bool = True,
+    indeed_shard_by: str | None = None,
+    indeed_query_profile: str = "full",
+    google_fan_out: bool = False,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
+    :param ziprecruiter_fetch_description: False keeps the description snippet from ZipRecruiter's search API
+        instead of requesting every job page (much faster, no job_url_direct)
+    :param naukri_concurrent_pages: read Naukri's total result count from the first page and fetch
+        the remaining pages concurrently (rate limited) instead of one by one with 3-7 s pauses
+    :param naukri_fetch_description: fetch each Naukri job's full description (plus job type and industry)
+        from the job detail API, concurrently
+    :param bdjobs_fetch_description: False returns BDJobs listings without visiting each job page
+        (no description, job type or industry)
+    :param output: "pandas" (default), "arrow" for a typed pyarrow.Table, or "parquet" to also
+        write a Parquet dataset partitioned by site and date_posted under output_path
+    :param compact_dtypes: return low-cardinality columns as category and numeric columns as
+        nullable Float64/Int64 (pandas output only)
+    :param lazy_descriptions: skip description conversion while scraping; the raw HTML is kept
+        zlib-compressed in description_raw and converted later with materialize_descriptions().
+        Emails, job type, remote flag and description salaries are derived from the HTML's text.
+    :param validate: False skips pydantic validation of each job (scrapers build slotted JobRecords)
+    :param indeed_shard_by: "job_type" or "date" to split the Indeed search into sub-queries whose
+        pages are fetched concurrently (for large results_wanted); offset and results_wanted apply
+        to the merged results in shard order
+    :param indeed_query_profile: "minimal" (ids, titles, dates, locations), "standard" (adds description,
+        salary, job type) or "full" (adds company details); smaller profiles mean smaller Indeed responses
+    :param google_fan_out: also search job type and time range variants of the Google query, concurrently
+    :return: Pandas DataFrame containing job data (pyarrow.Table for arrow/parquet output)
     """
+    if output not in ("pandas", "arrow", "parquet"):
+        raise ValueError(f"Invalid output '{output}'. Use 'pandas', 'arrow' or 'parquet'.")
+    if output == "parquet" and not output_path:
+        raise ValueError("output_path is required when output='parquet'")
+
     SCRAPER_MAPPING = {
         Site.LINKEDIN: LinkedIn,
         Site.INDEED: Indeed,
@@ -95,12 +145,20 @@ def scrape_jobs(
         is_remote=is_remote,
         job_type=job_type,
         easy_apply=easy_apply,
-        description_format=description_format,
+        description_format="raw" if lazy_descriptions else description_format,
         linkedin_fetch_description=linkedin_fetch_description,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
+        ziprecruiter_fetch_description=ziprecruiter_fetch_description,
+        naukri_concurrent_pages=naukri_concurrent_pages,
+        naukri_fetch_description=naukri_fetch_description,
+        bdjobs_fetch_description=bdjobs_fetch_description,
         offset=offset,
         hours_old=hours_old,
+        validate_jobs=validate,
+        indeed_shard_by=indeed_shard_by,
+        indeed_query_profile=indeed_query_profile,
+        google_fan_out=google_fan_out,
     )
 
     def scrape_site(site: Site) -> Tuple[str, JobResponse]:
@@ -128,12 +186,15 @@ def scrape_jobs(
             site_value, scraped_data = future.result()
             site_to_jobs_dict[site_value] = scraped_data
 
-    jobs_dfs: list[pd.DataFrame] = []
+    jobs_rows: list[dict] = []
+    # Jobs whose salary is parsed from the description, all at once after the loop
+    salary_pending: list[dict] = []
 
     for site, job_response in site_to_jobs_dict.items():
         for job in job_response.jobs:
-            job_data = job.model_dump()
-            job_url = job_data["job_url"]
+            # Read attributes directly: works for JobPost and JobRecord alike and
+            # avoids model_dump() plus re-validating Location just to display it
+            job_data = {name: getattr(job, name) for name in JOB_FIELDS}
             job_data["site"] = site
             job_data["company"] = job_data["company_name"]
             job_data["job_type"] = (
@@ -145,21 +206,24 @@ def scrape_jobs(
                 ", ".join(job_data["emails"]) if job_data["emails"] else None
             )
             if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
+                job_data["location"] = job_data["location"].display_location()
+            if isinstance(job_data["date_posted"], str):
+                # Unvalidated records may carry the scraper's "%Y-%m-%d" string
+                try:
+                    job_data["date_posted"] = date.fromisoformat(job_data["date_posted"][:10])
+                except ValueError:
+                    job_data["date_posted"] = None
 
             # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
+            compensation_obj = job_data.pop("compensation")
+            if compensation_obj:
+                interval = compensation_obj.interval
                 job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
+                    interval.value if isinstance(interval, Enum) else interval
                 )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
+                job_data["min_amount"] = compensation_obj.min_amount
+                job_data["max_amount"] = compensation_obj.max_amount
+                job_data["currency"] = compensation_obj.currency
                 job_data["salary_source"] = SalarySource.DIRECT_DATA.value
                 if enforce_annual_salary and (
                     job_data["interval"]
@@ -170,16 +234,7 @@ def scrape_jobs(
                     convert_to_annual(job_data)
             else:
                 if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
+                    salary_pending.append(job_data)
 
             job_data["salary_source"] = (
                 job_data["salary_source"]
@@ -197,28 +252,57 @@ def scrape_jobs(
             job_data["vacancy_count"] = job_data.get("vacancy_count")
             job_data["work_from_home_type"] = job_data.get("work_from_home_type")
 
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
+            jobs_rows.append(job_data)
+
+    if salary_pending:
+        salaries = extract_salaries(
+            # Raw (lazy) and html descriptions are scanned as text, like the markdown ones
+            [description_text(job_data["description"]) for job_data in salary_pending],
+            enforce_annual_salary=enforce_annual_salary,
+        )
+        salaries = salaries.astype(object).where(salaries.notna(), None)
+        for job_data, salary in zip(salary_pending, salaries.to_dict("records")):
+            job_data.update(salary)
+            job_data["salary_source"] = (
+                SalarySource.DESCRIPTION.value if job_data["min_amount"] else None
+            )
+
+    if lazy_descriptions:
+        for job_data in jobs_rows:
+            job_data["description_raw"] = compress_description(job_data["description"])
+            job_data["description"] = None
+
+    if output != "pandas":
+        table = to_arrow_table(jobs_rows, include_raw_description=lazy_descriptions).sort_by(
+            [("site", "ascending"), ("date_posted", "descending")]
+        )
+        if output == "parquet":
+            write_parquet(table, output_path)
+        return table
 
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    if jobs_rows:
+        # Step 1: Build one DataFrame from all rows (much cheaper than one DataFrame per job + concat)
+        jobs_df = pd.DataFrame(jobs_rows)
 
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+        # Step 2: Filter out all-NA columns
+        jobs_df = jobs_df.dropna(axis=1, how="all")
 
         # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
+        columns = desired_order + (["description_raw"] if lazy_descriptions else [])
+        for column in columns:
             if column not in jobs_df.columns:
                 jobs_df[column] = None  # Add missing columns as empty
 
         # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
+        jobs_df = jobs_df[columns]
+        if lazy_descriptions:
+            jobs_df.attrs["description_format"] = description_format
 
         # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
+        jobs_df = jobs_df.sort_values(
             by=["site", "date_posted"], ascending=[True, False]
         ).reset_index(drop=True)
+        return compact_job_dtypes(jobs_df) if compact_dtypes else jobs_df
     else:
         return pd.DataFrame()
 
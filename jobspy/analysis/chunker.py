@@ -0,0 +1,130 @@
+# In jobspy/analysis/chunker.py
+
+import math
+import os
+import re
+from bisect import bisect_left
+
+from .tokenizer import token_offsets
+
+SECTION_HEADERS = [
+    "responsibilities", "requirements", "qualifications", "duties",
+    "experience", "skills", "about the role", "about you", "your role",
+    "what you'll do", "what you will do", "what you'll need", "nice to have", "preferred qualifications"
+]
+# Compiled once at import instead of on every call.
+HEADER_PATTERN = re.compile(
+    r'\n\s*(' + '|'.join(re.escape(h) for h in SECTION_HEADERS) + r')\s*[:\-]*\s*\n',
+    re.IGNORECASE,
+)
+PARAGRAPH_PATTERN = re.compile(r'\n\s*\n')
+
+# Oversized segments are split on the coarsest boundary that works.
+_SPLITTERS = [
+    (PARAGRAPH_PATTERN, "\n\n"),
+    (re.compile(r'\n'), "\n"),
+    (re.compile(r'(?<=[.!?;])\s+'), " "),
+]
+
+MIN_CHUNK_TOKENS = int(os.environ.get("MIN_CHUNK_TOKENS", 64))
+MAX_CHUNK_TOKENS = int(os.environ.get("MAX_CHUNK_TOKENS", 512))
+
+
+def _split_sections(text: str) -> list[str]:
+    """ Splits on known section headers, falling back to paragraphs when there are none. """
+    parts = HEADER_PATTERN.split(text)
+    sections = [parts[0].strip()]
+    for i in range(1, len(parts), 2):
+        sections.append((parts[i] + ":\n" + parts[i + 1]).strip())
+    sections = [s for s in sections if s]
+    if len(sections) <= 1:
+        sections = [p.strip() for p in PARAGRAPH_PATTERN.split(text) if p.strip()]
+    return sections
+
+
+def _split_span(text: str, pattern: re.Pattern, start: int, end: int) -> list[tuple[int, int]]:
+    """ pattern.split over text[start:end], as (start, end) spans, dropping blank pieces. """
+    spans = []
+    position = start
+    for match in pattern.finditer(text, start, end):
+        spans.append((position, match.start()))
+        position = match.end()
+    spans.append((position, end))
+    return [(a, b) for a, b in spans if not text[a:b].isspace() and a < b]
+
+
+def _split_oversized(
+    text: str, offsets: list[int], start: int, end: int, max_tokens: int, level: int = 0
+) -> list[tuple[str, int]]:
+    """
+    Breaks text[start:end] into (text, tokens) pieces of at most max_tokens each.
+    offsets are text's token start offsets, so pieces are counted without re-tokenizing.
+    """
+    first = bisect_left(offsets, start)
+    last = bisect_left(offsets, end)
+    tokens = last - first
+    if tokens <= max_tokens:
+        return [(text[start:end], tokens)]
+
+    for pattern, joiner in _SPLITTERS[level:]:
+        level += 1
+        spans = _split_span(text, pattern, start, end)
+        if len(spans) < 2:
+            continue
+        out = []
+        for piece_start, piece_end in spans:
+            out.extend(_split_oversized(text, offsets, piece_start, piece_end, max_tokens, level))
+        return _merge(out, max_tokens, max_tokens, joiner)
+
+    # A single run-on sentence: cut it into evenly sized windows on token boundaries.
+    window = math.ceil(tokens / math.ceil(tokens / max_tokens))
+    bounds = list(range(first, last, window)) + [last]
+    out = []
+    for i, j in zip(bounds, bounds[1:]):
+        piece = text[max(start, offsets[i]) : offsets[j] if j < len(offsets) else end].strip()
+        if piece:
+            out.append((piece, j - i))
+    return out
+
+
+def _merge(pieces: list[tuple[str, int]], min_tokens: int, max_tokens: int, joiner: str) -> list[tuple[str, int]]:
+    """ Greedily merges undersized pieces into their neighbours without exceeding max_tokens. """
+    merged = []
+    for text, tokens in pieces:
+        if merged:
+            prev_text, prev_tokens = merged[-1]
+            if (prev_tokens < min_tokens or tokens < min_tokens) and prev_tokens + tokens <= max_tokens:
+                merged[-1] = (prev_text + joiner + text, prev_tokens + tokens)
+                continue
+        merged.append((text, tokens))
+    return merged
+
+
+def chunk_text(text: str, min_tokens: int = MIN_CHUNK_TOKENS, max_tokens: int = MAX_CHUNK_TOKENS) -> list[str]:
+    """
+    Splits a job description or resume into section-aware chunks sized between
+    min_tokens and max_tokens. Small sections are merged with their neighbours and
+    large ones are split on paragraph, line and sentence boundaries.
+    """
+    if not text:
+        return []
+    pieces = []
+    for section in _split_sections(text):
+        # Tokenize each section once; every split below is counted from these offsets
+        pieces.extend(_split_oversized(section, token_offsets(section), 0, len(section), max_tokens))
+    return [chunk for chunk, _ in _merge(pieces, min_tokens, max_tokens, "\n\n")]
+
+
+def chunk_texts(texts: list, min_tokens: int = MIN_CHUNK_TOKENS, max_tokens: int = MAX_CHUNK_TOKENS) -> list[list[str]]:
+    """
+    Batch interface for chunking many documents at once. Identical texts (common
+    when the same posting is scraped from several sites) are only chunked once.
+    """
+    cache = {}
+    results = []
+    for text in texts:
+        text = text or ""
+        if text not in cache:
+            cache[text] = chunk_text(text, min_tokens, max_tokens)
+        results.append(cache[text])
+    return results
@@ -1,10 +1,12 @@
 # In jobspy/analysis/llm_analyser.py
 
 import os
-import json
 import re
 from openai import AzureOpenAI
 
+from .skill_extractor import extract_skills
+from .tokenizer import count_tokens, truncate_to_tokens
+
 # --- This file relies on the .env file being loaded by the main script ---
 
 required_vars = ["AZURE_OPENAI_ENDPOINT", "OPENAI_API_KEY", "OPENAI_DEPLOYMENT_NAME"]
@@ -24,23 +26,42 @@ except Exception as e:
     print(f"CRITICAL ERROR: Failed to initialize Azure OpenAI client. Check credentials/library version. Error: {e}")
     client = None
 
-def _extract_relevant_sections(text: str) -> str:
+# Most useful sections for skill extraction come first when the budget is tight.
+SECTION_KEYWORDS = ["skills", "experience", "projects", "summary", "objective", "education"]
+SECTION_PATTERN = re.compile(r'^\s*(' + '|'.join(SECTION_KEYWORDS) + r')\s*:', re.IGNORECASE | re.MULTILINE)
+SKILLS_PROMPT_TOKEN_BUDGET = int(os.environ.get("SKILLS_PROMPT_TOKEN_BUDGET", 1500))
+# Documents where the dictionary extractor finds fewer skills than this go to the LLM.
+MIN_LOCAL_SKILLS = int(os.environ.get("MIN_LOCAL_SKILLS", 8))
+
+def _extract_relevant_sections(text: str, token_budget: int = SKILLS_PROMPT_TOKEN_BUDGET) -> str:
     """
     A helper function to extract only the most important sections from a resume
     to create a smaller, more focused prompt for the LLM.
+    Sections are packed by priority within token_budget and kept in resume order.
     """
-    section_keywords = ["skills", "experience", "projects", "education", "summary", "objective"]
-    pattern = re.compile(r'^\s*(' + '|'.join(section_keywords) + r')\s*:', re.IGNORECASE | re.MULTILINE)
-    matches = list(pattern.finditer(text))
+    matches = list(SECTION_PATTERN.finditer(text))
     if not matches:
-        return text[:4000]
-    extracted_text = ""
+        return truncate_to_tokens(text, token_budget)
+    sections = []
     for i, match in enumerate(matches):
         start_pos = match.start()
         end_pos = matches[i+1].start() if i + 1 < len(matches) else len(text)
-        section_content = text[start_pos:end_pos].strip()
-        extracted_text += section_content + "\n\n"
-    return extracted_text.strip()
+        priority = SECTION_KEYWORDS.index(match.group(1).lower())
+        sections.append((priority, i, text[start_pos:end_pos].strip()))
+
+    selected = []
+    used = 0
+    for priority, i, section_content in sorted(sections):
+        tokens = count_tokens(section_content)
+        if used + tokens > token_budget:
+            section_content = truncate_to_tokens(section_content, token_budget - used)
+            tokens = count_tokens(section_content)
+        if section_content:
+            selected.append((i, section_content))
+            used += tokens
+        if used >= token_budget:
+            break
+    return "\n\n".join(content for _, content in sorted(selected))
 
 def extract_skills_with_llm(text: str) -> list[str]:
     """
@@ -51,6 +72,7 @@ def extract_skills_with_llm(text: str) -> list[str]:
 
     print("Extracting relevant sections from resume for a smaller prompt...")
     relevant_text = _extract_relevant_sections(text)
+    print(f"Skill extraction context: {count_tokens(relevant_text)} tokens (from {count_tokens(text)}).")
 
     prompt = f"""
     Analyze the following resume text and extract all technical skills, programming languages, and software tools.
@@ -75,6 +97,8 @@ def extract_skills_with_llm(text: str) -> list[str]:
         )
         
         skill_string = response.choices[0].message.content or ""
+        if response.usage:
+            print(f"Token usage: prompt={response.usage.prompt_tokens}, completion={response.usage.completion_tokens}")
         
         print(f"Raw skills output from model: '{skill_string}'")
         
@@ -92,4 +116,17 @@ def extract_skills_with_llm(text: str) -> list[str]:
 
     except Exception as e:
         print(f"An error occurred during Azure OpenAI-based skill extraction: {e}")
-        return []
\ No newline at end of file
+        return []
+
+def extract_skills_hybrid(text: str, min_local_skills: int = MIN_LOCAL_SKILLS) -> list[str]:
+    """
+    Runs the local dictionary extractor first and only consults the LLM when it
+    finds fewer than min_local_skills skills. Results from both are merged.
+    """
+    local_skills = extract_skills(text)
+    if len(local_skills) >= min_local_skills:
+        print(f"Dictionary extractor found {len(local_skills)} skills; skipping the LLM.")
+        return local_skills
+
+    print(f"Dictionary extractor found only {len(local_skills)} skills; asking the LLM.")
+    return sorted(set(local_skills) | set(extract_skills_with_llm(text)))
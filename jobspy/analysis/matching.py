@@ -40,7 +40,7 @@ def find_best_resumes_for_job(job_id: str, filters: dict = {}, limit: int = 5):
     Step 1: Broad semantic vector search.
     Step 2: Precise metadata filtering on the semantic results.
     """
-    job = jobs_collection.find_one({"_id": job_id})
+    job = jobs_collection.find_one({"_id": job_id}, {"metadata": 1, "full_description_raw": 1})
     if not job:
         print(f"Job with ID '{job_id}' not found.")
         return []
@@ -0,0 +1,73 @@
+# In jobspy/analysis/prompt_builder.py
+
+from typing import Optional
+
+import numpy as np
+
+from .tokenizer import count_tokens, truncate_to_tokens
+
+
+def average_chunk_embedding(chunks: list) -> Optional[np.ndarray]:
+    """ Averages the stored chunk embeddings of a job or resume document. """
+    embeddings = [c["embedding"] for c in chunks or [] if c.get("embedding") is not None]
+    if not embeddings:
+        return None
+    return np.mean(np.asarray(embeddings, dtype=np.float32), axis=0)
+
+
+def rank_chunks(chunks: list, query_embedding) -> list[int]:
+    """
+    Returns chunk indices ordered by cosine similarity to the query embedding.
+    Chunks without an embedding are ranked last, in document order.
+    """
+    if query_embedding is None:
+        return list(range(len(chunks)))
+
+    embedded = [i for i, c in enumerate(chunks) if c.get("embedding") is not None]
+    if not embedded:
+        return list(range(len(chunks)))
+
+    matrix = np.asarray([chunks[i]["embedding"] for i in embedded], dtype=np.float32)
+    query = np.asarray(query_embedding, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query) or 1.0)
+    scores = matrix @ query / np.where(norms == 0, 1.0, norms)
+
+    ranked = [embedded[i] for i in np.argsort(-scores, kind="stable")]
+    missing = [i for i in range(len(chunks)) if chunks[i].get("embedding") is None]
+    return ranked + missing
+
+
+def pack_chunks(
+    chunks: list,
+    query_embedding,
+    token_budget: int,
+    fallback_text: str = "",
+) -> tuple[str, int]:
+    """
+    Greedily packs the most relevant chunks into token_budget tokens.
+    The selected chunks are emitted in their original document order so the
+    context still reads naturally. Falls back to truncating fallback_text when
+    the document has no stored chunks.
+    :return: packed text, tokens used
+    """
+    chunks = [c for c in chunks or [] if c.get("chunk_text")]
+    if not chunks:
+        text = truncate_to_tokens(fallback_text, token_budget)
+        return text, count_tokens(text)
+
+    selected = {}
+    used = 0
+    for i in rank_chunks(chunks, query_embedding):
+        text = chunks[i]["chunk_text"]
+        tokens = count_tokens(text)
+        if used + tokens <= token_budget:
+            selected[i] = text
+            used += tokens
+        elif not selected:
+            # The best chunk alone is over budget; keep as much of it as fits.
+            selected[i] = truncate_to_tokens(text, token_budget)
+            used = count_tokens(selected[i])
+            break
+
+    packed = "\n\n".join(selected[i] for i in sorted(selected))
+    return packed, used
@@ -5,8 +5,15 @@ import openai
 import os
 from dotenv import load_dotenv
 
+from .prompt_builder import average_chunk_embedding, pack_chunks
+from .tokenizer import count_tokens
+
 load_dotenv()
 
+# --- Prompt token budgets (per candidate call) ---
+JOB_CONTEXT_TOKEN_BUDGET = int(os.environ.get("RAG_JOB_TOKEN_BUDGET", 1500))
+RESUME_CONTEXT_TOKEN_BUDGET = int(os.environ.get("RAG_RESUME_TOKEN_BUDGET", 1500))
+
 # --- Initialize the Azure OpenAI client ---
 if "AZURE_OPENAI_ENDPOINT" not in os.environ or "OPENAI_API_KEY" not in os.environ:
     raise EnvironmentError("AZURE_OPENAI_ENDPOINT and OPENAI_API_KEY environment variables not found.")
@@ -17,10 +24,17 @@ client = openai.AzureOpenAI(
     api_version=os.environ.get("OPENAI_API_VERSION", "2025-04-01-preview")
 )
 
-def generate_rag_insights(job_document: dict, candidate_documents: list) -> list:
+def generate_rag_insights(
+    job_document: dict,
+    candidate_documents: list,
+    job_token_budget: int = JOB_CONTEXT_TOKEN_BUDGET,
+    resume_token_budget: int = RESUME_CONTEXT_TOKEN_BUDGET,
+) -> list:
     """
     Takes a job and a list of top candidate documents and uses the Azure OpenAI API to generate
     summaries, match scores, justifications, and interview questions.
+    The job description and resume are packed into the prompt chunk by chunk, most relevant
+    first, within the given token budgets. Token usage is reported under "token_usage".
     """
     if not job_document or not candidate_documents:
         return []
@@ -28,14 +42,27 @@ def generate_rag_insights(job_document: dict, candidate_documents: list) -> list
     generated_results = []
     
     job_title = job_document.get('metadata', {}).get('title', 'N/A')
-    job_description = job_document.get('full_description_raw', '')
+    job_chunks = job_document.get('chunks', [])
+    job_embedding = average_chunk_embedding(job_chunks)
 
     for candidate in candidate_documents:
         candidate_name = candidate.get('metadata', {}).get('name', 'N/A')
         candidate_skills = candidate.get('metadata', {}).get('extracted_skills', [])
-        candidate_text = candidate.get('full_text_raw', '')[:4000] # Truncate to 4000 characters
         candidate_id = candidate.get('_id')
-        
+        candidate_embedding = candidate.get('average_embedding')
+        if candidate_embedding is None:
+            candidate_embedding = average_chunk_embedding(candidate.get('chunks', []))
+
+        # Rank each side's chunks against the other side's embedding.
+        job_description, job_tokens = pack_chunks(
+            job_chunks, candidate_embedding, job_token_budget,
+            fallback_text=job_document.get('full_description_raw', ''),
+        )
+        candidate_text, resume_tokens = pack_chunks(
+            candidate.get('chunks', []), job_embedding, resume_token_budget,
+            fallback_text=candidate.get('full_text_raw', ''),
+        )
+
         print(f"\n--- Generating AI Insights for candidate: {candidate_name} ---")
 
         prompt = f"""
@@ -63,6 +90,11 @@ def generate_rag_insights(job_document: dict, candidate_documents: list) -> list
 
         JSON OUTPUT:
         """
+        token_usage = {
+            "job_context_tokens": job_tokens,
+            "resume_context_tokens": resume_tokens,
+            "prompt_tokens_estimated": count_tokens(prompt),
+        }
 
         try:
             response = client.chat.completions.create(
@@ -76,9 +108,14 @@ def generate_rag_insights(job_document: dict, candidate_documents: list) -> list
             )
             
             generated_text = response.choices[0].message.content
+            if response.usage:
+                token_usage["prompt_tokens"] = response.usage.prompt_tokens
+                token_usage["completion_tokens"] = response.usage.completion_tokens
+            print(f"Token usage for {candidate_name}: {token_usage}")
 
             parsed_json = json.loads(generated_text)
             parsed_json['candidate_id'] = candidate_id
+            parsed_json['token_usage'] = token_usage
             generated_results.append(parsed_json)
             print(f"Successfully generated and parsed insights for {candidate_name}.")
 
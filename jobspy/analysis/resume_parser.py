@@ -1,35 +1,165 @@
 # In jobspy/analysis/resume_parser.py
 
+import multiprocessing
+import os
+import re
+import time
+from multiprocessing.connection import wait
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 import pypdf
 import docx
 
-def parse_resume(file_path: str) -> str:
+SUPPORTED_SUFFIXES = (".pdf", ".docx")
+# Limits so a pathological file can't stall bulk ingestion.
+MAX_RESUME_PAGES = int(os.environ.get("MAX_RESUME_PAGES", 20))
+RESUME_PARSE_TIME_LIMIT = float(os.environ.get("RESUME_PARSE_TIME_LIMIT", 30))
+# Workers never fork this process: parse_resumes runs next to Mongo and embedding client threads,
+# and a child forked while one of them holds a lock (logging, pymongo, HTTP pools) can deadlock.
+# forkserver forks from a clean single-threaded server that has this module preloaded; spawn is
+# the fallback where forkserver isn't available.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+_MP_CONTEXT = multiprocessing.get_context(_START_METHOD)
+if _START_METHOD == "forkserver":
+    _MP_CONTEXT.set_forkserver_preload([__name__])
+
+def parse_resume(file_path: str, max_pages: Optional[int] = None, time_limit: Optional[float] = None) -> str:
     """
     Parses a resume file (.pdf or .docx) and returns its text content.
+    PDFs stop after max_pages pages, or once time_limit seconds have been spent.
     """
+    return _read_resume(file_path, max_pages, time_limit)[0]
+
+def _read_resume(file_path: str, max_pages: Optional[int], time_limit: Optional[float]) -> tuple[str, bool]:
+    """ parse_resume, also reporting whether the text was cut short by the time limit. """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Resume file not found at: {file_path}")
 
-    text = ""
+    deadline = time.monotonic() + time_limit if time_limit else None
+    timed_out = False
+    parts = []
     if path.suffix == ".pdf":
         try:
             reader = pypdf.PdfReader(path)
-            for page in reader.pages:
-                text += page.extract_text() or ""
+            for page_number, page in enumerate(reader.pages):
+                if max_pages is not None and page_number >= max_pages:
+                    print(f"Stopping {file_path} at the {max_pages} page limit.")
+                    break
+                if deadline is not None and time.monotonic() > deadline:
+                    print(f"Stopping {file_path} after {time_limit}s at page {page_number}.")
+                    timed_out = True
+                    break
+                parts.append(page.extract_text() or "")
         except Exception as e:
             print(f"Error reading PDF {file_path}: {e}")
-            return ""
+            return "", False
     elif path.suffix == ".docx":
         try:
             doc = docx.Document(path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+            parts = [para.text + "\n" for para in doc.paragraphs]
         except Exception as e:
             print(f"Error reading DOCX {file_path}: {e}")
-            return ""
+            return "", False
     else:
         raise ValueError("Unsupported file type. Please use .pdf or .docx.")
-    
-    return text.strip()
\ No newline at end of file
+
+    return "".join(parts).strip(), timed_out
+
+def candidate_id_from_path(file_path: str) -> str:
+    """ Derives a stable candidate id from a resume file name, e.g. 'Utkarsh_Sinha.pdf' -> 'utkarsh_sinha'. """
+    return re.sub(r"[^a-z0-9]+", "_", Path(file_path).stem.lower()).strip("_")
+
+def _parse_resume_worker(connection, file_path: str, max_pages: int, time_limit: float):
+    try:
+        result = _read_resume(file_path, max_pages, time_limit)
+    except Exception as e:
+        print(f"Error parsing resume {file_path}: {e}")
+        result = ("", False)
+    connection.send(result)
+    connection.close()
+
+def _resolve_resume_files(source) -> dict:
+    if isinstance(source, dict):
+        return dict(source)
+    if isinstance(source, (str, Path)) and Path(source).is_dir():
+        paths = sorted(p for p in Path(source).iterdir() if p.suffix in SUPPORTED_SUFFIXES)
+    else:
+        paths = [Path(source)] if isinstance(source, (str, Path)) else [Path(p) for p in source]
+    return {candidate_id_from_path(p): str(p) for p in paths}
+
+def parse_resumes(
+    source: "str | Iterable[str] | dict",
+    max_workers: Optional[int] = None,
+    max_pages: int = MAX_RESUME_PAGES,
+    time_limit: float = RESUME_PARSE_TIME_LIMIT,
+) -> Iterator[tuple[str, str, bool]]:
+    """
+    Parses many resumes in parallel worker processes and streams (candidate_id, text, timed_out)
+    triples as they finish. source is a directory, an iterable of file paths, or a
+    {candidate_id: file_path} mapping. timed_out marks text cut short by the time limit.
+    Files that fail are yielded with empty text; a worker still running twice the time limit
+    after it started is killed and its file yielded with empty text.
+    """
+    files = _resolve_resume_files(source)
+    if not files:
+        return
+    max_workers = max_workers or min(len(files), os.cpu_count() or 1)
+    queue = iter(files.items())
+    # parse_resume checks the limit between pages; the hard cap here catches a single page that hangs.
+    hard_limit = 2 * time_limit if time_limit else None
+    # One process per file, so a hung one can be terminated without taking a pool slot with it.
+    running = {}  # receiving end of the worker's pipe -> (candidate_id, process, start time)
+
+    def start_next():
+        item = next(queue, None)
+        if item is None:
+            return
+        candidate_id, file_path = item
+        receiver, sender = _MP_CONTEXT.Pipe(duplex=False)
+        process = _MP_CONTEXT.Process(
+            target=_parse_resume_worker, args=(sender, file_path, max_pages, time_limit), daemon=True
+        )
+        process.start()
+        sender.close()
+        running[receiver] = (candidate_id, process, time.monotonic())
+
+    def stop(receiver):
+        candidate_id, process, _ = running.pop(receiver)
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        receiver.close()
+        return candidate_id
+
+    try:
+        for _ in range(max_workers):
+            start_next()
+        while running:
+            timeout = None
+            if hard_limit is not None:
+                oldest = min(started for _, _, started in running.values())
+                timeout = max(0.0, oldest + hard_limit - time.monotonic())
+
+            for receiver in wait(list(running), timeout=timeout):
+                try:
+                    text, timed_out = receiver.recv()
+                except EOFError:  # the worker died without sending a result
+                    print(f"Resume worker for '{running[receiver][0]}' exited without a result.")
+                    text, timed_out = "", False
+                candidate_id = stop(receiver)
+                yield candidate_id, text, timed_out
+                start_next()
+
+            if hard_limit is None:
+                continue
+            now = time.monotonic()
+            for receiver, (candidate_id, _, started) in list(running.items()):
+                if now - started > hard_limit:
+                    print(f"Giving up on resume '{candidate_id}' after {hard_limit}s.")
+                    stop(receiver)
+                    yield candidate_id, "", True
+                    start_next()
+    finally:
+        for receiver in list(running):
+            stop(receiver)
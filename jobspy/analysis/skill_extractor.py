@@ -0,0 +1,236 @@
+# In jobspy/analysis/skill_extractor.py
+
+from collections import deque
+
+# Canonical skill name -> aliases as they appear in postings and resumes.
+# Everything is matched lowercase on word boundaries; the canonical name is
+# always matched as well, so only list the extra spellings here.
+SKILL_VOCABULARY = {
+    # Languages
+    "python": ["python3", "python 3"],
+    "java": ["java 8", "java 11", "java 17", "core java"],
+    "javascript": ["js", "ecmascript", "es6"],
+    "typescript": ["ts"],
+    "c++": ["cpp"],
+    "c#": ["csharp", "c sharp"],
+    "go": ["golang"],
+    "rust": [],
+    "ruby": [],
+    "php": [],
+    "kotlin": [],
+    "swift": ["swiftui", "swift 5", "swift programming", "swift language"],
+    "scala": [],
+    "r": ["r programming", "rstudio"],
+    "matlab": [],
+    "perl": [],
+    "bash": ["shell scripting", "shell script"],
+    "powershell": [],
+    "sql": ["t-sql", "pl/sql", "plsql", "tsql"],
+    "html": ["html5"],
+    "css": ["css3", "scss", "sass"],
+    "dart": ["dart language", "dart programming", "dartlang", "flutter/dart", "dart/flutter"],
+    "objective-c": ["objective c"],
+    "solidity": [],
+    # Frameworks and libraries
+    "react": ["reactjs", "react.js"],
+    "react native": [],
+    "angular": ["angularjs", "angular.js"],
+    "vue": ["vuejs", "vue.js"],
+    "next.js": ["nextjs"],
+    "node.js": ["nodejs", "node js"],
+    "express": ["expressjs", "express.js"],
+    "django": [],
+    "flask": [],
+    "fastapi": [],
+    "spring": ["spring framework"],
+    "spring boot": ["springboot"],
+    "hibernate": [],
+    ".net": ["dotnet", ".net core", "asp.net", "asp.net core"],
+    "ruby on rails": ["rails"],
+    "laravel": [],
+    "flutter": [],
+    "jquery": [],
+    "bootstrap": [],
+    "tailwind": ["tailwindcss", "tailwind css"],
+    "redux": [],
+    "graphql": [],
+    "rest api": ["restful", "rest apis", "restful api", "restful apis", "rest"],
+    "grpc": [],
+    "microservices": ["microservice", "micro-services"],
+    # Data and ML
+    "pandas": [],
+    "numpy": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "tensorflow": [],
+    "pytorch": ["torch"],
+    "keras": [],
+    "machine learning": ["ml"],
+    "deep learning": [],
+    "nlp": ["natural language processing"],
+    "computer vision": ["opencv"],
+    "llm": ["llms", "large language models", "large language model"],
+    "generative ai": ["genai", "gen ai"],
+    "data analysis": ["data analytics"],
+    "data engineering": [],
+    "etl": ["elt"],
+    "apache spark": ["spark", "pyspark"],
+    "hadoop": [],
+    "kafka": ["apache kafka"],
+    "airflow": ["apache airflow"],
+    "dbt": [],
+    "tableau": [],
+    "power bi": ["powerbi"],
+    "excel": ["ms excel", "microsoft excel", "advanced excel", "excel spreadsheets", "excel vba"],
+    "statistics": [],
+    # Databases
+    "postgresql": ["postgres"],
+    "mysql": [],
+    "mongodb": ["mongo"],
+    "redis": [],
+    "elasticsearch": ["elastic search"],
+    "oracle": ["oracle db"],
+    "sql server": ["mssql", "ms sql"],
+    "sqlite": [],
+    "cassandra": [],
+    "dynamodb": [],
+    "snowflake": [],
+    "bigquery": [],
+    # Cloud and DevOps
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "docker": [],
+    "kubernetes": ["k8s"],
+    "terraform": [],
+    "ansible": [],
+    "jenkins": [],
+    "ci/cd": ["cicd", "ci cd", "continuous integration"],
+    "github actions": [],
+    "git": ["github", "gitlab", "bitbucket"],
+    "linux": ["unix"],
+    "nginx": [],
+    "serverless": ["aws lambda", "lambda"],
+    "devops": [],
+    "prometheus": [],
+    "grafana": [],
+    # Practices and tools
+    "agile": ["scrum", "kanban"],
+    "jira": [],
+    "unit testing": ["unit tests", "pytest", "junit", "jest"],
+    "selenium": [],
+    "data structures": ["algorithms"],
+    "object oriented programming": ["oop", "oops", "object-oriented programming"],
+    "system design": [],
+    "distributed systems": [],
+    "figma": [],
+    "salesforce": [],
+    "sap": [],
+}
+
+# Everyday words that only mean a skill in context; they are matched through
+# their longer aliases (e.g. "golang", "spring boot") but never on their own.
+AMBIGUOUS_KEYWORDS = {
+    "r", "go", "rest", "spring", "express", "lambda", "torch", "rails",
+    "excel", "swift", "dart", "ts", "elt",
+}
+
+
+class AhoCorasick:
+    """ A small Aho-Corasick automaton that reports every keyword occurrence in one pass. """
+
+    def __init__(self, keywords: dict):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for keyword, value in keywords.items():
+            self._add(keyword, value)
+        self._build()
+
+    def _add(self, keyword: str, value):
+        state = 0
+        for char in keyword:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append((len(keyword), value))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def iter(self, text: str):
+        """ Yields (end_index, keyword_length, value) for every match. """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for length, value in output[state]:
+                    yield i, length, value
+
+
+def _build_automaton() -> AhoCorasick:
+    keywords = {}
+    for canonical, aliases in SKILL_VOCABULARY.items():
+        for keyword in [canonical, *aliases]:
+            if keyword not in AMBIGUOUS_KEYWORDS:
+                keywords[keyword.lower()] = canonical
+    return AhoCorasick(keywords)
+
+
+_AUTOMATON = _build_automaton()
+_ALIAS_TO_SKILL = {
+    alias.lower(): canonical
+    for canonical, aliases in SKILL_VOCABULARY.items()
+    for alias in [canonical, *aliases]
+}
+
+
+def _is_boundary(text: str, start: int, end: int) -> bool:
+    """
+    A match must not run into letters or digits on either side, nor start inside a
+    dotted name (the "js" of "node.js" is not javascript).
+    """
+    if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if text[start].isalnum() and start > 1 and text[start - 1] == "." and text[start - 2].isalnum():
+        return False
+    if text[end].isalnum() and end + 1 < len(text) and text[end + 1].isalnum():
+        return False
+    return True
+
+
+def extract_skills(text: str) -> list[str]:
+    """
+    Extracts canonical skill names from text with the dictionary automaton.
+    Deterministic, offline, and cheap enough to run on every job and resume.
+    """
+    if not text:
+        return []
+    text = text.lower()
+    found = set()
+    for end, length, skill in _AUTOMATON.iter(text):
+        if skill not in found and _is_boundary(text, end - length + 1, end):
+            found.add(skill)
+    return sorted(found)
+
+
+def normalize_skill(skill: str) -> str:
+    """ Maps a free-form skill (e.g. from Naukri's tagsAndSkills) to its canonical name. """
+    skill = skill.strip().lower()
+    return _ALIAS_TO_SKILL.get(skill, skill)
@@ -0,0 +1,66 @@
+# In jobspy/analysis/tokenizer.py
+
+import os
+import re
+from itertools import accumulate, islice
+
+# tiktoken gives exact counts for OpenAI models; without it we fall back to a
+# word/punctuation estimate that tracks the real tokenizer within ~10-15%.
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+TOKENIZER_ENCODING = os.environ.get("OPENAI_TOKENIZER_ENCODING", "o200k_base")
+
+_encoding = None
+if tiktoken is not None:
+    try:
+        _encoding = tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception as e:
+        print(f"Could not load tiktoken encoding '{TOKENIZER_ENCODING}', using estimates: {e}")
+
+# Long words are split into several tokens by BPE tokenizers, hence the 6-char cap.
+_ESTIMATE_PATTERN = re.compile(r"\w{1,6}|[^\w\s]")
+# The same tokens with their trailing whitespace, so offsets are running sums of lengths.
+_OFFSET_PATTERN = re.compile(r"(?:\w{1,6}|[^\w\s])\s*")
+
+
+def count_tokens(text: str) -> int:
+    """Counts the tokens a model will see for the given text."""
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return len(_ESTIMATE_PATTERN.findall(text))
+
+
+def token_offsets(text: str) -> list[int]:
+    """
+    The character offset each token of text starts at, so text can be cut on token
+    boundaries by slicing. A character whose bytes span two tokens starts the later one,
+    so slices never split a multibyte character.
+    """
+    if not text:
+        return []
+    if _encoding is not None:
+        return _encoding.decode_with_offsets(_encoding.encode(text, disallowed_special=()))[1]
+    leading = len(text) - len(text.lstrip())
+    lengths = map(len, _OFFSET_PATTERN.findall(text, leading))
+    return list(accumulate(lengths, initial=leading))[:-1]
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cuts text down to at most max_tokens tokens."""
+    if not text or max_tokens <= 0:
+        return ""
+    if _encoding is not None:
+        offsets = token_offsets(text)
+        if len(offsets) <= max_tokens:
+            return text
+        # Slice the original text rather than decoding a token prefix, which can end mid-character
+        return text[: offsets[max_tokens]]
+
+    # The first token past the budget marks where to cut.
+    overflow = next(islice(_ESTIMATE_PATTERN.finditer(text), max_tokens, None), None)
+    return text[: overflow.start()].rstrip() if overflow else text
@@ -0,0 +1,54 @@
+# In jobspy/analysis/vector_codec.py
+
+from typing import Optional
+
+import numpy as np
+from bson.binary import Binary
+
+# float16 halves storage with no measurable effect on cosine ranking;
+# int8 quarters it using one symmetric scale per vector.
+VECTOR_DTYPES = ("float32", "float16", "int8")
+
+
+def encode_vector(vector, dtype: str = "float16") -> Optional[dict]:
+    """
+    Packs an embedding into a compact BSON binary field.
+    :return: {"dtype", "dim", "scale", "data"} or None for a missing embedding
+    """
+    if vector is None:
+        return None
+    if dtype not in VECTOR_DTYPES:
+        raise ValueError(f"Unsupported vector dtype '{dtype}'. Use one of: {', '.join(VECTOR_DTYPES)}")
+
+    array = np.asarray(vector, dtype=np.float32)
+    scale = 1.0
+    if dtype == "int8":
+        max_abs = float(np.abs(array).max()) if array.size else 0.0
+        scale = max_abs / 127 if max_abs else 1.0
+        array = np.round(array / scale).astype(np.int8)
+    else:
+        array = array.astype(dtype)
+    return {"dtype": dtype, "dim": int(array.size), "scale": scale, "data": Binary(array.tobytes())}
+
+
+def decode_vector(encoded) -> Optional[np.ndarray]:
+    """
+    Turns a stored embedding back into a NumPy array. float32/float16 vectors are
+    read-only views over the BSON buffer; legacy list embeddings are accepted too.
+    """
+    if encoded is None:
+        return None
+    if isinstance(encoded, (list, tuple)):
+        return np.asarray(encoded, dtype=np.float32)
+    array = np.frombuffer(encoded["data"], dtype=encoded["dtype"])
+    if encoded["dtype"] == "int8":
+        return array.astype(np.float32) * encoded.get("scale", 1.0)
+    return array
+
+
+def decode_matrix(encoded_vectors: list) -> np.ndarray:
+    """ Stacks stored embeddings into one dense (n, dim) float32 matrix. """
+    vectors = [decode_vector(v) for v in encoded_vectors if v is not None]
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.vstack(vectors).astype(np.float32, copy=False)
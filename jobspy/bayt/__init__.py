@@ -11,9 +11,9 @@ from jobspy.model import (
     Site,
     JobPost,
     JobResponse,
-    Location,
     Country,
 )
+from jobspy.normalize import parse_location
 from jobspy.util import create_logger, create_session
 
 log = create_logger("Bayt")
@@ -124,11 +124,8 @@ class BaytScraper(Scraper):
         location = location_tag.get_text(strip=True) if location_tag else None
 
         job_id = f"bayt-{abs(hash(job_url))}"
-        location_obj = Location(
-            city=location,
-            country=Country.from_string(self.country),
-        )
-        return JobPost(
+        location_obj = parse_location(location, Country.from_string(self.country))
+        return self.create_job(
             id=job_id,
             title=job_title,
             company_name=company_name,
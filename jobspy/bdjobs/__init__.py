@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
@@ -16,7 +17,9 @@ from jobspy.bdjobs.util import (
     parse_location,
     parse_date,
     find_job_listings,
-    is_job_remote,
+    scan_job_card,
+    DESCRIPTION_CLASS_PATTERN,
+    REMOTE_KEYWORDS,
 )
 from jobspy.model import (
     JobPost,
@@ -29,7 +32,8 @@ from jobspy.model import (
     DescriptionFormat,
 )
 from jobspy.util import (
-    extract_emails_from_text,
+    analyze_description,
+    get_enum_from_job_type,
     create_session,
     create_logger,
     remove_attributes,
@@ -44,9 +48,12 @@ class BDJobs(Scraper):
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
     delay = 2
     band_delay = 3
+    # Detail pages load in the background on this many workers, each with a short timeout
+    num_workers = 5
+    detail_timeout = 15
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
@@ -71,7 +78,8 @@ class BDJobs(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        listings: list[dict] = []
+        detail_futures = []
         seen_ids = set()
         page = 1
         request_count = 0
@@ -80,68 +88,89 @@ class BDJobs(Scraper):
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
-
-        while continue_search():
-            request_count += 1
-            log.info(f"search page: {request_count}")
-
-            try:
-                # Add page parameter if needed
-                if page > 1:
-                    params["pg"] = page
-
-                response = self.session.get(
-                    self.search_url,
-                    params=params,
-                    timeout=getattr(scraper_input, "request_timeout", 60),
-                )
-
-                if response.status_code != 200:
-                    log.error(f"BDJobs response status code {response.status_code}")
-                    break
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                job_cards = find_job_listings(soup)
-
-                if not job_cards or len(job_cards) == 0:
-                    log.info("No more job listings found")
-                    break
-
-                log.info(f"Found {len(job_cards)} job cards on page {page}")
-
-                for job_card in job_cards:
-                    try:
-                        job_post = self._process_job(job_card)
-                        if job_post and job_post.id not in seen_ids:
-                            seen_ids.add(job_post.id)
-                            job_list.append(job_post)
-
-                            if not continue_search():
+        # Stage 1 scans the search pages; stage 2 fetches detail pages on the pool meanwhile
+        executor = (
+            ThreadPoolExecutor(max_workers=self.num_workers)
+            if scraper_input.bdjobs_fetch_description
+            else None
+        )
+        try:
+            while len(listings) < scraper_input.results_wanted:
+                request_count += 1
+                log.info(f"search page: {request_count}")
+
+                try:
+                    # Add page parameter if needed
+                    if page > 1:
+                        params["pg"] = page
+
+                    response = self.session.get(
+                        self.search_url,
+                        params=params,
+                        timeout=getattr(scraper_input, "request_timeout", 60),
+                    )
+
+                    if response.status_code != 200:
+                        log.error(f"BDJobs response status code {response.status_code}")
+                        break
+
+                    soup = BeautifulSoup(response.text, "html.parser")
+                    job_cards = find_job_listings(soup)
+
+                    if not job_cards or len(job_cards) == 0:
+                        log.info("No more job listings found")
+                        break
+
+                    log.info(f"Found {len(job_cards)} job cards on page {page}")
+
+                    for job_card in job_cards:
+                        listing = self._parse_job_card(job_card)
+                        if listing and listing["id"] not in seen_ids:
+                            seen_ids.add(listing["id"])
+                            listings.append(listing)
+                            if executor:
+                                detail_futures.append(
+                                    executor.submit(self._get_job_details, listing["job_url"])
+                                )
+                            if len(listings) >= scraper_input.results_wanted:
                                 break
-                    except Exception as e:
-                        log.error(f"Error processing job card: {str(e)}")
-
-                page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
-            except Exception as e:
-                log.error(f"Error during scraping: {str(e)}")
-                break
+                    page += 1
+                    # Add delay between requests
+                    if len(listings) < scraper_input.results_wanted:
+                        time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+                except Exception as e:
+                    log.error(f"Error during scraping: {str(e)}")
+                    break
 
-    def _process_job(self, job_card: Tag) -> Optional[JobPost]:
+            job_details = (
+                [future.result() for future in detail_futures]
+                if executor
+                else [{}] * len(listings)
+            )
+        finally:
+            if executor:
+                executor.shutdown()
+
+        job_list = []
+        for listing, details in zip(listings, job_details):
+            job_post = self._process_job(listing, details)
+            if job_post:
+                job_list.append(job_post)
+        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+
+    def _parse_job_card(self, job_card: Tag) -> Optional[Dict[str, Any]]:
         """
-        Processes a job card element into a JobPost object
+        Extracts the listing fields from a job card, without fetching anything
         :param job_card: Job card element
-        :return: JobPost object
+        :return: dict of listing fields, or None if the card has no job link
         """
         try:
+            elements = scan_job_card(job_card)
+
             # Extract job ID and URL
-            job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+            job_link = elements["link"]
             if not job_link:
                 return None
 
@@ -159,91 +188,64 @@ class BDJobs(Scraper):
             # Extract title
             title = job_link.get_text(strip=True)
             if not title:
-                title_elem = job_card.find(
-                    ["h2", "h3", "h4", "strong", "div"],
-                    class_=lambda c: c and "job-title-text" in c,
-                )
+                title_elem = elements["title"]
                 title = title_elem.get_text(strip=True) if title_elem else "N/A"
 
-            # Extract company name - IMPROVED
-            company_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "comp-name-text" in (c or "").lower(),
-            )
-            if company_elem:
-                company_name = company_elem.get_text(strip=True)
-            else:
-                # Try alternative selectors
-                company_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["company", "org", "comp-name"]
-                    ),
-                )
-                company_name = (
-                    company_elem.get_text(strip=True) if company_elem else "N/A"
-                )
+            company_elem = elements["company"]
+            company_name = company_elem.get_text(strip=True) if company_elem else "N/A"
 
-            # Extract location
-            location_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "locon-text-d" in (c or "").lower(),
-            )
-            if not location_elem:
-                location_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["location", "area", "locon"]
-                    ),
-                )
+            location_elem = elements["location"]
             location_text = (
                 location_elem.get_text(strip=True)
                 if location_elem
                 else "Dhaka, Bangladesh"
             )
 
-            # Create Location object
-            location = parse_location(location_text, self.country)
+            date_elem = elements["date"]
+            date_posted = parse_date(date_elem.get_text(strip=True)) if date_elem else None
 
-            # Extract date posted
-            date_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c
-                and any(
-                    term in (c or "").lower()
-                    for term in ["date", "deadline", "published"]
-                ),
+            return {
+                "id": job_id,
+                "title": title,
+                "company_name": company_name,
+                "location": parse_location(location_text, self.country),
+                "date_posted": date_posted,
+                "job_url": job_url,
+            }
+        except Exception as e:
+            log.error(f"Error processing job card: {str(e)}")
+            return None
+
+    def _process_job(self, listing: Dict[str, Any], job_details: Dict[str, Any]) -> Optional[JobPost]:
+        """
+        Builds the JobPost from a job card's listing fields and its detail page
+        :param listing: fields from _parse_job_card
+        :param job_details: fields from _get_job_details, empty if details weren't fetched
+        :return: JobPost object, or None if the job couldn't be built
+        """
+        try:
+            description = job_details.get("description") or None
+            job_type_text = job_details.get("job_type")
+            job_type = (
+                get_enum_from_job_type(job_type_text.lower().replace("-", "").replace(" ", ""))
+                if job_type_text
+                else None
             )
-            date_posted = None
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                date_posted = parse_date(date_text)
-
-            # Check if job is remote
-            is_remote = is_job_remote(title, location=location)
-
-            # Create job post object
-            job_post = JobPost(
-                id=job_id,
-                title=title,
-                company_name=company_name,  # Use company_name instead of company
-                location=location,
-                date_posted=date_posted,
-                job_url=job_url,
-                is_remote=is_remote,
-                site=self.site,
+            location = listing["location"]
+            analysis = analyze_description(
+                description,
+                listing["title"],
+                location.display_location() if location else None,
+                remote_keywords=REMOTE_KEYWORDS,
+            )
+            return self.create_job(
+                **listing,
+                description=description,
+                job_type=[job_type] if job_type else None,
+                company_industry=job_details.get("company_industry"),
+                is_remote=analysis.is_remote,
+                emails=analysis.emails,
             )
-
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
-
-            return job_post
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
@@ -255,7 +257,7 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
+            response = self.session.get(job_url, timeout=self.detail_timeout)
             if response.status_code != 200:
                 return {}
 
@@ -298,22 +300,20 @@ class BDJobs(Scraper):
             # If no description found yet, try the original approach
             if not description:
                 description_elem = soup.find(
-                    ["div", "section"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["job-description", "details", "requirements"]
-                    ),
+                    ["div", "section"], class_=DESCRIPTION_CLASS_PATTERN
                 )
                 if description_elem:
                     description_elem = remove_attributes(description_elem)
-                    description = description_elem.prettify(formatter="html")
                     if (
                         hasattr(self.scraper_input, "description_format")
                         and self.scraper_input.description_format
                         == DescriptionFormat.MARKDOWN
                     ):
-                        description = markdown_converter(description)
+                        description = markdown_converter(description_elem)
+                    elif self.scraper_input.description_format == DescriptionFormat.RAW:
+                        description = str(description_elem)
+                    else:
+                        description = description_elem.prettify(formatter="html")
 
             # Extract job type
             job_type_elem = soup.find(
@@ -29,4 +29,13 @@ date_formats = [
     "%d %B %Y",
     "%B %d, %Y",
     "%d/%m/%Y",
-]
\ No newline at end of file
+]
+
+# Class-name fragments that identify job card fields (case-insensitive).
+# Each field lists tiers, most specific first; compiled in util.py.
+card_field_classes = {
+    "company": [("comp-name-text",), ("company", "org", "comp-name")],
+    "location": [("locon-text-d",), ("location", "area", "locon")],
+    "date": [("date", "deadline", "published")],
+}
+description_classes = ("job-description", "details", "requirements")
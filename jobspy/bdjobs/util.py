@@ -1,9 +1,65 @@
 #util.py
+import re
+
 from bs4 import BeautifulSoup
+from bs4.element import Tag
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from jobspy.bdjobs.constant import card_field_classes, description_classes
 from jobspy.model import Location, Country
+from jobspy.normalize import parse_location as normalize_location
+from jobspy.util import REMOTE_KEYWORDS as _COMMON_REMOTE_KEYWORDS
+
+# BDJobs postings also advertise remote roles as "home based"
+REMOTE_KEYWORDS = _COMMON_REMOTE_KEYWORDS + ("home based",)
+
+
+def _class_pattern(terms) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+
+CARD_FIELD_PATTERNS = {
+    field: [_class_pattern(tier) for tier in tiers]
+    for field, tiers in card_field_classes.items()
+}
+DESCRIPTION_CLASS_PATTERN = _class_pattern(description_classes)
+_CARD_TAGS = ["a", "span", "div", "h2", "h3", "h4", "strong"]
+_TITLE_TAGS = {"h2", "h3", "h4", "strong", "div"}
+
+
+def scan_job_card(job_card: Tag) -> Dict[str, Optional[Tag]]:
+    """
+    Finds the link, title, company, location and date elements of a job card in a
+    single pass over its elements (first match in document order, most specific tier wins)
+    :param job_card: Job card element
+    :return: dict of field name to element (None when missing)
+    """
+    link = title = None
+    matches = {field: [None] * len(tiers) for field, tiers in CARD_FIELD_PATTERNS.items()}
+    for element in job_card.find_all(_CARD_TAGS):
+        if element.name == "a":
+            if link is None and "jobdetail" in (element.get("href") or "").lower():
+                link = element
+            continue
+        classes = element.get("class")
+        if not classes:
+            continue
+        class_text = " ".join(classes)
+        if title is None and element.name in _TITLE_TAGS and "job-title-text" in class_text:
+            title = element
+        if element.name not in ("span", "div"):
+            continue
+        for field, tiers in CARD_FIELD_PATTERNS.items():
+            found = matches[field]
+            for tier, pattern in enumerate(tiers):
+                if found[tier] is None and pattern.search(class_text):
+                    found[tier] = element
+    fields = {
+        field: next((element for element in found if element is not None), None)
+        for field, found in matches.items()
+    }
+    return {"link": link, "title": title, **fields}
 
 
 def parse_location(location_text: str, country: str = "bangladesh") -> Location:
@@ -13,20 +69,7 @@ def parse_location(location_text: str, country: str = "bangladesh") -> Location:
     :param country: Default country
     :return: Location object
     """
-    parts = location_text.split(",")
-    if len(parts) >= 2:
-        city = parts[0].strip()
-        state = parts[1].strip()
-        return Location(
-            city=city,
-            state=state,
-            country=Country.from_string(country)
-        )
-    else:
-        return Location(
-            city=location_text.strip(),
-            country=Country.from_string(country)
-        )
+    return normalize_location(location_text, Country.from_string(country))
 
 
 def parse_date(date_text: str) -> Optional[datetime]:
@@ -77,24 +120,3 @@ def find_job_listings(soup: BeautifulSoup) -> List[Any]:
         return [link.parent for link in job_links]
     
     return []
-
-
-def is_job_remote(title: str, description: str = None, location: Location = None) -> bool:
-    """
-    Determines if a job is remote based on title, description, and location
-    :param title: Job title
-    :param description: Job description
-    :param location: Job location
-    :return: True if job is remote, False otherwise
-    """
-    remote_keywords = ["remote", "work from home", "wfh", "home based"]
-    
-    # Combine all text fields
-    full_text = title.lower()
-    if description:
-        full_text += " " + description.lower()
-    if location:
-        full_text += " " + location.display_location().lower()
-    
-    # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
\ No newline at end of file
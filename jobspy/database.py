@@ -1,16 +1,21 @@
 import os
-import re
+import hashlib
 import numpy as np
-from datetime import datetime, date, time, timezone
-from pymongo import MongoClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pymongo import MongoClient, UpdateOne, DeleteMany
+from pymongo.errors import BulkWriteError
 import pandas as pd
 import openai
 import pymongo
 from typing import List, Dict, Optional 
 
 # --- New Imports ---
-from .analysis.resume_parser import parse_resume
-from .analysis.llm_analyser import extract_skills_with_llm
+from .analysis.resume_parser import parse_resume, parse_resumes
+from .analysis.llm_analyser import extract_skills_hybrid
+from .analysis.skill_extractor import extract_skills, normalize_skill
+from .analysis.chunker import chunk_text, chunk_texts
+from .analysis.vector_codec import encode_vector, decode_vector
 
 # --- CONFIGURATION ---
 MONGO_CONNECTION_STRING = os.environ.get("MONGO_URI")
@@ -18,6 +23,13 @@ if not MONGO_CONNECTION_STRING:
     raise ValueError("MONGO_URI environment variable not set. Please create a .env file.")
 MONGO_DATABASE_NAME = "job_database"
 EMBEDDING_MODEL = os.environ.get("OPENAI_EMBEDDING_DEPLOYMENT_NAME", "text-embedding-ada-002")
+RESUME_INGEST_WORKERS = int(os.environ.get("RESUME_INGEST_WORKERS", 8))
+RESUME_WRITE_BATCH_SIZE = 100
+# Job chunk embeddings live in their own collection as packed binary vectors.
+JOB_CHUNKS_COLLECTION = "job_chunks"
+EMBEDDING_STORAGE_DTYPE = os.environ.get("EMBEDDING_STORAGE_DTYPE", "float16")
+JOB_WRITE_BATCH_SIZE = int(os.environ.get("JOB_WRITE_BATCH_SIZE", 500))
+EMBEDDING_REQUEST_SIZE = 256
 
 # --- INITIALIZATION ---
 if "AZURE_OPENAI_ENDPOINT" not in os.environ or "OPENAI_API_KEY" not in os.environ:
@@ -54,6 +66,33 @@ def get_embedding(text: str, model: str = EMBEDDING_MODEL) -> Optional[list[floa
         print(f"Error generating embedding: {e}")
         return None
 
+def get_embeddings(texts: list[str], model: str = EMBEDDING_MODEL) -> list[Optional[list[float]]]:
+    """
+    Generates embeddings for several texts, EMBEDDING_REQUEST_SIZE inputs per Azure OpenAI request.
+    Texts in a failed request (and empty texts) get None.
+    """
+    results = [None] * len(texts)
+    indexed = [(i, text) for i, text in enumerate(texts) if text]
+    for start in range(0, len(indexed), EMBEDDING_REQUEST_SIZE):
+        batch = indexed[start:start + EMBEDDING_REQUEST_SIZE]
+        try:
+            response = embedding_client.embeddings.create(
+                input=[text for _, text in batch], model=model, dimensions=384
+            )
+            for (i, _), item in zip(batch, sorted(response.data, key=lambda d: d.index)):
+                results[i] = item.embedding
+        except Exception as e:
+            print(f"Error generating batch embeddings: {e}")
+    return results
+
+def file_sha256(file_path: str) -> str:
+    """ Hashes a file's contents so unchanged resumes can be skipped on re-ingest. """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
 def create_indexes(collection_name: str):
     """ Creates indexes on a specified collection. """
     print(f"Ensuring indexes exist on '{collection_name}' collection...")
@@ -62,6 +101,7 @@ def create_indexes(collection_name: str):
         collection.create_index([("metadata.company", pymongo.ASCENDING)])
         collection.create_index([("metadata.location", pymongo.ASCENDING)])
         collection.create_index([("metadata.date_posted", pymongo.DESCENDING)])
+        collection.create_index([("metadata.extracted_skills", pymongo.ASCENDING)])
         print(f"Indexes are in place for '{collection_name}'.")
     except Exception as e:
         print(f"An error occurred during index creation for '{collection_name}': {e}")
@@ -77,42 +117,31 @@ def create_resume_indexes(collection_name: str):
     except Exception as e:
         print(f"An error occurred during resume index creation: {e}")
 
+def create_chunk_indexes(collection_name: str):
+    """ Creates indexes on the job chunks collection for per-job vector reads. """
+    print(f"Ensuring indexes exist on '{collection_name}' collection...")
+    try:
+        collection = db[collection_name]
+        collection.create_index([("job_id", pymongo.ASCENDING), ("chunk_index", pymongo.ASCENDING)])
+        collection.create_index([("source_collection", pymongo.ASCENDING)])
+        print(f"Indexes are in place for '{collection_name}'.")
+    except Exception as e:
+        print(f"An error occurred during chunk index creation: {e}")
+
 def setup_database():
     """ Ensures all necessary collections and their indexes are ready. """
     print("Setting up database collections and indexes...")
     create_indexes("private_jobs")
     create_indexes("govt_jobs")
     create_resume_indexes("resumes")
+    create_chunk_indexes(JOB_CHUNKS_COLLECTION)
     print("Database setup complete.")
 
 setup_database()
 
 def custom_semantic_chunker(text: str) -> list[str]:
-    """ A rule-based chunker that splits job descriptions by common section headers. """
-    if not text:
-        return []
-    headers = [
-        "responsibilities", "requirements", "qualifications", "duties",
-        "experience", "skills", "about the role", "about you", "your role",
-        "what you'll do", "what you will do", "what you'll need", "nice to have", "preferred qualifications"
-    ]
-    
-    pattern = r'\n\s*(' + '|'.join(re.escape(h) for h in headers) + r')\s*[:\-]*\s*\n'
-    chunks = re.split(pattern, text, flags=re.IGNORECASE)
-    
-    reconstructed_chunks = []
-    current_chunk_content = [chunks[0].strip()]
-    for i in range(1, len(chunks), 2):
-        header = chunks[i]
-        text_after = chunks[i+1]
-        if current_chunk_content[0]:
-            reconstructed_chunks.append(current_chunk_content[0])
-        current_chunk_content = [(header + ":\n" + text_after).strip()]
-    if current_chunk_content[0]:
-        reconstructed_chunks.append(current_chunk_content[0])
-    if len(reconstructed_chunks) <= 1 and text:
-         reconstructed_chunks = [p.strip() for p in text.split('\n\n') if p.strip()]
-    return [chunk for chunk in reconstructed_chunks if chunk]
+    """ Splits job descriptions by common section headers into token-bounded chunks. """
+    return chunk_text(text)
 
 def get_average_embedding(chunks: list) -> Optional[list[float]]:
     """ Averages the embedding vectors from a list of chunks. """
@@ -126,43 +155,68 @@ def get_average_embedding(chunks: list) -> Optional[list[float]]:
     avg_embedding = np.mean(embeddings, axis=0)
     return avg_embedding.tolist()
 
-def process_and_store_resume(file_path: str, candidate_name: str, candidate_id: str):
+def build_resume_document(
+    file_path: str,
+    candidate_name: str,
+    candidate_id: str,
+    file_hash: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    truncated: bool = False,
+) -> Optional[dict]:
     """
-    Parses a resume, extracts skills, creates chunks and embeddings using Azure OpenAI,
-    and stores it in the 'resumes' collection.
+    Parses a resume (unless raw_text is given), extracts skills and embeds its chunks in batched requests.
+    Returns the document for the 'resumes' collection, or None if parsing failed.
+    The file hash is only stored for a complete document: if raw_text was truncated (cut short by
+    the parse time limit), no skills were extracted or a chunk has no embedding, the document is
+    stored without it, so the next ingestion processes the file again instead of skipping it as unchanged.
     """
-    print(f"Processing resume for: {candidate_name}")
-    
-    raw_text = parse_resume(file_path)
+    if raw_text is None:
+        raw_text = parse_resume(file_path)
     if not raw_text:
-        print("Failed to parse resume text.")
-        return
+        print(f"Failed to parse resume text for {candidate_name}.")
+        return None
+
+    skills = extract_skills_hybrid(raw_text)
+    print(f"Extracted skills for {candidate_name}: {skills}")
 
-    print("Extracting skills with Azure OpenAI...")
-    skills = extract_skills_with_llm(raw_text)
-    print(f"Extracted skills: {skills}")
-    
     chunks_text = custom_semantic_chunker(raw_text)
     chunks_data = [
-        {"chunk_text": text, "embedding": get_embedding(text)}
-        for text in chunks_text
+        {"chunk_text": text, "embedding": embedding}
+        for text, embedding in zip(chunks_text, get_embeddings(chunks_text))
     ]
-    
-    average_embedding = get_average_embedding(chunks_data)
-    
-    resume_document = {
+    complete = (
+        not truncated
+        and bool(skills)
+        and all(chunk["embedding"] is not None for chunk in chunks_data)
+    )
+    if not complete:
+        print(f"Resume for {candidate_name} is incomplete; it will be processed again on the next run.")
+
+    return {
         "_id": candidate_id,
         "processed_timestamp": datetime.now(timezone.utc),
         "metadata": {
             "name": candidate_name,
             "source_file": file_path,
+            "file_hash": (file_hash or file_sha256(file_path)) if complete else None,
             "extracted_skills": skills
         },
         "full_text_raw": raw_text,
         "chunks": chunks_data,
-        "average_embedding": average_embedding
+        "average_embedding": get_average_embedding(chunks_data)
     }
 
+def process_and_store_resume(file_path: str, candidate_name: str, candidate_id: str):
+    """
+    Parses a resume, extracts skills, creates chunks and embeddings using Azure OpenAI,
+    and stores it in the 'resumes' collection.
+    """
+    print(f"Processing resume for: {candidate_name}")
+
+    resume_document = build_resume_document(file_path, candidate_name, candidate_id)
+    if not resume_document:
+        return
+
     collection = db["resumes"]
     try:
         collection.update_one({'_id': resume_document['_id']}, {'$set': resume_document}, upsert=True)
@@ -170,9 +224,208 @@ def process_and_store_resume(file_path: str, candidate_name: str, candidate_id:
     except Exception as e:
         print(f"An error occurred storing the resume: {e}")
 
+def process_and_store_resumes(resumes: dict, max_workers: int = RESUME_INGEST_WORKERS, force: bool = False) -> dict:
+    """
+    Batch-ingests resumes given as {candidate_id: {"name": ..., "file": ...}}.
+    Files whose content hash matches the stored document are skipped unless force is set.
+    Resumes are parsed on a process pool and streamed into skill extraction and embedding,
+    which run concurrently on up to max_workers resumes; finished documents are upserted in batches.
+    :return: counts of processed, skipped and failed resumes
+    """
+    summary = {"processed": 0, "skipped": 0, "failed": 0}
+    collection = db["resumes"]
+
+    file_hashes = {}
+    for candidate_id, info in resumes.items():
+        if not os.path.exists(info["file"]):
+            print(f"Warning: Resume file not found at {info['file']}. Skipping.")
+            summary["failed"] += 1
+            continue
+        file_hashes[candidate_id] = file_sha256(info["file"])
+
+    stored_hashes = {}
+    if not force and file_hashes:
+        cursor = collection.find({"_id": {"$in": list(file_hashes)}}, {"metadata.file_hash": 1})
+        stored_hashes = {doc["_id"]: doc.get("metadata", {}).get("file_hash") for doc in cursor}
+
+    pending = {cid: h for cid, h in file_hashes.items() if stored_hashes.get(cid) != h}
+    summary["skipped"] = len(file_hashes) - len(pending)
+    print(f"Resumes to process: {len(pending)} (unchanged, skipped: {summary['skipped']})")
+
+    def flush(operations: list):
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            print(f"Stored {result.upserted_count + result.modified_count} resumes.")
+        except Exception as e:
+            print(f"An error occurred storing a resume batch: {e}")
+
+    operations = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_id = {}
+        for cid, raw_text, timed_out in parse_resumes({cid: resumes[cid]["file"] for cid in pending}):
+            future = executor.submit(
+                build_resume_document, resumes[cid]["file"], resumes[cid]["name"], cid, pending[cid], raw_text, timed_out
+            )
+            future_to_id[future] = cid
+        for future in as_completed(future_to_id):
+            candidate_id = future_to_id[future]
+            try:
+                resume_document = future.result()
+            except Exception as e:
+                print(f"An error occurred processing resume '{candidate_id}': {e}")
+                resume_document = None
+            if not resume_document:
+                summary["failed"] += 1
+                continue
+            summary["processed"] += 1
+            operations.append(UpdateOne({'_id': candidate_id}, {'$set': resume_document}, upsert=True))
+            if len(operations) >= RESUME_WRITE_BATCH_SIZE:
+                flush(operations)
+                operations = []
+    if operations:
+        flush(operations)
+
+    print(f"Resume ingestion summary: {summary}")
+    return summary
+
+def load_job_chunks(job_id: str) -> list[dict]:
+    """
+    Reads a job's chunks from the chunks collection, in order, with embeddings
+    decoded to NumPy arrays.
+    """
+    cursor = db[JOB_CHUNKS_COLLECTION].find(
+        {"job_id": job_id}, {"chunk_text": 1, "embedding": 1}
+    ).sort("chunk_index", pymongo.ASCENDING)
+    return [
+        {"chunk_text": doc["chunk_text"], "embedding": decode_vector(doc.get("embedding"))}
+        for doc in cursor
+    ]
+
+def _chunk_operations(job_id: str, collection_name: str, chunks_data: list) -> list:
+    """ Upserts a job's chunk documents and drops chunks left over from a longer previous version. """
+    operations = [
+        UpdateOne(
+            {"_id": f"{job_id}:{i}"},
+            {"$set": {
+                "job_id": job_id,
+                "source_collection": collection_name,
+                "chunk_index": i,
+                "chunk_text": chunk["chunk_text"],
+                "embedding": encode_vector(chunk["embedding"], EMBEDDING_STORAGE_DTYPE),
+            }},
+            upsert=True,
+        )
+        for i, chunk in enumerate(chunks_data)
+    ]
+    operations.append(DeleteMany({"job_id": job_id, "chunk_index": {"$gte": len(chunks_data)}}))
+    return operations
+
+def _job_skills(metadata: dict, description: str) -> list[str]:
+    """ Dictionary-extracted skills for a job, merged with any structured skills the site provides. """
+    skills = set(extract_skills(f"{metadata.get('title') or ''}\n{description}"))
+    if metadata.get('skills'):
+        skills.update(normalize_skill(s) for s in metadata['skills'].split(',') if s.strip())
+    return sorted(skills)
+
+JOB_DATE_COLUMNS = ['date_posted', 'expiry_date']
+
+def _job_records(jobs_df: pd.DataFrame) -> list[dict]:
+    """
+    Converts a jobs DataFrame into Mongo-ready metadata dicts column-wise:
+    date columns become datetimes and missing values become None.
+    """
+    frame = jobs_df.copy()
+    for column in JOB_DATE_COLUMNS:
+        if column not in frame:
+            continue
+        original = frame[column]
+        try:
+            converted = pd.Series(
+                pd.to_datetime(original, errors='coerce').dt.to_pydatetime(), index=original.index, dtype=object
+            )
+        except (TypeError, ValueError):
+            continue
+        # Values that don't parse as dates (free-text like "30+ days ago") are kept as scraped.
+        frame[column] = converted.where(converted.notna(), original)
+    frame = frame.astype(object)
+    return frame.where(frame.notna(), None).to_dict('records')
+
+def _build_job_batch(jobs_df: pd.DataFrame, collection_name: str) -> tuple[list, list]:
+    """
+    Builds job documents and chunk write operations for one batch of jobs.
+    All chunks in the batch are embedded together in a few large requests.
+    """
+    job_documents = []
+    batch_chunks = []
+    records = _job_records(jobs_df)
+    descriptions = [metadata.pop('description', None) or '' for metadata in records]
+    # One call for the whole batch; postings repeated across sites are only chunked once
+    batch_chunks_text = chunk_texts(descriptions)
+    for index, metadata, full_description, chunks_text in zip(
+        jobs_df.index, records, descriptions, batch_chunks_text
+    ):
+        metadata['extracted_skills'] = _job_skills(metadata, full_description)
+
+        job_id = metadata.get('id') or metadata.get('job_url') or index
+        unique_id = f"{metadata.get('site', 'unknown')}_{job_id}"
+
+        job_documents.append({
+            "_id": unique_id,
+            "source_site": metadata.get('site'),
+            "scraped_timestamp": datetime.now(timezone.utc),
+            "metadata": metadata,
+            "full_description_raw": full_description,
+            "chunk_count": len(chunks_text)
+        })
+        batch_chunks.append((unique_id, chunks_text))
+
+    texts = [text for _, chunks_text in batch_chunks for text in chunks_text]
+    embeddings = get_embeddings(texts)
+
+    chunk_operations = []
+    position = 0
+    for unique_id, chunks_text in batch_chunks:
+        chunks_data = [
+            {"chunk_text": text, "embedding": embedding}
+            for text, embedding in zip(chunks_text, embeddings[position:position + len(chunks_text)])
+        ]
+        position += len(chunks_text)
+        chunk_operations.extend(_chunk_operations(unique_id, collection_name, chunks_data))
+    return job_documents, chunk_operations
+
+def _write_job_batch(collection_name: str, job_documents: list, chunk_operations: list) -> dict:
+    """ Writes one batch of jobs and their chunks with unordered bulk writes. """
+    summary = {"jobs": len(job_documents), "matched": 0, "modified": 0, "upserted": 0, "errors": []}
+    # Older documents kept embeddings inline under "chunks"; drop them on upsert.
+    job_operations = [
+        UpdateOne({'_id': doc['_id']}, {'$set': doc, '$unset': {'chunks': ""}}, upsert=True)
+        for doc in job_documents
+    ]
+    for target, operations in ((collection_name, job_operations), (JOB_CHUNKS_COLLECTION, chunk_operations)):
+        if not operations:
+            continue
+        try:
+            result = db[target].bulk_write(operations, ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+            summary["errors"].extend(
+                f"{target}: {err.get('errmsg')}" for err in details.get("writeErrors", [])
+            )
+        except Exception as e:
+            summary["errors"].append(f"{target}: {e}")
+            continue
+        if target == collection_name:
+            summary["matched"] += details.get("nMatched", 0)
+            summary["modified"] += details.get("nModified", 0)
+            summary["upserted"] += details.get("nUpserted", 0)
+    return summary
+
 def process_and_store_jobs(jobs_df: pd.DataFrame, collection_name: str, clear_collection: bool = False):
     """
     Processes jobs, generates embeddings using Azure OpenAI, and stores them in a specified MongoDB collection.
+    Jobs are embedded and written in batches of JOB_WRITE_BATCH_SIZE; each batch is written while the next
+    one is being embedded, so memory stays bounded and a failed batch doesn't discard the others.
     """
     if jobs_df.empty:
         print(f"Received an empty DataFrame. No jobs to process for '{collection_name}'.")
@@ -185,50 +438,41 @@ def process_and_store_jobs(jobs_df: pd.DataFrame, collection_name: str, clear_co
         try:
             delete_result = collection.delete_many({})
             print(f"Deleted {delete_result.deleted_count} documents.")
+            db[JOB_CHUNKS_COLLECTION].delete_many({"source_collection": collection_name})
         except Exception as e:
             print(f"An error occurred while clearing the collection: {e}")
             return
 
-    print(f"Processing {len(jobs_df)} jobs for '{collection_name}' collection...")
-    
-    jobs_to_insert = []
-    for index, job in jobs_df.iterrows():
-        metadata = job.to_dict()
-        for date_field in ['date_posted', 'expiry_date']:
-            if isinstance(metadata.get(date_field), date) and not isinstance(metadata.get(date_field), datetime):
-                metadata[date_field] = datetime.combine(metadata[date_field], time.min)
-
-        full_description = metadata.pop('description', '') or ''
-        metadata = {k: (None if pd.isna(v) else v) for k, v in metadata.items()}
-
-        chunks_text = custom_semantic_chunker(full_description)
-        chunks_data = [
-            {"chunk_text": text, "embedding": get_embedding(text)}
-            for text in chunks_text
-        ]
-
-        job_id = metadata.get('id') or metadata.get('job_url') or index
-        unique_id = f"{metadata.get('site', 'unknown')}_{job_id}"
-
-        job_document = {
-            "_id": unique_id,
-            "source_site": metadata.get('site'),
-            "scraped_timestamp": datetime.now(timezone.utc),
-            "metadata": metadata,
-            "full_description_raw": full_description,
-            "chunks": chunks_data
-        }
-        
-        jobs_to_insert.append(job_document)
+    total_batches = -(-len(jobs_df) // JOB_WRITE_BATCH_SIZE)
+    print(f"Processing {len(jobs_df)} jobs for '{collection_name}' collection in {total_batches} batches...")
 
-    if jobs_to_insert:
-        print(f"Inserting {len(jobs_to_insert)} new jobs into '{collection_name}'...")
+    def report(batch_number: int, future):
         try:
-            from pymongo import UpdateOne
-            bulk_operations = [UpdateOne({'_id': doc['_id']}, {'$set': doc}, upsert=True) for doc in jobs_to_insert]
-            result = collection.bulk_write(bulk_operations)
-            print(f"MongoDB bulk write summary for '{collection_name}': Matched={result.matched_count}, Modified={result.modified_count}, Upserted={result.upserted_count}")
+            summary = future.result()
         except Exception as e:
-            print(f"An error occurred during MongoDB bulk insert for '{collection_name}': {e}")
-            import traceback
-            traceback.print_exc()
\ No newline at end of file
+            print(f"Batch {batch_number}/{total_batches} for '{collection_name}' failed: {e}")
+            return
+        print(
+            f"Batch {batch_number}/{total_batches} for '{collection_name}': Jobs={summary['jobs']}, "
+            f"Matched={summary['matched']}, Modified={summary['modified']}, Upserted={summary['upserted']}, "
+            f"Errors={len(summary['errors'])}"
+        )
+        for error in summary["errors"][:5]:
+            print(f"  {error}")
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending = None
+        for batch_number, start in enumerate(range(0, len(jobs_df), JOB_WRITE_BATCH_SIZE), start=1):
+            try:
+                job_documents, chunk_operations = _build_job_batch(
+                    jobs_df.iloc[start:start + JOB_WRITE_BATCH_SIZE], collection_name
+                )
+            except Exception as e:
+                print(f"Batch {batch_number}/{total_batches} for '{collection_name}' could not be built: {e}")
+                continue
+            # Wait for the previous write before queueing this one, so at most two batches are held.
+            if pending:
+                report(*pending)
+            pending = (batch_number, writer.submit(_write_job_batch, collection_name, job_documents, chunk_operations))
+        if pending:
+            report(*pending)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+
+from jobspy.util import desired_order, render_description
+
+# pyarrow is only needed for output="arrow" / output="parquet".
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+PARQUET_PARTITION_COLS = ["site", "date_posted"]
+
+# Columns that aren't strings; everything else in desired_order is a string column.
+_TYPED_COLUMNS = {
+    "date_posted": "date32",
+    "min_amount": "float64",
+    "max_amount": "float64",
+    "is_remote": "bool_",
+    "company_rating": "float64",
+    "company_reviews_count": "int64",
+    "vacancy_count": "int64",
+    "description_raw": "binary",
+}
+
+# Low-cardinality columns that repeat a handful of values across many rows.
+CATEGORICAL_COLUMNS = [
+    "site",
+    "company",
+    "job_type",
+    "interval",
+    "currency",
+    "salary_source",
+    "listing_type",
+    "job_level",
+    "work_from_home_type",
+]
+NULLABLE_DTYPES = {
+    "min_amount": "Float64",
+    "max_amount": "Float64",
+    "company_rating": "Float64",
+    "company_reviews_count": "Int64",
+    "vacancy_count": "Int64",
+    "is_remote": "boolean",
+}
+
+
+def compact_job_dtypes(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stores repetitive string columns as category and numeric columns as nullable
+    Float64/Int64 instead of object, which cuts memory and speeds up groupby/filtering
+    """
+    jobs_df = jobs_df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in jobs_df:
+            jobs_df[column] = jobs_df[column].astype("category")
+    for column, dtype in NULLABLE_DTYPES.items():
+        if column in jobs_df:
+            values = jobs_df[column]
+            if dtype != "boolean":
+                values = pd.to_numeric(values, errors="coerce")
+                if dtype == "Int64":
+                    values = values.round()
+            jobs_df[column] = values.astype(dtype)
+    return jobs_df
+
+
+def materialize_descriptions(jobs_df: pd.DataFrame, description_format: str | None = None) -> pd.DataFrame:
+    """
+    Fills the description column of a lazy_descriptions result from description_raw
+    :param description_format: markdown, plain or html; defaults to the format passed to scrape_jobs
+    """
+    if "description_raw" not in jobs_df:
+        return jobs_df
+    description_format = description_format or jobs_df.attrs.get("description_format", "markdown")
+    jobs_df = jobs_df.copy()
+    jobs_df["description"] = [
+        render_description(raw, description_format) for raw in jobs_df["description_raw"]
+    ]
+    return jobs_df
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for output='arrow' and output='parquet'. Install it with `pip install pyarrow`."
+        )
+
+
+def job_schema() -> "pa.Schema":
+    """
+    The Arrow schema of a scrape_jobs result, one field per column in desired_order
+    """
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field(column, getattr(pa, _TYPED_COLUMNS.get(column, "string"))())
+            for column in desired_order
+        ]
+    )
+
+
+def _is_null(value) -> bool:
+    """ None, NaN, NaT or pd.NA """
+    return value is None or pd.api.types.is_scalar(value) and pd.isna(value)
+
+
+def _to_date(value) -> date | None:
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _to_number(value, cast):
+    if value is None or value != value:  # None or NaN
+        return None
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_arrow_table(rows: list[dict], include_raw_description: bool = False) -> "pa.Table":
+    """
+    Builds a typed Arrow table from scraped job rows without going through an object-dtype DataFrame
+    :param rows: job dicts as assembled by scrape_jobs
+    :param include_raw_description: add the compressed description_raw column (lazy descriptions)
+    :return: pyarrow.Table with job_schema()
+    """
+    schema = job_schema()
+    if include_raw_description:
+        schema = schema.append(pa.field("description_raw", pa.binary()))
+    columns = {}
+    for field in schema:
+        # Treat NaN/NaT/NA as null up front, so bool() and str() don't turn them into True and "nan"
+        values = [None if _is_null(v) else v for v in (row.get(field.name) for row in rows)]
+        kind = _TYPED_COLUMNS.get(field.name, "string")
+        if kind == "date32":
+            values = [_to_date(v) for v in values]
+        elif kind == "float64":
+            values = [_to_number(v, float) for v in values]
+        elif kind == "int64":
+            values = [_to_number(v, int) for v in values]
+        elif kind == "binary":
+            pass
+        elif kind == "bool_":
+            values = [None if v is None else bool(v) for v in values]
+        else:
+            values = [None if v is None else str(v) for v in values]
+        columns[field.name] = pa.array(values, type=field.type)
+    return pa.Table.from_pydict(columns, schema=schema)
+
+
+def write_parquet(
+    table: "pa.Table",
+    output_path: str | Path,
+    partition_cols: list[str] | None = None,
+) -> str:
+    """
+    Writes jobs as a hive-partitioned Parquet dataset (site=.../date_posted=...)
+    :return: the dataset root path
+    """
+    _require_pyarrow()
+    if not output_path:
+        raise ValueError("output_path is required when output='parquet'")
+    pq.write_to_dataset(
+        table,
+        root_path=str(output_path),
+        partition_cols=partition_cols or PARQUET_PARTITION_COLS,
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return str(output_path)
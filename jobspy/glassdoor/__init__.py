@@ -14,7 +14,7 @@ from jobspy.glassdoor.util import (
     parse_location,
 )
 from jobspy.util import (
-    extract_emails_from_text,
+    analyze_description,
     create_logger,
     create_session,
     markdown_converter,
@@ -184,7 +184,8 @@ class Glassdoor(Scraper):
         if location_type == "S":
             is_remote = True
         else:
-            location = parse_location(location_name)
+            # Glassdoor searches one country's domain, so that is every job's country
+            location = parse_location(location_name, self.scraper_input.country)
 
         compensation = parse_compensation(job["header"])
         try:
@@ -201,7 +202,7 @@ class Glassdoor(Scraper):
             .get("adOrderSponsorshipLevel", "")
             .lower()
         )
-        return JobPost(
+        return self.create_job(
             id=f"gd-{job_id}",
             title=title,
             company_url=company_url if company_id else None,
@@ -212,7 +213,7 @@ class Glassdoor(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=analyze_description(description).emails,
             company_logo=company_logo,
             listing_type=listing_type,
         )
@@ -1,4 +1,5 @@
-from jobspy.model import Compensation, CompensationInterval, Location, JobType
+from jobspy.model import Compensation, CompensationInterval, Country, Location, JobType
+from jobspy.normalize import job_type_from_string, parse_location as normalize_location
 
 
 def parse_compensation(data: dict) -> Compensation | None:
@@ -24,16 +25,14 @@ def parse_compensation(data: dict) -> Compensation | None:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
+    job_type = job_type_from_string(job_type_str)
+    return [job_type] if job_type else None
 
 
-def parse_location(location_name: str) -> Location | None:
+def parse_location(location_name: str, country: Country | None = None) -> Location | None:
     if not location_name or location_name == "Remote":
         return
-    city, _, state = location_name.partition(", ")
-    return Location(city=city, state=state)
+    return normalize_location(location_name, country)
 
 
 def get_cursor_for_page(pagination_cursors, page_num):
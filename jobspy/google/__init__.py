@@ -2,22 +2,35 @@ from __future__ import annotations
 
 import math
 import re
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 from datetime import datetime, timedelta
 
-from jobspy.google.constant import headers_jobs, headers_initial, async_param
+from jobspy.google.constant import (
+    headers_jobs,
+    headers_initial,
+    async_param,
+    job_type_mapping,
+    fan_out_hours,
+)
 from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
     JobPost,
     JobResponse,
-    Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
-from jobspy.google.util import log, find_job_info_initial_page, find_job_info
+from jobspy.normalize import parse_location
+from jobspy.util import analyze_description, create_session
+from jobspy.google.util import (
+    log,
+    find_job_info_initial_page,
+    find_job_info,
+    decode_async_page,
+    get_async_cursor,
+)
 
 
 class Google(Scraper):
@@ -35,6 +48,8 @@ class Google(Scraper):
         self.scraper_input = None
         self.jobs_per_page = 10
         self.seen_urls = set()
+        self.seen_lock = threading.Lock()
+        self.num_workers = 8
         self.url = "https://www.google.com/search"
         self.jobs_url = "https://www.google.com/async/callback:550"
 
@@ -50,32 +65,15 @@ class Google(Scraper):
         self.session = create_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
-        if forward_cursor is None:
-            log.warning(
-                "initial cursor not found, try changing your query or there was at most 10 results"
-            )
-            return JobResponse(jobs=job_list)
-
-        page = 1
-
-        while (
-            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
-            and forward_cursor
-        ):
-            log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
-            )
-            try:
-                jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
-            except Exception as e:
-                log.error(f"failed to get jobs on page: {page}, {e}")
-                break
-            if not jobs:
-                log.info(f"found no jobs on page: {page}")
-                break
-            job_list += jobs
-            page += 1
+        queries = self._build_queries()
+        if len(queries) == 1:
+            job_list = self._scrape_query(queries[0])
+        else:
+            log.info(f"fanning out over {len(queries)} queries")
+            with ThreadPoolExecutor(max_workers=min(len(queries), self.num_workers)) as executor:
+                query_results = list(executor.map(self._scrape_query, queries))
+            # _parse_job already dropped urls seen by another query
+            job_list = [job for jobs in query_results for job in jobs]
         return JobResponse(
             jobs=job_list[
                 scraper_input.offset : scraper_input.offset
@@ -83,8 +81,73 @@ class Google(Scraper):
             ]
         )
 
-    def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
-        """Gets initial cursor and jobs to paginate through job listings"""
+    def _scrape_query(self, query: str) -> list[JobPost]:
+        """
+        Follows one query's cursor chain. The next page is fetched in the background
+        while the current one is parsed.
+        :param query: Google search query
+        :return: jobs found
+        """
+        forward_cursor, job_list = self._get_initial_cursor_and_jobs(query)
+        if forward_cursor is None:
+            log.warning(
+                "initial cursor not found, try changing your query or there was at most 10 results"
+            )
+            return job_list
+
+        target = self.scraper_input.results_wanted + self.scraper_input.offset
+        page = 1
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            pending = (
+                prefetch.submit(self._get_next_page, forward_cursor)
+                if len(self.seen_urls) < target
+                else None
+            )
+            while pending is not None:
+                log.info(
+                    f"search page: {page} / {math.ceil(self.scraper_input.results_wanted / self.jobs_per_page)}"
+                )
+                try:
+                    page_text = pending.result()
+                    pending = None
+                    forward_cursor = get_async_cursor(page_text)
+                    # Only prefetch when this page can't finish the search on its own
+                    if forward_cursor and len(self.seen_urls) + self.jobs_per_page < target:
+                        pending = prefetch.submit(self._get_next_page, forward_cursor)
+                    jobs, _ = self._parse_jobs(page_text)
+                except Exception as e:
+                    log.error(f"failed to get jobs on page: {page}, {e}")
+                    break
+                if not jobs:
+                    log.info(f"found no jobs on page: {page}")
+                    break
+                job_list += jobs
+                page += 1
+                if pending is None and forward_cursor and len(self.seen_urls) < target:
+                    pending = prefetch.submit(self._get_next_page, forward_cursor)
+        return job_list
+
+    def _build_queries(self) -> list[str]:
+        """
+        The search query, plus job type and time range variants of it when google_fan_out is set
+        """
+        queries = [self._build_query(self.scraper_input.job_type, self.scraper_input.hours_old)]
+        if self.scraper_input.google_fan_out:
+            if not self.scraper_input.job_type:
+                queries += [
+                    self._build_query(job_type, self.scraper_input.hours_old)
+                    for job_type in job_type_mapping
+                ]
+            if not self.scraper_input.hours_old:
+                queries += [
+                    self._build_query(self.scraper_input.job_type, hours_old)
+                    for hours_old in fan_out_hours
+                ]
+        # A google_search_term ignores the other filters, so its variants collapse to one query
+        return list(dict.fromkeys(queries))
+
+    def _build_query(self, job_type: JobType | None, hours_old: int | None) -> str:
+        """Assembles the Google search query from the search term and filters"""
         query = f"{self.scraper_input.search_term} jobs"
 
         def get_time_range(hours_old):
@@ -97,21 +160,14 @@ class Google(Scraper):
             else:
                 return "in the last month"
 
-        job_type_mapping = {
-            JobType.FULL_TIME: "Full time",
-            JobType.PART_TIME: "Part time",
-            JobType.INTERNSHIP: "Internship",
-            JobType.CONTRACT: "Contract",
-        }
-
-        if self.scraper_input.job_type in job_type_mapping:
-            query += f" {job_type_mapping[self.scraper_input.job_type]}"
+        if job_type in job_type_mapping:
+            query += f" {job_type_mapping[job_type]}"
 
         if self.scraper_input.location:
             query += f" near {self.scraper_input.location}"
 
-        if self.scraper_input.hours_old:
-            time_filter = get_time_range(self.scraper_input.hours_old)
+        if hours_old:
+            time_filter = get_time_range(hours_old)
             query += f" {time_filter}"
 
         if self.scraper_input.is_remote:
@@ -119,7 +175,10 @@ class Google(Scraper):
 
         if self.scraper_input.google_search_term:
             query = self.scraper_input.google_search_term
+        return query
 
+    def _get_initial_cursor_and_jobs(self, query: str) -> Tuple[str, list[JobPost]]:
+        """Gets initial cursor and jobs to paginate through job listings"""
         params = {"q": query, "udm": "8"}
         response = self.session.get(self.url, headers=headers_initial, params=params)
 
@@ -134,31 +193,25 @@ class Google(Scraper):
                 jobs.append(job_post)
         return data_async_fc, jobs
 
-    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
+    def _get_next_page(self, forward_cursor: str) -> str:
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
         response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
-        return self._parse_jobs(response.text)
+        return response.text
 
     def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
         """
         Parses jobs on a page with next page cursor
         """
-        start_idx = job_data.find("[[[")
-        end_idx = job_data.rindex("]]]") + 3
-        s = job_data[start_idx:end_idx]
-        parsed = json.loads(s)[0]
-
-        pattern_fc = r'data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, job_data)
-        data_async_fc = match_fc.group(1) if match_fc else None
+        parsed = decode_async_page(job_data)
+        data_async_fc = get_async_cursor(job_data)
         jobs_on_page = []
         for array in parsed:
-            _, job_data = array
-            if not job_data.startswith("[[["):
+            _, blob = array
+            if not blob.startswith("[[["):
+                continue
+            job_info = find_job_info(blob)
+            if not job_info:
                 continue
-            job_d = json.loads(job_data)
-
-            job_info = find_job_info(job_d)
             job_post = self._parse_job(job_info)
             if job_post:
                 jobs_on_page.append(job_post)
@@ -166,16 +219,15 @@ class Google(Scraper):
 
     def _parse_job(self, job_info: list):
         job_url = job_info[3][0][0] if job_info[3] and job_info[3][0] else None
-        if job_url in self.seen_urls:
-            return
-        self.seen_urls.add(job_url)
+        with self.seen_lock:
+            if job_url in self.seen_urls:
+                return
+            self.seen_urls.add(job_url)
 
         title = job_info[0]
         company_name = job_info[1]
-        location = city = job_info[2]
-        state = country = date_posted = None
-        if location and "," in location:
-            city, state, *country = [*map(lambda x: x.strip(), location.split(","))]
+        location = parse_location(job_info[2])
+        date_posted = None
 
         days_ago_str = job_info[12]
         if type(days_ago_str) == str:
@@ -184,19 +236,18 @@ class Google(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        analysis = analyze_description(description)
 
-        job_post = JobPost(
+        job_post = self.create_job(
             id=f"go-{job_info[28]}",
             title=title,
             company_name=company_name,
-            location=Location(
-                city=city, state=state, country=country[0] if country else None
-            ),
+            location=location,
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote=analysis.is_remote,
             description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            emails=analysis.emails,
+            job_type=analysis.job_type,
         )
         return job_post
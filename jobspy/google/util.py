@@ -1,41 +1,89 @@
+import json
 import re
 
+from jobspy.exception import GoogleJobsException
 from jobspy.util import create_logger
 
 log = create_logger("Google")
 
+# Job listings live under this key in both the initial page and the async blobs
+JOB_INFO_KEY = "520084652"
+_JOB_INFO_MARKER = f'"{JOB_INFO_KEY}":'
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_ASYNC_CURSOR_PATTERN = re.compile(r'data-async-fc="([^"]+)"')
 
-def find_job_info(jobs_data: list | dict) -> list | None:
-    """Iterates through the JSON data to find the job listings"""
-    if isinstance(jobs_data, dict):
-        for key, value in jobs_data.items():
-            if key == "520084652" and isinstance(value, list):
-                return value
-            else:
-                result = find_job_info(value)
-                if result:
-                    return result
-    elif isinstance(jobs_data, list):
-        for item in jobs_data:
-            result = find_job_info(item)
-            if result:
-                return result
+
+def _context(text: str, pos: int, width: int = 60) -> str:
+    """Snippet around pos for error messages"""
+    return f"offset {pos} of {len(text)}: {text[max(0, pos - width):pos + width]!r}"
+
+
+def _iter_job_info(text: str):
+    """
+    Scans text once for the job info key and decodes only the array that follows each occurrence.
+    Yields (position, job_info) pairs, or (position, JSONDecodeError) when an array is malformed.
+    """
+    pos = text.find(_JOB_INFO_MARKER)
+    while pos != -1:
+        start = pos + len(_JOB_INFO_MARKER)
+        while start < len(text) and text[start] in _WHITESPACE:
+            start += 1
+        end = start
+        if text.startswith("[", start):
+            try:
+                value, end = _decoder.raw_decode(text, start)
+                yield pos, value
+            except json.JSONDecodeError as e:
+                yield pos, e
+        pos = text.find(_JOB_INFO_MARKER, max(end, start))
+
+
+def find_job_info(blob: str) -> list | None:
+    """
+    Extracts the job listing from one async blob without decoding the rest of it
+    :raises GoogleJobsException: if the listing is malformed
+    """
+    for pos, job_info in _iter_job_info(blob):
+        if isinstance(job_info, json.JSONDecodeError):
+            raise GoogleJobsException(
+                f"malformed job info ({job_info.msg}) at {_context(blob, job_info.pos)}"
+            )
+        return job_info
     return None
 
 
-def find_job_info_initial_page(html_text: str):
-    pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
+def find_job_info_initial_page(html_text: str) -> list[list]:
+    """
+    Extracts every job listing embedded in the initial search page. Malformed listings are logged and skipped.
+    """
     results = []
-    matches = re.finditer(pattern, html_text)
+    for pos, job_info in _iter_job_info(html_text):
+        if isinstance(job_info, json.JSONDecodeError):
+            log.error(
+                f"Failed to parse job info ({job_info.msg}) at {_context(html_text, job_info.pos)}"
+            )
+            continue
+        results.append(job_info)
+    return results
 
-    import json
 
-    for match in matches:
-        try:
-            parsed_data = json.loads(match.group(1))
-            results.append(parsed_data)
+def decode_async_page(text: str) -> list:
+    """
+    Decodes the wrapper of an async jobs page into its [id, blob] pairs
+    :raises GoogleJobsException: if the page has no job payload
+    """
+    start = text.find("[[[")
+    if start == -1:
+        raise GoogleJobsException(f"no job payload in async page ({len(text)} chars): {text[:120]!r}")
+    try:
+        payload, _ = _decoder.raw_decode(text, start)
+    except json.JSONDecodeError as e:
+        raise GoogleJobsException(f"malformed async page ({e.msg}) at {_context(text, e.pos)}")
+    return payload[0]
 
-        except json.JSONDecodeError as e:
-            log.error(f"Failed to parse match: {str(e)}")
-            results.append({"raw_match": match.group(0), "error": str(e)})
-    return results
+
+def get_async_cursor(text: str) -> str | None:
+    """Finds the cursor for the next async jobs page"""
+    match = _ASYNC_CURSOR_PATTERN.search(text)
+    return match.group(1) if match else None
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Tuple
 
-from jobspy.indeed.constant import job_search_query, api_headers
-from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
+from jobspy.indeed.constant import (
+    job_search_queries,
+    api_headers,
+    job_type_keys,
+    remote_key,
+    date_shard_hours,
+)
+from jobspy.indeed.util import get_compensation, get_job_type
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -13,11 +21,10 @@ from jobspy.model import (
     JobPost,
     Location,
     JobResponse,
-    JobType,
     DescriptionFormat,
 )
 from jobspy.util import (
-    extract_emails_from_text,
+    analyze_description,
     markdown_converter,
     create_session,
     create_logger,
@@ -42,6 +49,7 @@ class Indeed(Scraper):
         self.jobs_per_page = 100
         self.num_workers = 10
         self.seen_urls = set()
+        self.seen_lock = threading.Lock()
         self.headers = None
         self.api_country_code = None
         self.base_url = None
@@ -58,43 +66,92 @@ class Indeed(Scraper):
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
+
+        shards = self._build_shards()
+        if len(shards) == 1:
+            job_list = self._scrape_shard(shards[0])
+        else:
+            log.info(f"searching {len(shards)} shards by {scraper_input.indeed_shard_by}")
+            with ThreadPoolExecutor(max_workers=min(len(shards), self.num_workers)) as executor:
+                shard_results = list(executor.map(self._scrape_shard, shards))
+            # _process_job drops repeats across shards, so concatenating is a clean merge. offset and
+            # results_wanted apply to this merged list in shard order; a posting matching several
+            # shards lands in whichever fetched it first.
+            job_list = [job for jobs in shard_results for job in jobs]
+        return JobResponse(
+            jobs=job_list[
+                scraper_input.offset : scraper_input.offset
+                + scraper_input.results_wanted
+            ]
+        )
+
+    def _build_shards(self) -> list[dict]:
+        """
+        Splits the search into sub-queries that can paginate concurrently and together cover the
+        unfiltered search. A shard is a dict of filter overrides: {"job_type": JobType},
+        {"date": (start, end)} with start/end in hours ago (None for open-ended), or {} for the
+        unfiltered query.
+        :return: list of shards, [{}] when not sharding
+        """
+        shard_by = self.scraper_input.indeed_shard_by
+        if shard_by == "job_type" and not self.scraper_input.job_type:
+            if self.scraper_input.hours_old or self.scraper_input.easy_apply:
+                log.warning("job_type shards can't be combined with hours_old or easy_apply, not sharding")
+                return [{}]
+            # The job type filters miss postings with no (or another) job type, so the unfiltered
+            # query runs as a last shard to pick those up; its repeats are dropped by _process_job
+            return [{"job_type": job_type} for job_type in job_type_keys] + [{}]
+        if shard_by == "date":
+            if self.scraper_input.job_type or self.scraper_input.is_remote or self.scraper_input.easy_apply:
+                log.warning("date shards can't be combined with job_type, is_remote or easy_apply, not sharding")
+                return [{}]
+            hours_old = self.scraper_input.hours_old
+            bounds = [hours for hours in date_shard_hours if not hours_old or hours < hours_old]
+            bounds = [None, *bounds, hours_old]
+            return [{"date": (start, end)} for end, start in zip(bounds, bounds[1:])]
+        return [{}]
+
+    def _scrape_shard(self, shard: dict) -> list[JobPost]:
+        """
+        Follows one query's cursor chain until enough jobs are collected or it runs out
+        :param shard: filter overrides from _build_shards
+        :return: jobs found
+        """
         job_list = []
         page = 1
-
         cursor = None
-
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        target = self.scraper_input.results_wanted + self.scraper_input.offset
+        while len(self.seen_urls) < target:
             log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                f"search page: {page} / {math.ceil(self.scraper_input.results_wanted / self.jobs_per_page)}"
+                + (f" ({shard})" if shard else "")
             )
-            jobs, cursor = self._scrape_page(cursor)
+            jobs, cursor = self._scrape_page(cursor, shard)
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
             job_list += jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
+            if not cursor:
+                break
+        return job_list
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _scrape_page(self, cursor: str | None, shard: dict | None = None) -> Tuple[list[JobPost], str | None]:
         """
         Scrapes a page of Indeed for jobs with scraper_input criteria
         :param cursor:
+        :param shard: filter overrides from _build_shards
         :return: jobs found on page, next page cursor
         """
         jobs = []
         new_cursor = None
-        filters = self._build_filters()
+        filters = self._build_filters(shard)
         search_term = (
             self.scraper_input.search_term.replace('"', '\\"')
             if self.scraper_input.search_term
             else ""
         )
-        query = job_search_query.format(
+        query = job_search_queries[self.scraper_input.indeed_query_profile].format(
             what=(f'what: "{search_term}"' if search_term else ""),
             location=(
                 f'location: {{where: "{self.scraper_input.location}", radius: {self.scraper_input.distance}, radiusUnit: MILES}}'
@@ -134,13 +191,29 @@ class Indeed(Scraper):
 
         return job_list, new_cursor
 
-    def _build_filters(self):
+    def _build_filters(self, shard: dict | None = None):
         """
         Builds the filters dict for job type/is_remote. If hours_old is provided, composite filter for job_type/is_remote is not possible.
         IndeedApply: filters: { keyword: { field: "indeedApplyScope", keys: ["DESKTOP"] } }
+        :param shard: filter overrides from _build_shards
         """
+        shard = shard or {}
+        job_type = shard.get("job_type") or self.scraper_input.job_type
         filters_str = ""
-        if self.scraper_input.hours_old:
+        if "date" in shard:
+            start, end = shard["date"]
+            date_range = ", ".join(
+                [f'start: "{start}h"'] * bool(start) + [f'end: "{end}h"'] * bool(end)
+            )
+            filters_str = f"""
+            filters: {{
+                date: {{
+                  field: "dateOnIndeed",
+                  {date_range}
+                }}
+            }}
+            """
+        elif self.scraper_input.hours_old:
             filters_str = """
             filters: {{
                 date: {{
@@ -160,21 +233,13 @@ class Indeed(Scraper):
                 }
             }
             """
-        elif self.scraper_input.job_type or self.scraper_input.is_remote:
-            job_type_key_mapping = {
-                JobType.FULL_TIME: "CF3CP",
-                JobType.PART_TIME: "75GKK",
-                JobType.CONTRACT: "NJXCK",
-                JobType.INTERNSHIP: "VDTG7",
-            }
-
+        elif job_type or self.scraper_input.is_remote:
             keys = []
-            if self.scraper_input.job_type:
-                key = job_type_key_mapping[self.scraper_input.job_type]
-                keys.append(key)
+            if job_type:
+                keys.append(job_type_keys[job_type])
 
             if self.scraper_input.is_remote:
-                keys.append("DSQF7")
+                keys.append(remote_key)
 
             if keys:
                 keys_str = '", "'.join(keys)
@@ -199,25 +264,33 @@ class Indeed(Scraper):
         :return: JobPost if it's a new job
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
-        if job_url in self.seen_urls:
-            return
-        self.seen_urls.add(job_url)
-        description = job["description"]["html"]
+        with self.seen_lock:
+            if job_url in self.seen_urls:
+                return
+            self.seen_urls.add(job_url)
+        # Fields outside the requested query profile are simply absent
+        description = (job.get("description") or {}).get("html")
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
 
-        job_type = get_job_type(job["attributes"])
+        attributes = job.get("attributes") or []
+        job_type = get_job_type(attributes)
+        analysis = analyze_description(
+            description,
+            job["location"]["formatted"]["long"],
+            *(attr["label"] for attr in attributes),
+        )
         timestamp_seconds = job["datePublished"] / 1000
         date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
-        employer = job["employer"].get("dossier") if job["employer"] else None
+        employer = job["employer"].get("dossier") if job.get("employer") else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
-        rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
+        rel_url = job["employer"]["relativeCompanyPageUrl"] if job.get("employer") else None
+        return self.create_job(
             id=f'in-{job["key"]}',
             title=job["title"],
             description=description,
             company_name=job["employer"].get("name") if job.get("employer") else None,
-            company_url=(f"{self.base_url}{rel_url}" if job["employer"] else None),
+            company_url=(f"{self.base_url}{rel_url}" if rel_url else None),
             company_url_direct=(
                 employer["links"]["corporateWebsite"] if employer else None
             ),
@@ -227,14 +300,16 @@ class Indeed(Scraper):
                 country=job.get("location", {}).get("countryCode"),
             ),
             job_type=job_type,
-            compensation=get_compensation(job["compensation"]),
+            compensation=(
+                get_compensation(job["compensation"]) if job.get("compensation") else None
+            ),
             date_posted=date_posted,
             job_url=job_url,
             job_url_direct=(
                 job["recruit"].get("viewJobUrl") if job.get("recruit") else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
-            is_remote=is_job_remote(job, description),
+            emails=analysis.emails,
+            is_remote=analysis.is_remote,
             company_addresses=(
                 employer_details["addresses"][0]
                 if employer_details.get("addresses")
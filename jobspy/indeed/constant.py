@@ -1,4 +1,8 @@
-job_search_query = """
+from jobspy.model import JobType
+
+# The jobSearch query is assembled from field groups so a search can ask for less.
+# Braces are doubled because the query is later .format()-ed with the search params.
+_job_search_head = """
     query GetJobData {{
         jobSearch(
         {what}
@@ -14,16 +18,21 @@ job_search_query = """
         results {{
             trackingKey
             job {{
-            source {{
+"""
+_job_search_tail = """            }}
+        }}
+        }}
+    }}
+    """
+
+# id, title, dates and location
+_listing_fields = """            source {{
                 name
             }}
             key
             title
             datePublished
             dateOnIndeed
-            description {{
-                html
-            }}
             location {{
                 countryName
                 countryCode
@@ -36,6 +45,16 @@ job_search_query = """
                 long
                 }}
             }}
+"""
+_employer_name_fields = """            employer {{
+                relativeCompanyPageUrl
+                name
+            }}
+"""
+# description HTML, salary, job type attributes and apply url
+_detail_fields = """            description {{
+                html
+            }}
             compensation {{
                 estimated {{
                 currencyCode
@@ -64,7 +83,13 @@ job_search_query = """
                 key
                 label
             }}
-            employer {{
+            recruit {{
+                viewJobUrl
+                detailedSalary
+                workSchedule
+            }}
+"""
+_employer_dossier_fields = """            employer {{
                 relativeCompanyPageUrl
                 name
                 dossier {{
@@ -86,16 +111,14 @@ job_search_query = """
                 }}
                 }}
             }}
-            recruit {{
-                viewJobUrl
-                detailedSalary
-                workSchedule
-            }}
-            }}
-        }}
-        }}
-    }}
-    """
+"""
+
+job_search_queries = {
+    "minimal": _job_search_head + _listing_fields + _employer_name_fields + _job_search_tail,
+    "standard": _job_search_head + _listing_fields + _detail_fields + _employer_name_fields + _job_search_tail,
+    "full": _job_search_head + _listing_fields + _detail_fields + _employer_dossier_fields + _job_search_tail,
+}
+job_search_query = job_search_queries["full"]
 
 api_headers = {
     "Host": "apis.indeed.com",
@@ -107,3 +130,15 @@ api_headers = {
     "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 Indeed App 193.1",
     "indeed-app-info": "appv=193.1; appid=com.indeed.jobsearch; osv=16.6.1; os=ios; dtype=phone",
 }
+
+# Indeed "attributes" filter keys
+job_type_keys = {
+    JobType.FULL_TIME: "CF3CP",
+    JobType.PART_TIME: "75GKK",
+    JobType.CONTRACT: "NJXCK",
+    JobType.INTERNSHIP: "VDTG7",
+}
+remote_key = "DSQF7"
+
+# Boundaries (hours ago) of the dateOnIndeed windows used when sharding by date
+date_shard_hours = (24, 72, 168, 336, 720)
@@ -14,7 +14,6 @@ from bs4.element import Tag
 from jobspy.exception import LinkedInException
 from jobspy.linkedin.constant import headers
 from jobspy.linkedin.util import (
-    is_job_remote,
     job_type_code,
     parse_job_type,
     parse_job_level,
@@ -31,8 +30,9 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
+from jobspy.normalize import parse_location
 from jobspy.util import (
-    extract_emails_from_text,
+    analyze_description,
     currency_parser,
     markdown_converter,
     plain_converter,
@@ -220,15 +220,15 @@ class LinkedIn(Scraper):
         if full_descr:
             job_details = self._get_job_details(job_id)
             description = job_details.get("description")
-        is_remote = is_job_remote(title, description, location)
+        analysis = analyze_description(description, title, location.display_location())
 
-        return JobPost(
+        return self.create_job(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
             company_url=company_url,
             location=location,
-            is_remote=is_remote,
+            is_remote=analysis.is_remote,
             date_posted=date_posted,
             job_url=f"{self.base_url}/jobs/view/{job_id}",
             compensation=compensation,
@@ -237,7 +237,7 @@ class LinkedIn(Scraper):
             company_industry=job_details.get("company_industry"),
             description=job_details.get("description"),
             job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(description),
+            emails=analysis.emails,
             company_logo=job_details.get("company_logo"),
             job_function=job_details.get("job_function"),
         )
@@ -265,11 +265,15 @@ class LinkedIn(Scraper):
         description = None
         if div_content is not None:
             div_content = remove_attributes(div_content)
-            description = div_content.prettify(formatter="html")
+            # Convert the parsed tree directly; only HTML output needs serializing
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
+                description = markdown_converter(div_content)
             elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
-                description = plain_converter(description)
+                description = plain_converter(div_content)
+            elif self.scraper_input.description_format == DescriptionFormat.RAW:
+                description = str(div_content)
+            else:
+                description = div_content.prettify(formatter="html")
         h3_tag = soup.find(
             "h3", string=lambda text: text and "Job function" in text.strip()
         )
@@ -303,25 +307,12 @@ class LinkedIn(Scraper):
         :param metadata_card
         :return: location
         """
-        location = Location(country=Country.from_string(self.country))
-        if metadata_card is not None:
-            location_tag = metadata_card.find(
-                "span", class_="job-search-card__location"
-            )
-            location_string = location_tag.text.strip() if location_tag else "N/A"
-            parts = location_string.split(", ")
-            if len(parts) == 2:
-                city, state = parts
-                location = Location(
-                    city=city,
-                    state=state,
-                    country=Country.from_string(self.country),
-                )
-            elif len(parts) == 3:
-                city, state, country = parts
-                country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
-        return location
+        country = Country.from_string(self.country)
+        if metadata_card is None:
+            return Location(country=country)
+        location_tag = metadata_card.find("span", class_="job-search-card__location")
+        location_string = location_tag.text.strip() if location_tag else None
+        return parse_location(location_string, country)
 
     def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
         """
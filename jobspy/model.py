@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import field, make_dataclass
+from typing import Literal, Optional
 from datetime import date
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, InstanceOf
 
 
 class JobType(Enum):
@@ -23,11 +24,9 @@ class JobType(Enum):
         "دوامكامل",
         "kokopäivätyö",
         "tempsplein",
-        "vollzeit",
         "πλήρηςαπασχόληση",
         "teljesmunkaidő",
         "tempopieno",
-        "tempsplein",
         "heltid",
         "jornadacompleta",
         "pełnyetat",
@@ -167,11 +166,12 @@ class Country(Enum):
     @classmethod
     def from_string(cls, country_str: str):
         """Convert a string to the corresponding Country enum."""
+        from jobspy.normalize import country_from_string
+
+        country = country_from_string(country_str)
+        if country is not None:
+            return country
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
         valid_countries = [country.value for country in cls]
         raise ValueError(
             f"Invalid country string: '{country_str}'. Valid countries are: {', '.join([country[0] for country in valid_countries])}"
@@ -179,6 +179,9 @@ class Country(Enum):
 
 
 class Location(BaseModel):
+    # Frozen: parse_location hands the same memoized instance to every caller
+    model_config = ConfigDict(frozen=True)
+
     country: Country | str | None = None
     city: Optional[str] = None
     state: Optional[str] = None
@@ -235,6 +238,7 @@ class DescriptionFormat(Enum):
     MARKDOWN = "markdown"
     HTML = "html"
     PLAIN = "plain"
+    RAW = "raw"  # source HTML as scraped, no conversion
 
 class JobPost(BaseModel):
     id: str | None = None
@@ -280,8 +284,22 @@ class JobPost(BaseModel):
     vacancy_count: int | None = None  #from vacancy
     work_from_home_type: str | None = None  #from clusters.wfhType (e.g., "Hybrid", "Remote")
 
+
+# Unvalidated, slotted stand-in for JobPost used when scraping with validate=False.
+# Generated from JobPost's fields so the two can't drift; every field defaults to
+# None and values are stored exactly as the scraper passes them.
+JobRecord = make_dataclass(
+    "JobRecord",
+    [(name, info.annotation, field(default=None)) for name, info in JobPost.model_fields.items()],
+    namespace={"__module__": __name__},
+    slots=True,
+)
+JOB_FIELDS = tuple(JobPost.model_fields)
+
+
 class JobResponse(BaseModel):
-    jobs: list[JobPost] = []
+    # JobRecords are only isinstance-checked, never re-validated
+    jobs: list[JobPost | InstanceOf[JobRecord]] = []
 
 
 class Site(Enum):
@@ -315,12 +333,24 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    ziprecruiter_fetch_description: bool = True
+    naukri_concurrent_pages: bool = False
+    naukri_fetch_description: bool = False
+    bdjobs_fetch_description: bool = True
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     request_timeout: int = 60
 
     results_wanted: int = 15
     hours_old: int | None = None
+    # Split the Indeed search into concurrently paginated sub-queries
+    indeed_shard_by: Literal["job_type", "date"] | None = None
+    # Which job fields the Indeed GraphQL query asks for
+    indeed_query_profile: Literal["minimal", "standard", "full"] = "full"
+    # Run job type / time range variants of the Google query concurrently
+    google_fan_out: bool = False
+    # False builds JobRecords instead of validated JobPosts
+    validate_jobs: bool = True
 
 
 class Scraper(ABC):
@@ -332,5 +362,15 @@ class Scraper(ABC):
         self.ca_cert = ca_cert
         self.user_agent = user_agent
 
+    def create_job(self, **job_fields) -> JobPost | JobRecord:
+        """
+        Builds a validated JobPost, or a JobRecord when the scrape runs with validate_jobs=False
+        """
+        scraper_input = getattr(self, "scraper_input", None)
+        if scraper_input is None or scraper_input.validate_jobs:
+            return JobPost(**job_fields)
+        # pydantic ignores unknown fields; keep the fast path equally forgiving
+        return JobRecord(**{k: v for k, v in job_fields.items() if k in JOB_FIELDS})
+
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
@@ -3,16 +3,16 @@ from __future__ import annotations
 import math
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Optional
 
 import regex as re
-import requests
+from bs4 import BeautifulSoup
 
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
-    is_job_remote,
     parse_job_type,
     parse_company_industry,
 )
@@ -27,9 +27,10 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
+from jobspy.normalize import parse_location
 from jobspy.util import (
-    extract_emails_from_text,
-    currency_parser,
+    RateLimiter,
+    analyze_description,
     markdown_converter,
     create_session,
     create_logger,
@@ -39,9 +40,15 @@ log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
+    detail_url = "https://www.naukri.com/jobapi/v4/job"
     delay = 3
     band_delay = 4
     jobs_per_page = 20  
+    max_pages = 50  # Arbitrary limit
+    # Concurrent page and detail fetches: workers share these limiters instead of sleeping
+    num_workers = 4
+    page_rate_limiter = RateLimiter(requests_per_second=1)
+    detail_rate_limiter = RateLimiter(requests_per_second=8)
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -74,83 +81,152 @@ class Naukri(Scraper):
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
-        request_count = 0
-        seconds_old = (
-            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
-        )
 
-        while continue_search():
-            request_count += 1
-            log.info(
-                f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
-                f"for search term: {scraper_input.search_term}"
-            )
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400  # Convert to days
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
-                if response.status_code not in range(200, 400):
-                    err = f"Naukri API response status code {response.status_code} - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-                data = response.json()
+        if scraper_input.naukri_concurrent_pages:
+            self._scrape_pages_concurrently(page, job_list, seen_ids)
+        else:
+            request_count = 0
+            while len(job_list) < scraper_input.results_wanted and page <= self.max_pages:
+                request_count += 1
+                log.info(
+                    f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
+                    f"for search term: {scraper_input.search_term}"
+                )
+                data = self._fetch_page(page)
+                if data is None:
+                    break
                 job_details = data.get("jobDetails", [])
-                log.info(f"Received {len(job_details)} job entries from API")
                 if not job_details:
                     log.warning("No job details found in API response")
                     break
-            except Exception as e:
-                log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
-
-            for job in job_details:
-                job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
-
-                try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
-                    job_post = self._process_job(job, job_id, fetch_desc)
-                    if job_post:
-                        job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
-                    if not continue_search():
-                        break
-                except Exception as e:
-                    log.error(f"Error processing job ID {job_id}: {str(e)}")
-                    raise NaukriException(str(e))
-
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                self._add_jobs(job_details, job_list, seen_ids)
+
+                if len(job_list) < scraper_input.results_wanted and page < self.max_pages:
+                    time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
         job_list = job_list[:scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
         return JobResponse(jobs=job_list)
 
+    def _scrape_pages_concurrently(self, first_page: int, job_list: list, seen_ids: set):
+        """
+        Fetches the first page, reads the total result count from it and fetches the
+        remaining pages in parallel under page_rate_limiter. Jobs are added in page order.
+        """
+        data = self._fetch_page(first_page)
+        if not data or not data.get("jobDetails"):
+            log.warning("No job details found in API response")
+            return
+        pages_wanted = math.ceil(self.scraper_input.results_wanted / self.jobs_per_page)
+        last_page = min(first_page + pages_wanted - 1, self.max_pages)
+        total = data.get("noOfJobs")
+        if total:
+            # noOfJobs counts the whole query, not what's left after the offset
+            last_page = min(last_page, math.ceil(total / self.jobs_per_page))
+        log.info(f"{total} jobs found, fetching pages {first_page}-{last_page}")
+
+        self._add_jobs(data["jobDetails"], job_list, seen_ids)
+        remaining_pages = range(first_page + 1, last_page + 1)
+        if remaining_pages and len(job_list) < self.scraper_input.results_wanted:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                # map yields in page order, so the output doesn't depend on response timing
+                for page_data in executor.map(self._fetch_page, remaining_pages):
+                    if page_data:
+                        self._add_jobs(page_data.get("jobDetails", []), job_list, seen_ids)
+
+    def _fetch_page(self, page: int) -> dict | None:
+        """
+        Requests one page of search results
+        :return: the API response, or None if the request failed
+        """
+        scraper_input = self.scraper_input
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        params = {
+            "noOfResults": self.jobs_per_page,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": scraper_input.search_term,
+            "pageNo": page,
+            "k": scraper_input.search_term,
+            "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": scraper_input.location,
+            "remote": "true" if scraper_input.is_remote else None,
+        }
+        if seconds_old:
+            params["days"] = seconds_old // 86400  # Convert to days
+
+        params = {k: v for k, v in params.items() if v is not None}
+        try:
+            self.page_rate_limiter.wait(self.base_url)
+            log.debug(f"Sending request to {self.base_url} with params: {params}")
+            response = self.session.get(self.base_url, params=params, timeout=10)
+            if response.status_code not in range(200, 400):
+                err = f"Naukri API response status code {response.status_code} - {response.text}"
+                log.error(err)
+                return None
+            data = response.json()
+            log.info(f"Received {len(data.get('jobDetails', []))} job entries from API (page {page})")
+            return data
+        except Exception as e:
+            log.error(f"Naukri API request failed: {str(e)}")
+            return None
+
+    def _add_jobs(self, job_details: list[dict], job_list: list, seen_ids: set):
+        """
+        Processes a page of API results into job_list, skipping jobIds already seen
+        """
+        new_jobs = []
+        for job in job_details:
+            job_id = job.get("jobId")
+            if not job_id or job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            new_jobs.append((job_id, job))
+        new_jobs = new_jobs[: self.scraper_input.results_wanted - len(job_list)]
+
+        descriptions = {}
+        if self.scraper_input.naukri_fetch_description and new_jobs:
+            job_ids = [job_id for job_id, _ in new_jobs]
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                descriptions = dict(zip(job_ids, executor.map(self._fetch_description, job_ids)))
+
+        for job_id, job in new_jobs:
+            log.debug(f"Processing job ID: {job_id}")
+            try:
+                raw_description = None
+                if self.scraper_input.naukri_fetch_description:
+                    # Fall back to the search result's snippet if the detail call failed
+                    raw_description = descriptions.get(job_id) or job.get("jobDescription")
+                job_post = self._process_job(job, job_id, raw_description)
+                if job_post:
+                    job_list.append(job_post)
+                    log.info(f"Added job: {job_post.title} (ID: {job_id})")
+            except Exception as e:
+                log.error(f"Error processing job ID {job_id}: {str(e)}")
+                raise NaukriException(str(e))
+
+    def _fetch_description(self, job_id: str) -> str | None:
+        """
+        Gets the full description HTML from the job detail API
+        """
+        try:
+            self.detail_rate_limiter.wait(self.detail_url)
+            response = self.session.get(f"{self.detail_url}/{job_id}", timeout=10)
+            if response.status_code not in range(200, 400):
+                log.debug(f"Naukri detail response status code {response.status_code} for job ID {job_id}")
+                return None
+            return (response.json().get("jobDetails") or {}).get("description")
+        except Exception as e:
+            log.debug(f"Naukri detail request failed for job ID {job_id}: {str(e)}")
+            return None
+
     def _process_job(
-        self, job: dict, job_id: str, full_descr: bool
+        self, job: dict, job_id: str, raw_description: str | None
     ) -> Optional[JobPost]:
         """
         Processes a single job from API response into a JobPost object
@@ -164,16 +240,18 @@ class Naukri(Scraper):
         date_posted = self._parse_date(job.get("footerPlaceholderLabel"), job.get("createdDate"))
 
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
-        raw_description = job.get("jobDescription") if full_descr else None
-
-        job_type = parse_job_type(raw_description) if raw_description else None
-        company_industry = parse_company_industry(raw_description) if raw_description else None
 
         description = raw_description
-        if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+        job_type = company_industry = None
+        if raw_description:
+            # One parse shared by the job type, industry and markdown extractors
+            soup = BeautifulSoup(raw_description, "html.parser")
+            job_type = parse_job_type(soup)
+            company_industry = parse_company_industry(soup)
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                description = markdown_converter(soup, source=raw_description)
 
-        is_remote = is_job_remote(title, description or "", location)
+        analysis = analyze_description(description, title, location.display_location())
         company_logo = job.get("logoPathV3") or job.get("logoPath")
 
         # Naukri-specific fields
@@ -185,20 +263,20 @@ class Naukri(Scraper):
         vacancy_count = job.get("vacancy")
         work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
 
-        job_post = JobPost(
+        job_post = self.create_job(
             id=f"nk-{job_id}",
             title=title,
             company_name=company,
             company_url=company_url,
             location=location,
-            is_remote=is_remote,
+            is_remote=analysis.is_remote,
             date_posted=date_posted,
             job_url=job_url,
             compensation=compensation,
             job_type=job_type,
             company_industry=company_industry,
             description=description,
-            emails=extract_emails_from_text(description or ""),
+            emails=analysis.emails,
             company_logo=company_logo,
             skills=skills,
             experience_range=experience_range,
@@ -214,17 +292,10 @@ class Naukri(Scraper):
         """
         Extracts location data from placeholders
         """
-        location = Location(country=Country.INDIA)
         for placeholder in placeholders:
             if placeholder.get("type") == "location":
-                location_str = placeholder.get("label", "")
-                parts = location_str.split(", ")
-                city = parts[0] if parts else None
-                state = parts[1] if len(parts) > 1 else None
-                location = Location(city=city, state=state, country=Country.INDIA)
-                log.debug(f"Parsed location: {location.display_location()}")
-                break
-        return location
+                return parse_location(placeholder.get("label"), Country.INDIA)
+        return Location(country=Country.INDIA)
 
     def _get_compensation(self, placeholders: list[dict]) -> Optional[Compensation]:
         """
@@ -295,10 +366,11 @@ class Naukri(Scraper):
         Infers work-from-home type from job data (e.g., 'Hybrid', 'Remote', 'Work from office')
         """
         location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in location_str or "hybrid" in title.lower() or "hybrid" in description.lower():
+        title, description = title.lower(), description.lower()
+        if "hybrid" in location_str or "hybrid" in title or "hybrid" in description:
             return "Hybrid"
-        elif "remote" in location_str or "remote" in title.lower() or "remote" in description.lower():
+        elif "remote" in location_str or "remote" in title or "remote" in description:
             return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
+        elif "work from office" in description or not ("remote" in description or "hybrid" in description):
             return "Work from office"
         return None
\ No newline at end of file
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from bs4 import BeautifulSoup
-from jobspy.model import JobType, Location
+from jobspy.model import JobType
 from jobspy.util import get_enum_from_job_type
 
 
@@ -26,13 +26,3 @@ def parse_company_industry(soup: BeautifulSoup | str) -> str | None:
         soup = BeautifulSoup(soup, "html.parser")
     industry_tag = soup.find("span", class_="industry")
     return industry_tag.get_text(strip=True) if industry_tag else None
-
-
-def is_job_remote(title: str, description: str, location: Location) -> bool:
-    """
-    Searches the title, description, and location to check if the job is remote
-    """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    location_str = location.display_location()
-    full_string = f"{title} {description} {location_str}".lower()
-    return any(keyword in full_string for keyword in remote_keywords)
\ No newline at end of file
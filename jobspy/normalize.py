@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import csv
+import os
+import sys
+from functools import lru_cache
+
+from jobspy.model import Country, JobType, Location, Site
+
+# Reverse indexes over the enum value tuples, built once at import. Keys are
+# interned since the same few strings are looked up for every scraped job.
+
+
+def _index(pairs) -> dict:
+    index = {}
+    for key, member in pairs:
+        # First member wins, matching Country.from_string's scan
+        index.setdefault(sys.intern(key), member)
+    return index
+
+
+def _job_type_index() -> dict:
+    # The old scans disagreed on shared spellings (get_enum_from_job_type kept the last
+    # member, get_enum_from_value the first), so a spelling may only belong to one member.
+    index = {}
+    for job_type in JobType:
+        for value in job_type.value:
+            owner = index.setdefault(sys.intern(value), job_type)
+            if owner is not job_type:
+                raise ValueError(f"'{value}' is listed under both {owner} and {job_type}")
+    return index
+
+
+JOB_TYPE_INDEX: dict[str, JobType] = _job_type_index()
+COUNTRY_INDEX: dict[str, Country] = _index(
+    (name, country) for country in Country for name in country.value[0].split(",")
+)
+SITE_INDEX: dict[str, Site] = _index(
+    [(site.name.lower(), site) for site in Site] + [(site.value, site) for site in Site]
+)
+
+
+def job_type_from_string(job_type_str: str | None) -> JobType | None:
+    """
+    Maps any of a JobType's spellings (e.g. "fulltime", "vollzeit", "全职") to the member
+    """
+    if not job_type_str:
+        return None
+    return JOB_TYPE_INDEX.get(job_type_str)
+
+
+def country_from_string(country_str: str | None) -> Country | None:
+    """
+    Maps a country name or alias (e.g. "usa", "united states", "uk") to the Country member
+    """
+    if not country_str:
+        return None
+    country = COUNTRY_INDEX.get(country_str)
+    if country is None:
+        country = COUNTRY_INDEX.get(country_str.strip().lower())
+    return country
+
+
+def site_from_string(site_name: str) -> Site | None:
+    """
+    Maps a site name (e.g. "linkedin", "ZIP_RECRUITER", "zip_recruiter") to the Site member
+    """
+    return SITE_INDEX.get(site_name) or SITE_INDEX.get(site_name.strip().lower())
+
+
+# --- Locations ---
+
+LOCATION_CACHE_SIZE = int(os.environ.get("LOCATION_CACHE_SIZE", 20000))
+_EMPTY_LOCATIONS = {"", "n/a", "na", "none", "-"}
+
+US_STATES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "DC": "District of Columbia",
+    "FL": "Florida", "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois",
+    "IN": "Indiana", "IA": "Iowa", "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana",
+    "ME": "Maine", "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+    "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada",
+    "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma", "OR": "Oregon",
+    "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina", "SD": "South Dakota",
+    "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont", "VA": "Virginia",
+    "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+_US_STATE_KEYS = {code.lower() for code in US_STATES} | {name.lower() for name in US_STATES.values()}
+
+# city (lowercase) -> (state, country), empty unless an offline dataset is loaded with
+# load_gazetteer() or LOCATION_GAZETTEER. There is deliberately no built-in city list: filling
+# the country for a few well-known cities only would make one site's rows disagree with each
+# other, so scrapers pass their site or search country as default_country instead.
+GAZETTEER: dict[str, tuple[str | None, Country | str | None]] = {}
+
+
+def load_gazetteer(path: str) -> int:
+    """
+    Loads an offline gazetteer CSV with city,state,country columns (e.g. an export of
+    GeoNames cities). Countries that match a Country member are stored as the member.
+    :return: number of cities loaded
+    """
+    loaded = 0
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            city = (row.get("city") or "").strip()
+            if not city:
+                continue
+            country = (row.get("country") or "").strip()
+            GAZETTEER[city.lower()] = (
+                (row.get("state") or "").strip() or None,
+                country_from_string(country) or country or None,
+            )
+            loaded += 1
+    _parse_location.cache_clear()
+    return loaded
+
+
+if os.environ.get("LOCATION_GAZETTEER"):
+    load_gazetteer(os.environ["LOCATION_GAZETTEER"])
+
+
+def _resolve_country(text: str) -> Country | str:
+    return country_from_string(text) or text
+
+
+# Default countries that don't name one country, so a gazetteer hit may still pick it
+_REGION_COUNTRIES = {
+    Country.WORLDWIDE: None,
+    Country.US_CANADA: (Country.USA, Country.CANADA),
+}
+
+
+def _gazetteer_applies(known_country, country) -> bool:
+    if country is None or country == known_country:
+        return True
+    if country in _REGION_COUNTRIES:
+        members = _REGION_COUNTRIES[country]
+        return members is None or known_country in members
+    return False
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _parse_location(location_text: str, default_country: Country | None) -> Location:
+    parts = [part.strip() for part in location_text.split(",")]
+    parts = [part for part in parts if part.lower() not in _EMPTY_LOCATIONS]
+    city = state = country = None
+
+    if len(parts) == 1:
+        country = country_from_string(parts[0])
+        if country is None:
+            city = parts[0]
+    elif len(parts) == 2:
+        city, second = parts
+        second_key = second.lower()
+        if second_key in COUNTRY_INDEX:
+            country = COUNTRY_INDEX[second_key]
+        elif city.lower() in GAZETTEER and second_key in GAZETTEER and second_key not in _US_STATE_KEYS:
+            # A list of cities ("Hyderabad, Bengaluru"): keep the first one
+            pass
+        else:
+            state = second
+    elif len(parts) >= 3:
+        city, state, country = parts[0], parts[1], _resolve_country(parts[-1])
+
+    known = GAZETTEER.get(city.lower()) if city else None
+    if known:
+        known_state, known_country = known
+        # The gazetteer only fills in a missing country; it never overrides the one in the
+        # text or the scraper's (a "London" job in a USA search stays in the USA)
+        if _gazetteer_applies(known_country, country or default_country):
+            # City states and capitals ("Dhaka" in Dhaka Division) aren't repeated as the state
+            if not state and known_state and known_state.lower() != city.lower():
+                state = known_state
+            country = known_country
+    return Location(city=city, state=state, country=country or default_country)
+
+
+def parse_location(location_text: str | None, default_country: Country | None = None) -> Location:
+    """
+    Normalizes a free-form location string ("Austin, TX", "Bengaluru", "Paris, Ile-de-France, France")
+    into a Location. Results are memoized; Location is frozen, so sharing them is safe.
+    :param default_country: used when the text doesn't name a country
+    """
+    if not location_text or location_text.strip().lower() in _EMPTY_LOCATIONS:
+        return Location(country=default_country)
+    return _parse_location(location_text.strip(), default_country)
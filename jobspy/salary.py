@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from jobspy.model import CompensationInterval
+
+# Matches ranges such as "$80,000 - $100,000", "$50k-60k", "£30,000 to £35,000 per year",
+# "$50 to 60 thousand", "€25.50 – €30/hr" or "$40 - $45 hourly". With "to" the upper
+# bound needs its own currency sign or a k/thousand suffix, so "$1 to 2 years" isn't a salary.
+_SALARY_RANGE = r"""
+    (?P<symbol>{symbol})\s?
+    (?P<min>\d{{1,3}}(?:,\d{{3}})+(?:\.\d+)?|\d+(?:\.\d+)?)(?P<min_k>[kK](?![a-zA-Z])|\s?thousand\b)?
+    \s*(?:[-—–]|(?P<to>\bto\b))\s*
+    (?P<max_symbol>[$£€])?\s?
+    (?P<max>\d{{1,3}}(?:,\d{{3}})+(?:\.\d+)?|\d+(?:\.\d+)?)(?P<max_k>[kK](?![a-zA-Z])|\s?thousand\b)?
+    (?(to)(?(max_symbol)|(?(max_k)|(?!))))
+    (?:
+        \s*(?:/|\bper\b|\ban?\b)\s*(?P<unit>hour|hr|year|yr|annum|month|mo|week|wk|day)\b
+        |\s+(?P<adverb>hourly|annually|yearly|monthly|weekly|daily)\b
+    )?
+"""
+_NON_NUMERIC_PATTERN = re.compile(r"[^-0-9.,]")
+_THOUSANDS_SEPARATOR_PATTERN = re.compile(r"[.,]")
+
+CURRENCY_SYMBOLS = {"$": "USD", "£": "GBP", "€": "EUR"}
+UNIT_INTERVALS = {
+    "hour": CompensationInterval.HOURLY.value,
+    "hr": CompensationInterval.HOURLY.value,
+    "hourly": CompensationInterval.HOURLY.value,
+    "day": CompensationInterval.DAILY.value,
+    "daily": CompensationInterval.DAILY.value,
+    "week": CompensationInterval.WEEKLY.value,
+    "wk": CompensationInterval.WEEKLY.value,
+    "weekly": CompensationInterval.WEEKLY.value,
+    "month": CompensationInterval.MONTHLY.value,
+    "mo": CompensationInterval.MONTHLY.value,
+    "monthly": CompensationInterval.MONTHLY.value,
+    "year": CompensationInterval.YEARLY.value,
+    "yr": CompensationInterval.YEARLY.value,
+    "annum": CompensationInterval.YEARLY.value,
+    "annually": CompensationInterval.YEARLY.value,
+    "yearly": CompensationInterval.YEARLY.value,
+}
+ANNUAL_FACTORS = {
+    CompensationInterval.HOURLY.value: 2080,
+    CompensationInterval.DAILY.value: 260,
+    CompensationInterval.WEEKLY.value: 52,
+    CompensationInterval.MONTHLY.value: 12,
+    CompensationInterval.YEARLY.value: 1,
+}
+# One pattern per currency, compiled once at import. A literal first character lets
+# the regex engine skip ahead quickly; a [$£€] class makes it ~15x slower on long text.
+SALARY_PATTERNS = {
+    symbol: re.compile(_SALARY_RANGE.format(symbol=re.escape(symbol)), re.VERBOSE | re.IGNORECASE)
+    for symbol in CURRENCY_SYMBOLS
+}
+
+
+def currency_parser(cur_str):
+    # Remove any non-numerical characters
+    # except for ',' '.' or '-' (e.g. EUR)
+    cur_str = _NON_NUMERIC_PATTERN.sub("", cur_str)
+    # Remove any 000s separators (either , or .)
+    cur_str = _THOUSANDS_SEPARATOR_PATTERN.sub("", cur_str[:-3]) + cur_str[-3:]
+
+    if "." in list(cur_str[-3:]):
+        num = float(cur_str)
+    elif "," in list(cur_str[-3:]):
+        num = float(cur_str.replace(",", "."))
+    else:
+        num = float(cur_str)
+
+    return np.round(num, 2)
+
+
+def _amount(value: str, thousands: bool) -> float:
+    amount = float(value.replace(",", ""))
+    return amount * 1000 if thousands else amount
+
+
+def extract_salary(
+    salary_str,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+):
+    """
+    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
+    An explicit unit ("/hr", "per year", "monthly") sets the interval; otherwise it is
+    inferred from the amount (below hourly_threshold is hourly, below monthly_threshold is monthly).
+    """
+    if not salary_str:
+        return None, None, None, None
+    for pattern in SALARY_PATTERNS.values():
+        match = pattern.search(salary_str)
+        if match:
+            break
+    else:
+        return None, None, None, None
+
+    # A "k" on either end applies to both, e.g. "$50-60k"
+    thousands = bool(match["min_k"] or match["max_k"])
+    min_salary = _amount(match["min"], thousands)
+    max_salary = _amount(match["max"], thousands)
+
+    unit = match["unit"] or match["adverb"]
+    if unit:
+        interval = UNIT_INTERVALS[unit.lower()]
+    elif min_salary < hourly_threshold:
+        interval = CompensationInterval.HOURLY.value
+        if max_salary >= hourly_threshold:
+            return None, None, None, None
+    elif min_salary < monthly_threshold:
+        interval = CompensationInterval.MONTHLY.value
+        if max_salary >= monthly_threshold:
+            return None, None, None, None
+    else:
+        interval = CompensationInterval.YEARLY.value
+
+    factor = ANNUAL_FACTORS[interval]
+    annual_min_salary = min_salary * factor
+    annual_max_salary = max_salary * factor
+    if not (
+        lower_limit <= annual_min_salary <= upper_limit
+        and lower_limit <= annual_max_salary <= upper_limit
+        and annual_min_salary < annual_max_salary
+    ):
+        return None, None, None, None
+
+    currency = CURRENCY_SYMBOLS[match["symbol"]]
+    # Floats rounded to cents, the same as extract_salaries returns
+    if enforce_annual_salary:
+        return interval, round(annual_min_salary, 2), round(annual_max_salary, 2), currency
+    return interval, round(min_salary, 2), round(max_salary, 2), currency
+
+
+def extract_salaries(
+    texts,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    Batch version of extract_salary for whole frames: runs the pattern over a string column
+    with str.extract and resolves intervals and limits column-wise
+    :param texts: pandas Series (or list) of descriptions
+    :return: DataFrame with interval, min_amount, max_amount, currency (NaN where nothing valid was found)
+    """
+    texts = pd.Series(texts, dtype=object) if not isinstance(texts, pd.Series) else texts.astype(object)
+    texts = texts.fillna("")
+    found = pd.DataFrame(index=texts.index, columns=list(SALARY_PATTERNS["$"].groupindex), dtype=object)
+    for symbol, pattern in SALARY_PATTERNS.items():
+        # Same precedence as extract_salary: the first currency with a match wins.
+        pending = found["min"].isna() & texts.str.contains(symbol, regex=False)
+        if pending.any():
+            found.loc[pending] = texts[pending].str.extract(pattern)
+
+    thousands = np.where(found["min_k"].notna() | found["max_k"].notna(), 1000, 1)
+    min_salary = pd.to_numeric(found["min"].str.replace(",", "", regex=False), errors="coerce").astype("float64") * thousands
+    max_salary = pd.to_numeric(found["max"].str.replace(",", "", regex=False), errors="coerce").astype("float64") * thousands
+
+    unit = found["unit"].fillna(found["adverb"]).str.lower().map(UNIT_INTERVALS)
+    inferred = pd.Series(
+        np.select(
+            [min_salary < hourly_threshold, min_salary < monthly_threshold],
+            [CompensationInterval.HOURLY.value, CompensationInterval.MONTHLY.value],
+            CompensationInterval.YEARLY.value,
+        ),
+        index=texts.index,
+    )
+    interval = unit.where(unit.notna(), inferred)
+    # Without an explicit unit, the max must fall in the same band as the min.
+    band_limit = inferred.map(
+        {
+            CompensationInterval.HOURLY.value: hourly_threshold,
+            CompensationInterval.MONTHLY.value: monthly_threshold,
+            CompensationInterval.YEARLY.value: np.inf,
+        }
+    )
+    same_band = unit.notna() | (max_salary < band_limit)
+
+    factor = interval.map(ANNUAL_FACTORS)
+    annual_min_salary = min_salary * factor
+    annual_max_salary = max_salary * factor
+    valid = (
+        same_band
+        & annual_min_salary.between(lower_limit, upper_limit)
+        & annual_max_salary.between(lower_limit, upper_limit)
+        & (annual_min_salary < annual_max_salary)
+    )
+
+    result = pd.DataFrame(
+        {
+            "interval": interval,
+            "min_amount": (annual_min_salary if enforce_annual_salary else min_salary).round(2),
+            "max_amount": (annual_max_salary if enforce_annual_salary else max_salary).round(2),
+            "currency": found["symbol"].map(CURRENCY_SYMBOLS),
+        },
+        index=texts.index,
+    )
+    return result.where(valid)
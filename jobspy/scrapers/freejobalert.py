@@ -5,7 +5,7 @@ from bs4 import BeautifulSoup
 from typing import List, Optional, Dict
 from datetime import datetime
 
-from ..model import JobPost, JobResponse, ScraperInput, Location
+from ..model import JobPost, JobResponse, Scraper, ScraperInput, Site, Location
 
 def robust_date_parser(date_str: str) -> Optional[datetime]:
     """
@@ -24,13 +24,14 @@ def robust_date_parser(date_str: str) -> Optional[datetime]:
     print(f"Warning: Could not parse date string '{date_str}' with any known format.")
     return None
 
-class FreeJobAlertScraper:
+class FreeJobAlertScraper(Scraper):
     """
     Scrapes job listings from FreeJobAlert.com.
     Performs a "deep scrape" of details pages, extracts structured data from tables,
     and skips duplicate companies within a single session.
     """
     def __init__(self, proxies: Optional[list[str]] = None, ca_cert: Optional[str] = None, user_agent: Optional[str] = None):
+        super().__init__(Site.FREEJOBALERT, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
         self.site_url = "https://www.freejobalert.com/latest-notifications/"
         self.headers = {
             'User-Agent': user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -73,6 +74,7 @@ class FreeJobAlertScraper:
             return details_data
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        self.scraper_input = scraper_input
         try:
             response = requests.get(self.site_url, headers=self.headers, proxies=self.proxies, verify=self.verify)
             response.raise_for_status()
@@ -140,8 +142,12 @@ class FreeJobAlertScraper:
 
                     posted_date_obj = robust_date_parser(start_date_str)
                     expiry_date_obj = robust_date_parser(last_date_str)
+                    # Plain dates: unvalidated JobRecords keep them as passed, and
+                    # results are sorted against other sites' date_posted values
+                    posted_date_obj = posted_date_obj.date() if posted_date_obj else None
+                    expiry_date_obj = expiry_date_obj.date() if expiry_date_obj else None
 
-                    job = JobPost(
+                    job = self.create_job(
                         title=post_name,
                         company_name=recruitment_board,
                         location=None,
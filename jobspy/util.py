@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import html
 import logging
 import re
+import threading
+import time
+import zlib
 from itertools import cycle
+from typing import NamedTuple
+from urllib.parse import urlparse
 
-import numpy as np
 import requests
 import tls_client
 import urllib3
-from markdownify import markdownify as md
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from markdownify import MarkdownConverter
 from requests.adapters import HTTPAdapter, Retry
 
-from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.model import JobType, Site
+from jobspy.normalize import job_type_from_string, site_from_string
+from jobspy.salary import currency_parser, extract_salary, extract_salaries
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -132,6 +142,30 @@ def create_session(
     return session
 
 
+class RateLimiter:
+    """
+    Spaces out requests so each host gets at most `requests_per_second`.
+    Thread-safe; share one instance between every worker that hits the same hosts.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self.lock = threading.Lock()
+        self.next_slot: dict[str, float] = {}
+
+    def wait(self, url: str):
+        """Blocks until a request to url's host may be sent"""
+        if not self.interval:
+            return
+        host = urlparse(url).netloc or url
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
@@ -151,161 +185,173 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
-def markdown_converter(description_html: str):
+# One configured converter shared by every scraper instead of a new one per call
+_markdown = MarkdownConverter()
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+MARKDOWN_CACHE_SIZE = 5000
+# html digest -> markdown; identical descriptions show up across sites and pages
+_markdown_cache: dict[bytes, str] = {}
+_markdown_cache_lock = threading.Lock()
+
+
+def markdown_converter(description_html: str | Tag, source: str | None = None):
+    """
+    Converts a description to markdown. Accepts an HTML string or an already-parsed
+    BeautifulSoup tag, which is converted directly without prettify/re-parsing.
+    Results are cached by content hash. A tag is only cached when source, the HTML it
+    was parsed from, is given: serializing the tree just to build a key would cost
+    what passing the tag saves.
+    """
     if description_html is None:
         return None
-    markdown = md(description_html)
-    return markdown.strip()
+    is_tag = isinstance(description_html, Tag)
+    key_html = source if is_tag else description_html
+    key = None
+    if key_html is not None:
+        key = hashlib.blake2b(key_html.encode(), digest_size=16).digest()
+        cached = _markdown_cache.get(key)
+        if cached is not None:
+            return cached
+
+    if is_tag:
+        markdown = _markdown.convert_soup(description_html).strip()
+    else:
+        markdown = _markdown.convert(description_html).strip()
+    if key is not None:
+        with _markdown_cache_lock:
+            if len(_markdown_cache) >= MARKDOWN_CACHE_SIZE:
+                del _markdown_cache[next(iter(_markdown_cache))]
+            _markdown_cache[key] = markdown
+    return markdown
+
+def compress_description(description: str | None) -> bytes | None:
+    """ zlib-compresses a raw description so it can be kept around cheaply until it is needed """
+    return zlib.compress(description.encode()) if description else None
+
+
+def render_description(raw: bytes | None, description_format: str = "markdown") -> str | None:
+    """ Decompresses a raw HTML description and converts it to markdown, plain text or html """
+    if not raw:
+        return None
+    html = zlib.decompress(raw).decode()
+    if description_format == "markdown":
+        return markdown_converter(html)
+    if description_format == "plain":
+        return plain_converter(html)
+    return html
 
-def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
+
+def plain_converter(decription_html: str | Tag):
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
+    soup = decription_html if isinstance(decription_html, Tag) else BeautifulSoup(decription_html, "html.parser")
     text = soup.get_text(separator=" ")
-    text = re.sub(r'\s+',' ',text)
+    text = _WHITESPACE_PATTERN.sub(' ', text)
     return text.strip()
 
 
-def extract_emails_from_text(text: str) -> list[str] | None:
-    if not text:
-        return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# (cheap substring that must be present, pattern run only when it is)
+JOB_TYPE_PATTERNS = {
+    JobType.FULL_TIME: ("full", re.compile(r"full\s?time")),
+    JobType.PART_TIME: ("part", re.compile(r"part\s?time")),
+    JobType.INTERNSHIP: ("internship", None),
+    JobType.CONTRACT: ("contract", None),
+}
+REMOTE_KEYWORDS = ("remote", "work from home", "wfh")
+# Tags and comments, for the cheap text extraction analysis runs on (not a renderer)
+_HTML_TAG_PATTERN = re.compile(r"<!--.*?-->|</?[a-zA-Z][^<>]*>", re.DOTALL)
 
 
-def get_enum_from_job_type(job_type_str: str) -> JobType | None:
-    """
-    Given a string, returns the corresponding JobType enum member if a match is found.
-    """
-    res = None
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            res = job_type
-    return res
-
-
-def currency_parser(cur_str):
-    # Remove any non-numerical characters
-    # except for ',' '.' or '-' (e.g. EUR)
-    cur_str = re.sub("[^-0-9.,]", "", cur_str)
-    # Remove any 000s separators (either , or .)
-    cur_str = re.sub("[.,]", "", cur_str[:-3]) + cur_str[-3:]
-
-    if "." in list(cur_str[-3:]):
-        num = float(cur_str)
-    elif "," in list(cur_str[-3:]):
-        num = float(cur_str.replace(",", "."))
-    else:
-        num = float(cur_str)
+class DescriptionAnalysis(NamedTuple):
+    emails: list[str] | None
+    job_type: list[JobType] | None
+    is_remote: bool
 
-    return np.round(num, 2)
 
+def extract_emails_from_text(text: str) -> list[str] | None:
+    if not text:
+        return None
+    # Skip the regex entirely when there is no "@" to anchor an address
+    return EMAIL_PATTERN.findall(text) if "@" in text else []
 
-def remove_attributes(tag):
-    for attr in list(tag.attrs):
-        del tag[attr]
-    return tag
+
+def _job_types(lowered: str) -> list[JobType] | None:
+    listing_types = [
+        job_type
+        for job_type, (keyword, pattern) in JOB_TYPE_PATTERNS.items()
+        if keyword in lowered and (pattern is None or pattern.search(lowered))
+    ]
+    return listing_types or None
 
 
-def extract_salary(
-    salary_str,
-    lower_limit=1000,
-    upper_limit=700000,
-    hourly_threshold=350,
-    monthly_threshold=30000,
-    enforce_annual_salary=False,
-):
+def description_text(description: str | None) -> str | None:
     """
-    Extracts salary information from a string and returns the salary interval, min and max salary values, and currency.
-    (TODO: Needs test cases as the regex is complicated and may not cover all edge cases)
+    The text of an HTML description (raw or html format) with tags dropped and entities
+    decoded, so keyword and salary scans see what the converted description would show.
+    Descriptions without tags, e.g. markdown, are returned unchanged.
     """
-    if not salary_str:
-        return None, None, None, None
-
-    annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+    if not description or "<" not in description or not _HTML_TAG_PATTERN.search(description):
+        return description
+    return html.unescape(_HTML_TAG_PATTERN.sub(" ", description))
 
-    def to_int(s):
-        return int(float(s.replace(",", "")))
 
-    def convert_hourly_to_annual(hourly_wage):
-        return hourly_wage * 2080
-
-    def convert_monthly_to_annual(monthly_wage):
-        return monthly_wage * 12
-
-    match = re.search(min_max_pattern, salary_str)
+def analyze_description(
+    description: str | None,
+    *context: str | None,
+    remote_keywords: tuple[str, ...] = REMOTE_KEYWORDS,
+) -> DescriptionAnalysis:
+    """
+    Derives emails, job types and the remote flag from a description in one go: the text
+    is lowercased once and each regex only runs where a substring check hits. Salaries are
+    parsed separately, in bulk, by scrape_jobs (see salary.extract_salaries).
+    HTML descriptions (raw and html formats) are scanned as text, so tag names and attributes
+    can't count as keywords; emails are still read from the markup too, as markdown keeps
+    mailto links.
+    :param context: extra text checked for remote keywords only (title, location, attributes)
+    """
+    description = description or ""
+    text = description_text(description)
+    lowered = text.lower()
+    context_text = " ".join(c for c in context if c).lower()
+    return DescriptionAnalysis(
+        emails=extract_emails_from_text(description if text is description else html.unescape(description)),
+        job_type=_job_types(lowered) if description else None,
+        is_remote=any(k in lowered or k in context_text for k in remote_keywords),
+    )
 
-    if match:
-        min_salary = to_int(match.group(1))
-        max_salary = to_int(match.group(3))
-        # Handle 'k' suffix for min and max salaries independently
-        if "k" in match.group(2).lower() or "k" in match.group(4).lower():
-            min_salary *= 1000
-            max_salary *= 1000
 
-        # Convert to annual if less than the hourly threshold
-        if min_salary < hourly_threshold:
-            interval = CompensationInterval.HOURLY.value
-            annual_min_salary = convert_hourly_to_annual(min_salary)
-            if max_salary < hourly_threshold:
-                annual_max_salary = convert_hourly_to_annual(max_salary)
+def get_enum_from_job_type(job_type_str: str) -> JobType | None:
+    """
+    Given a string, returns the corresponding JobType enum member if a match is found.
+    """
+    return job_type_from_string(job_type_str)
 
-        elif min_salary < monthly_threshold:
-            interval = CompensationInterval.MONTHLY.value
-            annual_min_salary = convert_monthly_to_annual(min_salary)
-            if max_salary < monthly_threshold:
-                annual_max_salary = convert_monthly_to_annual(max_salary)
 
-        else:
-            interval = CompensationInterval.YEARLY.value
-            annual_min_salary = min_salary
-            annual_max_salary = max_salary
-
-        # Ensure salary range is within specified limits
-        if not annual_max_salary:
-            return None, None, None, None
-        if (
-            lower_limit <= annual_min_salary <= upper_limit
-            and lower_limit <= annual_max_salary <= upper_limit
-            and annual_min_salary < annual_max_salary
-        ):
-            if enforce_annual_salary:
-                return interval, annual_min_salary, annual_max_salary, "USD"
-            else:
-                return interval, min_salary, max_salary, "USD"
-    return None, None, None, None
+def remove_attributes(tag):
+    for attr in list(tag.attrs):
+        del tag[attr]
+    return tag
 
 
 def extract_job_type(description: str):
     if not description:
         return []
-
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
-
-    return listing_types if listing_types else None
+    return _job_types(description.lower())
 
 
 def map_str_to_site(site_name: str) -> Site:
-    return Site[site_name.upper()]
+    site = site_from_string(site_name)
+    if site is None:
+        raise KeyError(site_name)
+    return site
 
 
 def get_enum_from_value(value_str):
-    for job_type in JobType:
-        if value_str in job_type.value:
-            return job_type
-    raise Exception(f"Invalid job type: {value_str}")
+    job_type = job_type_from_string(value_str)
+    if job_type is None:
+        raise Exception(f"Invalid job type: {value_str}")
+    return job_type
 
 
 def convert_to_annual(job_data: dict):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import math
 import re
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
@@ -11,7 +12,8 @@ from bs4 import BeautifulSoup
 
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
-    extract_emails_from_text,
+    RateLimiter,
+    analyze_description,
     create_session,
     markdown_converter,
     remove_attributes,
@@ -36,6 +38,10 @@ log = create_logger("ZipRecruiter")
 class ZipRecruiter(Scraper):
     base_url = "https://www.ziprecruiter.com"
     api_url = "https://api.ziprecruiter.com"
+    # Shared by every ZipRecruiter scraper in the process, so concurrent searches
+    # don't multiply the load on the job pages
+    detail_slots = threading.BoundedSemaphore(10)
+    detail_rate_limiter = RateLimiter(requests_per_second=10)
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -52,7 +58,9 @@ class ZipRecruiter(Scraper):
 
         self.delay = 5
         self.jobs_per_page = 20
+        self.num_workers = 10
         self.seen_urls = set()
+        self.seen_lock = threading.Lock()
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -61,35 +69,64 @@ class ZipRecruiter(Scraper):
         :return: JobResponse containing a list of jobs.
         """
         self.scraper_input = scraper_input
+        results_wanted = scraper_input.results_wanted
         job_list: list[JobPost] = []
+        job_futures = []
         continue_token = None
+        page = 1
+        max_pages = math.ceil(results_wanted / self.jobs_per_page)
 
-        max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
-            if page > 1:
-                time.sleep(self.delay)
-            log.info(f"search page: {page} / {max_pages}")
-            jobs_on_page, continue_token = self._find_jobs_in_page(
-                scraper_input, continue_token
-            )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
-                break
-            if not continue_token:
-                break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+        # One pool for the whole search: job pages keep being fetched while
+        # the scraper waits out the delay and requests the next search page
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            while True:
+                if len(job_list) + len(job_futures) >= results_wanted:
+                    # Enough unique jobs are in flight; only page on if some of them fail
+                    job_list += [job for job in (f.result() for f in job_futures) if job]
+                    job_futures = []
+                    if len(job_list) >= results_wanted:
+                        break
+                if page > 1:
+                    if not continue_token:
+                        break
+                    time.sleep(self.delay)
+                log.info(f"search page: {page} / {max_pages}")
+                jobs_on_page, continue_token = self._find_jobs_in_page(
+                    scraper_input, continue_token
+                )
+                if not jobs_on_page:
+                    break
+                job_futures += [
+                    executor.submit(self._process_job, job)
+                    for job in jobs_on_page
+                    if self._is_new(job)
+                ]
+                page += 1
+            job_list += [job for job in (f.result() for f in job_futures) if job]
+        return JobResponse(jobs=job_list[:results_wanted])
+
+    def _is_new(self, job: dict) -> bool:
+        """
+        Claims a job's url, so duplicates across pages are dropped before they are fetched or counted
+        """
+        job_url = self._job_url(job)
+        with self.seen_lock:
+            if job_url in self.seen_urls:
+                return False
+            self.seen_urls.add(job_url)
+        return True
+
+    def _job_url(self, job: dict) -> str:
+        return f"{self.base_url}/jobs//j?lvk={job['listing_key']}"
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
-    ) -> tuple[list[JobPost], str | None]:
+    ) -> tuple[list[dict], str | None]:
         """
         Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
         :param scraper_input:
         :param continue_token:
-        :return: jobs found on page
+        :return: job dicts found on page, for _process_job
         """
         jobs_list = []
         params = add_params(scraper_input)
@@ -115,22 +152,21 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
-
-        job_list = list(filter(None, (result.result() for result in job_results)))
-        return job_list, next_continue_token
+        return jobs_list, next_continue_token
 
     def _process_job(self, job: dict) -> JobPost | None:
         """
-        Processes an individual job dict from the response
+        Processes an individual job dict from the response; a job that fails is logged and skipped
         """
-        title = job.get("name")
-        job_url = f"{self.base_url}/jobs//j?lvk={job['listing_key']}"
-        if job_url in self.seen_urls:
-            return
-        self.seen_urls.add(job_url)
+        try:
+            return self._build_job(job)
+        except Exception as e:
+            log.error(f"Error processing job {job.get('listing_key')}: {e}")
+            return None
 
+    def _build_job(self, job: dict) -> JobPost:
+        title = job.get("name")
+        job_url = self._job_url(job)
         description = job.get("job_description", "").strip()
         listing_type = job.get("buyer_type", "")
         description = (
@@ -154,9 +190,11 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        description_full = job_url_direct = None
+        if self.scraper_input.ziprecruiter_fetch_description:
+            description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        return self.create_job(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
@@ -171,29 +209,32 @@ class ZipRecruiter(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             description=description_full if description_full else description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=analyze_description(description).emails,
             job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
 
     def _get_descr(self, job_url):
-        res = self.session.get(job_url, allow_redirects=True)
+        with self.detail_slots:
+            self.detail_rate_limiter.wait(job_url)
+            res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None
         if res.ok:
             soup = BeautifulSoup(res.text, "html.parser")
             job_descr_div = soup.find("div", class_="job_description")
             company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = (
-                remove_attributes(job_descr_div).prettify(formatter="html")
-                if job_descr_div
-                else ""
-            )
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html")
-                if company_descr_section
-                else ""
-            )
-            description_full = job_description_clean + company_description_clean
+            sections = [
+                remove_attributes(tag)
+                for tag in (job_descr_div, company_descr_section)
+                if tag
+            ]
+            # Convert the parsed tree directly; only HTML output needs serializing
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                description_full = "\n\n".join(markdown_converter(tag) for tag in sections)
+            elif self.scraper_input.description_format == DescriptionFormat.RAW:
+                description_full = "".join(str(tag) for tag in sections)
+            else:
+                description_full = "".join(tag.prettify(formatter="html") for tag in sections)
 
             try:
                 script_tag = soup.find("script", type="application/json")
@@ -206,9 +247,6 @@ class ZipRecruiter(Scraper):
             except:
                 job_url_direct = None
 
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
-
         return description_full, job_url_direct
 
     def _get_cookies(self):
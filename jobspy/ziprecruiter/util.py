@@ -1,4 +1,5 @@
 from jobspy.model import JobType
+from jobspy.normalize import job_type_from_string
 
 
 def add_params(scraper_input) -> dict[str, str | int]:
@@ -25,7 +26,5 @@ def add_params(scraper_input) -> dict[str, str | int]:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
-    return None
+    job_type = job_type_from_string(job_type_str)
+    return [job_type] if job_type else None
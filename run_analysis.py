@@ -1,8 +1,7 @@
 # In run_analysis.py
 from dotenv import load_dotenv
 load_dotenv()
-import os
-from jobspy.database import process_and_store_resume , db
+from jobspy.database import process_and_store_resumes, load_job_chunks, db
 from jobspy.analysis.matching import find_best_resumes_for_job
 from jobspy.analysis.rag_generator import generate_rag_insights
 
@@ -18,16 +17,8 @@ def main():
     """ Runs the full analysis pipeline, including Phase 3 RAG generation. """
     
     print("--- Step 1: Processing and Storing Resume ---")
-    # Clear the resumes collection before processing new ones
-    print("Clearing existing resumes from the database...")
-    db["resumes"].delete_many({})
-    print("Resumes collection cleared.")
-
-    for candidate_id, info in RESUMES_TO_PROCESS.items():
-        if os.path.exists(info['file']):
-            process_and_store_resume(file_path=info['file'], candidate_name=info['name'], candidate_id=candidate_id)
-        else:
-            print(f"Warning: Resume file not found at {info['file']}. Skipping.")
+    # Unchanged resumes (same file hash) are skipped; new or edited ones are re-processed.
+    process_and_store_resumes(RESUMES_TO_PROCESS)
     
     print("\n" + "="*50 + "\n")
 
@@ -62,8 +53,9 @@ def main():
     # --- Step 3: Generate AI-Powered Insights (Phase 3) ---
     print("--- Step 3: Generating RAG Insights for Top Candidates ---")
 
-    # We need the full job document for the prompt
+    # We need the full job document for the prompt; chunk embeddings live in their own collection
     job_doc = db["private_jobs"].find_one({"_id": JOB_ID_TO_MATCH})
+    job_doc["chunks"] = load_job_chunks(JOB_ID_TO_MATCH) or job_doc.get("chunks", [])
     
     # We also need the full candidate documents, not just the projected results
     top_candidate_ids = [match['_id'] for match in top_matches]
@@ -0,0 +1,64 @@
+"""
+Description analysis benchmark: CPU per 10k jobs for the separate per-field scans scrape_jobs
+used to run (emails, job type, remote keywords, salary) against analyze_description plus the
+batch salary extraction that replaced them.
+
+    PYTHONPATH=. python tests/benchmarks/bench_analyzer.py [jobs.csv]
+
+jobs.csv is a scrape_jobs CSV export; without one, 10k generated postings padded to about 5 KB are used.
+"""
+import re
+import sys
+import time
+
+from jobspy.salary import extract_salaries
+from jobspy.util import REMOTE_KEYWORDS, analyze_description
+from tests.benchmarks.bench_salary import baseline_extract_salary
+from tests.benchmarks.corpus import load_descriptions
+
+
+def baseline_emails(text):
+    if not text:
+        return None
+    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+    return email_regex.findall(text)
+
+
+def baseline_job_type(description):
+    if not description:
+        return []
+    keywords = {"fulltime": r"full\s?time", "parttime": r"part\s?time", "internship": r"internship", "contract": r"contract"}
+    listing_types = [key for key, pattern in keywords.items() if re.search(pattern, description, re.IGNORECASE)]
+    return listing_types if listing_types else None
+
+
+def separate_scans(descriptions):
+    for description in descriptions:
+        baseline_emails(description)
+        baseline_job_type(description)
+        any(keyword in description.lower() for keyword in REMOTE_KEYWORDS)
+        baseline_extract_salary(description)
+
+
+def analyzer(descriptions):
+    for description in descriptions:
+        analyze_description(description)
+
+
+def cpu_seconds(func, descriptions):
+    start = time.process_time()
+    func(descriptions)
+    return time.process_time() - start
+
+
+if __name__ == "__main__":
+    descriptions = load_descriptions(sys.argv[1] if len(sys.argv) > 1 else None, 10_000)
+    if len(sys.argv) < 2:
+        descriptions = [(text + "\n\n") * max(1, 5000 // len(text)) for text in descriptions]
+    scale = 10_000 / len(descriptions)
+    print(f"{len(descriptions):,} descriptions, {sum(map(len, descriptions)) / len(descriptions) / 1000:.1f} KB average")
+    print(f"separate scans: {cpu_seconds(separate_scans, descriptions) * scale:6.2f} s CPU per 10k jobs")
+    analyzed = cpu_seconds(analyzer, descriptions) * scale
+    salaries = cpu_seconds(extract_salaries, descriptions) * scale
+    print(f"analyzer:       {analyzed:6.2f} s CPU per 10k jobs")
+    print(f"  + salaries:   {analyzed + salaries:6.2f} s CPU per 10k jobs (extract_salaries, {salaries:.2f} s)")
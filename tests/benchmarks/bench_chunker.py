@@ -0,0 +1,58 @@
+"""
+Chunker benchmark: the old header split in database.custom_semantic_chunker (no token counting)
+against the token-aware chunker, over a job corpus.
+
+    PYTHONPATH=. python tests/benchmarks/bench_chunker.py [jobs.csv]
+
+jobs.csv is a scrape_jobs CSV export; without one, 2,000 generated postings are used.
+"""
+import re
+import sys
+import time
+
+from jobspy.analysis.chunker import chunk_texts
+from jobspy.analysis.tokenizer import count_tokens
+from tests.benchmarks.corpus import load_descriptions
+
+HEADERS = [
+    "responsibilities", "requirements", "qualifications", "duties",
+    "experience", "skills", "about the role", "about you", "your role",
+    "what you'll do", "what you will do", "what you'll need", "nice to have", "preferred qualifications"
+]
+
+
+def baseline_chunker(text: str) -> list[str]:
+    # database.custom_semantic_chunker before the chunker module
+    if not text:
+        return []
+    pattern = r'\n\s*(' + '|'.join(re.escape(h) for h in HEADERS) + r')\s*[:\-]*\s*\n'
+    chunks = re.split(pattern, text, flags=re.IGNORECASE)
+    reconstructed_chunks = []
+    current_chunk_content = [chunks[0].strip()]
+    for i in range(1, len(chunks), 2):
+        if current_chunk_content[0]:
+            reconstructed_chunks.append(current_chunk_content[0])
+        current_chunk_content = [(chunks[i] + ":\n" + chunks[i + 1]).strip()]
+    if current_chunk_content[0]:
+        reconstructed_chunks.append(current_chunk_content[0])
+    if len(reconstructed_chunks) <= 1 and text:
+        reconstructed_chunks = [p.strip() for p in text.split('\n\n') if p.strip()]
+    return [chunk for chunk in reconstructed_chunks if chunk]
+
+
+def report(label, chunker, descriptions):
+    start = time.perf_counter()
+    chunked = chunker(descriptions)
+    elapsed = time.perf_counter() - start
+    sizes = [count_tokens(chunk) for chunks in chunked for chunk in chunks]
+    print(
+        f"{label:<12}{elapsed:7.2f} s  {len(sizes):>7,} chunks  "
+        f"{min(sizes)}..{max(sizes)} tokens (mean {sum(sizes) / len(sizes):.0f})"
+    )
+
+
+if __name__ == "__main__":
+    descriptions = load_descriptions(sys.argv[1] if len(sys.argv) > 1 else None, 2000)
+    print(f"{len(descriptions):,} descriptions")
+    report("old", lambda texts: [baseline_chunker(text) for text in texts], descriptions)
+    report("new", chunk_texts, descriptions)
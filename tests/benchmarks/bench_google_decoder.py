@@ -0,0 +1,43 @@
+"""
+Google payload decoding benchmark: the old regex/json.loads path against the single-scan decoder,
+on the sanitized fixtures in tests/fixtures/google and on an initial page padded to about 1 MB.
+
+    PYTHONPATH=. python tests/benchmarks/bench_google_decoder.py [repeats]
+"""
+import json
+import sys
+import timeit
+
+from jobspy.google.util import decode_async_page, find_job_info, find_job_info_initial_page
+from tests.test_google_util import (
+    legacy_decode_async_page,
+    legacy_find_job_info,
+    legacy_find_job_info_initial_page,
+    read_fixture,
+)
+
+
+def legacy_parse_async(text):
+    return [legacy_find_job_info(json.loads(blob)) for _, blob in legacy_decode_async_page(text) if blob.startswith("[[[")]
+
+
+def parse_async(text):
+    return [find_job_info(blob) for _, blob in decode_async_page(text) if blob.startswith("[[[")]
+
+
+def report(label, func, text, repeats):
+    per_call = min(timeit.repeat(lambda: func(text), number=repeats, repeat=5)) / repeats
+    print(f"{label:<34}{per_call * 1000:8.3f} ms  ({len(func(text))} jobs)")
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    async_page = read_fixture("async_page.txt")
+    initial_page = read_fixture("initial_page.html")
+    large_page = initial_page.replace("</body>", "<div>" + "x" * 1_000_000 + "</div></body>")
+    report("async page, legacy", legacy_parse_async, async_page, repeats)
+    report("async page, single scan", parse_async, async_page, repeats)
+    report("initial page, legacy", legacy_find_job_info_initial_page, initial_page, repeats)
+    report("initial page, single scan", find_job_info_initial_page, initial_page, repeats)
+    report("1 MB initial page, legacy", legacy_find_job_info_initial_page, large_page, max(1, repeats // 20))
+    report("1 MB initial page, single scan", find_job_info_initial_page, large_page, max(1, repeats // 20))
@@ -0,0 +1,53 @@
+"""
+Job construction benchmark: the validate -> model_dump -> Location re-validation path scrape_jobs
+used to take per job, against attribute rows from a validated JobPost and from the unvalidated
+JobRecord fast path, plus scrape_jobs end to end over a stub scraper.
+
+    PYTHONPATH=. python tests/benchmarks/bench_job_record.py [n_jobs]
+"""
+import sys
+import time
+from unittest import mock
+
+from jobspy import scrape_jobs
+from jobspy.model import JOB_FIELDS, JobPost, JobRecord, Location
+from tests.test_model import StubScraper, job_fields
+
+
+def dumped_row(kwargs):
+    # The old path: validate, dump, then rebuild Location just to display it
+    job_data = JobPost(**kwargs).model_dump()
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+    return job_data
+
+
+def attribute_row(job):
+    job_data = {name: getattr(job, name) for name in JOB_FIELDS}
+    if job_data["location"]:
+        job_data["location"] = job_data["location"].display_location()
+    return job_data
+
+
+def per_job(label, build, inputs):
+    start = time.perf_counter()
+    for kwargs in inputs:
+        build(kwargs)
+    print(f"{label:<38}{(time.perf_counter() - start) / len(inputs) * 1e6:7.1f} us/job")
+
+
+def end_to_end(n, validate):
+    StubScraper.n = n
+    with mock.patch("jobspy.Indeed", StubScraper):
+        start = time.perf_counter()
+        scrape_jobs(site_name="indeed", search_term="engineer", validate=validate)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    inputs = [job_fields(i) for i in range(n)]
+    per_job("JobPost + model_dump + Location", dumped_row, inputs)
+    per_job("JobPost + attribute row", lambda kwargs: attribute_row(JobPost(**kwargs)), inputs)
+    per_job("JobRecord + attribute row", lambda kwargs: attribute_row(JobRecord(**kwargs)), inputs)
+    print(f"scrape_jobs, {n} stub jobs: {end_to_end(n, True):.2f} s validated, {end_to_end(n, False):.2f} s with validate=False")
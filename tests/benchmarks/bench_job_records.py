@@ -0,0 +1,86 @@
+"""
+Job document conversion benchmark: the old iterrows loop in process_and_store_jobs against
+database._job_records, at 10k and 100k rows. Both must produce the same documents.
+
+    PYTHONPATH=. python tests/benchmarks/bench_job_records.py [rows ...]
+
+database reads its settings at import; placeholders are used for any that aren't set. Without
+a Mongo server its index setup fails fast and logs an error; the conversion itself is offline.
+"""
+import os
+import sys
+import time as timer
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+
+for variable, placeholder in {
+    "MONGO_URI": "mongodb://localhost:27017/?serverSelectionTimeoutMS=200",
+    "AZURE_OPENAI_ENDPOINT": "https://example.invalid",
+    "AZURE_OPENAI_EMBEDDING_ENDPOINT": "https://example.invalid",
+    "OPENAI_API_KEY": "placeholder",
+    "OPENAI_EMBEDDING_API_KEY": "placeholder",
+    "OPENAI_DEPLOYMENT_NAME": "placeholder",
+}.items():
+    os.environ.setdefault(variable, placeholder)
+
+from jobspy.database import _job_records  # noqa: E402
+from jobspy.util import desired_order  # noqa: E402
+
+
+def make_jobs(rows: int, seed: int = 0) -> pd.DataFrame:
+    """A scrape_jobs-shaped frame with missing values in every column"""
+    rng = np.random.default_rng(seed)
+    columns = desired_order[:23]
+    frame = pd.DataFrame(
+        {column: rng.choice([f"{column}-a", f"{column}-b", None], rows).astype(object) for column in columns}
+    )
+    frame["id"] = [f"in-{i}" for i in range(rows)]
+    frame["date_posted"] = pd.Series(
+        rng.choice([date(2024, 1, 1), date(2024, 5, 17), None], rows), dtype=object
+    )
+    for column in ("min_amount", "max_amount"):
+        if column in frame:
+            frame[column] = np.where(rng.random(rows) < 0.5, rng.integers(30, 200, rows) * 1000.0, np.nan)
+    if "is_remote" in frame:
+        frame["is_remote"] = rng.choice([True, False, None], rows)
+    frame["description"] = "A job description."
+    return frame
+
+
+def baseline_records(jobs_df: pd.DataFrame) -> list[dict]:
+    # The per-row conversion process_and_store_jobs did before _job_records
+    records = []
+    for _, job in jobs_df.iterrows():
+        metadata = job.to_dict()
+        for date_field in ["date_posted", "expiry_date"]:
+            if isinstance(metadata.get(date_field), date) and not isinstance(metadata.get(date_field), datetime):
+                metadata[date_field] = datetime.combine(metadata[date_field], time.min)
+        metadata.pop("description", "")
+        records.append({k: (None if pd.isna(v) else v) for k, v in metadata.items()})
+    return records
+
+
+def vectorized_records(jobs_df: pd.DataFrame) -> list[dict]:
+    records = _job_records(jobs_df)
+    for metadata in records:
+        metadata.pop("description", None)
+    return records
+
+
+def timed(func, frame):
+    start = timer.perf_counter()
+    result = func(frame)
+    return result, timer.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    print(f"{'rows':>8}  {'iterrows':>9}  {'vectorized':>10}")
+    for rows in sizes:
+        frame = make_jobs(rows)
+        old, old_time = timed(baseline_records, frame)
+        new, new_time = timed(vectorized_records, frame)
+        assert old == new, "documents differ"
+        print(f"{rows:>8,}  {old_time:8.2f}s  {new_time:9.2f}s")
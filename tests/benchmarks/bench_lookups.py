@@ -0,0 +1,46 @@
+"""
+Enum lookup benchmark: the old linear scans for job types and countries against the
+precomputed indexes in jobspy.normalize, over 100k lookups.
+
+    PYTHONPATH=. python tests/benchmarks/bench_lookups.py [n_lookups]
+"""
+import random
+import sys
+import time
+
+from jobspy.model import Country, JobType
+from jobspy.normalize import country_from_string, job_type_from_string
+from tests.test_normalize import legacy_last_match
+
+
+def legacy_country(country_str):
+    # Country.from_string before the index, returning None instead of raising
+    country_str = country_str.strip().lower()
+    for country in Country:
+        if country_str in country.value[0].split(","):
+            return country
+    return None
+
+
+def timed(label, lookup, keys):
+    start = time.perf_counter()
+    results = [lookup(key) for key in keys]
+    print(f"{label:<24}{(time.perf_counter() - start) * 1000:8.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    job_type_keys = [value for job_type in JobType for value in job_type.value] + ["unknown"]
+    country_keys = [name for country in Country for name in country.value[0].split(",")]
+    country_keys += [name.title() for name in country_keys] + ["atlantis"]
+    job_types = rng.choices(job_type_keys, k=n)
+    countries = rng.choices(country_keys, k=n)
+    print(f"{n:,} lookups")
+    old = timed("job type, linear scan", legacy_last_match, job_types)
+    new = timed("job type, index", job_type_from_string, job_types)
+    assert old == new
+    old = timed("country, linear scan", legacy_country, countries)
+    new = timed("country, index", country_from_string, countries)
+    assert old == new
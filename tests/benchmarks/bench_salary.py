@@ -0,0 +1,88 @@
+"""
+Salary extraction benchmark: the original util.extract_salary against salary.extract_salary
+and the batch salary.extract_salaries, over generated descriptions of about 4.5 KB.
+
+    PYTHONPATH=. python tests/benchmarks/bench_salary.py [n_descriptions]
+"""
+import random
+import re
+import sys
+import time
+
+from jobspy.salary import extract_salaries, extract_salary
+
+FILLER = (
+    "We are looking for an engineer to join our team. You will design, build and maintain "
+    "services used by millions of customers, work closely with product and design, and "
+    "mentor junior developers. Requirements: 3+ years of experience with Python or Go. "
+)
+SALARIES = ["$80,000 - $100,000 per year", "$50k-60k", "$25 - $30 an hour", "£30,000 to £35,000", "€45k - €55k"]
+
+
+def baseline_extract_salary(salary_str, lower_limit=1000, upper_limit=700000, hourly_threshold=350, monthly_threshold=30000):
+    # util.extract_salary before the salary module, minus enforce_annual_salary
+    if not salary_str:
+        return None, None, None, None
+    annual_max_salary = None
+    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+
+    def to_int(s):
+        return int(float(s.replace(",", "")))
+
+    match = re.search(min_max_pattern, salary_str)
+    if match:
+        min_salary = to_int(match.group(1))
+        max_salary = to_int(match.group(3))
+        if "k" in match.group(2).lower() or "k" in match.group(4).lower():
+            min_salary *= 1000
+            max_salary *= 1000
+        if min_salary < hourly_threshold:
+            interval = "hourly"
+            annual_min_salary = min_salary * 2080
+            if max_salary < hourly_threshold:
+                annual_max_salary = max_salary * 2080
+        elif min_salary < monthly_threshold:
+            interval = "monthly"
+            annual_min_salary = min_salary * 12
+            if max_salary < monthly_threshold:
+                annual_max_salary = max_salary * 12
+        else:
+            interval = "yearly"
+            annual_min_salary = min_salary
+            annual_max_salary = max_salary
+        if not annual_max_salary:
+            return None, None, None, None
+        if (
+            lower_limit <= annual_min_salary <= upper_limit
+            and lower_limit <= annual_max_salary <= upper_limit
+            and annual_min_salary < annual_max_salary
+        ):
+            return interval, min_salary, max_salary, "USD"
+    return None, None, None, None
+
+
+def make_descriptions(n, seed=0):
+    rng = random.Random(seed)
+    descriptions = []
+    for _ in range(n):
+        body = [FILLER] * 18
+        # Half of the descriptions carry a salary somewhere in the text
+        if rng.random() < 0.5:
+            body.insert(rng.randrange(len(body)), f"Compensation: {rng.choice(SALARIES)}. ")
+        descriptions.append("".join(body))
+    return descriptions
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"{label:<28}{time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    descriptions = make_descriptions(n)
+    print(f"{n} descriptions, {sum(map(len, descriptions)) / n / 1000:.1f} KB average")
+    timed("baseline extract_salary", lambda: [baseline_extract_salary(d) for d in descriptions])
+    timed("extract_salary", lambda: [extract_salary(d) for d in descriptions])
+    timed("extract_salaries", lambda: extract_salaries(descriptions))
@@ -0,0 +1,49 @@
+"""
+Job description corpus for the benchmarks: the description column of a scrape_jobs CSV
+export when one is given, otherwise generated postings shaped like the scraped ones.
+"""
+import random
+
+import pandas as pd
+
+SENTENCES = [
+    "You will design, build and maintain services used by millions of customers.",
+    "Work closely with product, design and data science to ship features end to end.",
+    "Mentor junior developers and take part in code reviews and on-call rotations.",
+    "3+ years of experience with Python, Go or Java in a production environment.",
+    "Experience with AWS, Docker and Kubernetes is a plus.",
+    "Strong communication skills and a bias for action.",
+    "This is a full-time position; remote work is possible for candidates in the US.",
+    "Benefits include health insurance, a 401(k) match and unlimited PTO.",
+    "Contact recruiting@example.com with any questions about the role.",
+    "Salary: $120,000 - $150,000 per year, depending on experience.",
+]
+HEADERS = ["Responsibilities", "Requirements", "Qualifications", "Nice to have", "About the role"]
+
+
+def _posting(rng: random.Random) -> str:
+    shape = rng.random()
+    if shape < 0.4:
+        # Sectioned posting
+        sections = []
+        for header in rng.sample(HEADERS, rng.randint(2, 5)):
+            bullets = "\n".join(f"- {rng.choice(SENTENCES)}" for _ in range(rng.randint(3, 12)))
+            sections.append(f"{header}:\n{bullets}")
+        return "We are hiring.\n\n" + "\n\n".join(sections)
+    if shape < 0.8:
+        # Many short paragraphs
+        return "\n\n".join(rng.choice(SENTENCES) for _ in range(rng.randint(5, 40)))
+    # One run-on block with no breaks at all
+    return " ".join(rng.choice(SENTENCES).rstrip(".") for _ in range(rng.randint(20, 150)))
+
+
+def make_descriptions(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [_posting(rng) for _ in range(n)]
+
+
+def load_descriptions(path: str | None, n: int) -> list[str]:
+    """Descriptions from a scrape_jobs CSV export, or n generated ones when no path is given"""
+    if path:
+        return pd.read_csv(path, usecols=["description"])["description"].dropna().astype(str).tolist()
+    return make_descriptions(n)
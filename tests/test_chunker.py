@@ -0,0 +1,59 @@
+from jobspy.analysis.chunker import chunk_text, chunk_texts
+from jobspy.analysis.tokenizer import count_tokens, token_offsets, truncate_to_tokens
+from tests.benchmarks.corpus import make_descriptions
+
+TEXT = "  Senior engineer (Python/Go), Zürich — 5+ years; naïve façade 🚀 emoji.\n\nSecond paragraph here."
+
+
+def test_token_offsets_mark_token_starts():
+    offsets = token_offsets(TEXT)
+    assert len(offsets) == count_tokens(TEXT)
+    assert offsets[0] == 2  # leading whitespace isn't a token
+    assert offsets == sorted(set(offsets))
+    pieces = [TEXT[a:b] for a, b in zip(offsets, offsets[1:] + [len(TEXT)])]
+    assert "".join(pieces) == TEXT[offsets[0]:]
+    assert all(piece.strip() for piece in pieces)
+
+
+def test_token_offsets_empty():
+    assert token_offsets("") == []
+    assert token_offsets("   ") == []
+
+
+def test_truncate_to_tokens():
+    for max_tokens in (1, 5, 12, 1000):
+        truncated = truncate_to_tokens(TEXT, max_tokens)
+        assert TEXT.startswith(truncated)
+        assert count_tokens(truncated) <= max_tokens
+    assert truncate_to_tokens(TEXT, 1000) == TEXT
+    assert truncate_to_tokens(TEXT, 0) == ""
+
+
+def test_run_on_text_is_cut_on_token_boundaries():
+    text = " ".join(f"Zürich-Ümlaut{i} naïve" for i in range(400))
+    chunks = chunk_text(text, min_tokens=16, max_tokens=100)
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+    # Nothing is lost or duplicated, and no word is split across chunks
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_chunks_respect_the_token_budget():
+    for text in make_descriptions(200, seed=1):
+        chunks = chunk_text(text, min_tokens=64, max_tokens=128)
+        assert chunks
+        assert all(chunk.strip() and count_tokens(chunk) <= 128 for chunk in chunks)
+
+
+def test_sections_are_kept_apart():
+    text = "Intro line.\n\nResponsibilities:\n" + "Build things. " * 60 + "\n\nRequirements:\n" + "Know things. " * 60
+    chunks = chunk_text(text, min_tokens=1, max_tokens=200)
+    assert chunks[0] == "Intro line."
+    assert chunks[1].startswith("Responsibilities:\n")
+    assert chunks[2].startswith("Requirements:\n")
+
+
+def test_chunk_texts_matches_chunk_text():
+    texts = make_descriptions(50, seed=2) + [None, ""]
+    texts += texts[:5]
+    assert chunk_texts(texts) == [chunk_text(text or "") for text in texts]
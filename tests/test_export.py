@@ -0,0 +1,97 @@
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jobspy.export import CATEGORICAL_COLUMNS, compact_job_dtypes, pa, to_arrow_table
+from jobspy.util import desired_order
+
+MISSING = [None, np.nan, pd.NaT, pd.NA]
+requires_pyarrow = pytest.mark.skipif(pa is None, reason="pyarrow is not installed")
+
+
+def rows_with(column: str, values: list) -> list[dict]:
+    return [{"id": f"in-{i}", column: value} for i, value in enumerate(values)]
+
+
+def test_compact_dtypes():
+    jobs = pd.DataFrame(
+        {
+            "site": ["indeed", "linkedin", None, "indeed", "indeed"],
+            "min_amount": [90000, "85000.5", None, np.nan, pd.NA],
+            "vacancy_count": [3.0, None, np.nan, pd.NA, "2"],
+            "is_remote": [True, False, None, np.nan, pd.NA],
+            "title": ["a", "b", "c", "d", "e"],
+        },
+        dtype=object,
+    )
+    compact = compact_job_dtypes(jobs)
+    assert compact["site"].dtype == "category"
+    assert compact["min_amount"].dtype == "Float64"
+    assert compact["vacancy_count"].dtype == "Int64"
+    assert compact["is_remote"].dtype == "boolean"
+    assert compact["title"].dtype == object
+    assert compact["min_amount"].tolist()[:2] == [90000.0, 85000.5]
+    assert compact["vacancy_count"].tolist()[0] == 3 and compact["vacancy_count"].tolist()[-1] == 2
+    assert compact["is_remote"].tolist()[:2] == [True, False]
+    # Every kind of missing value comes out as pd.NA, never NaN or a string
+    assert compact["min_amount"].isna().tolist() == [False, False, True, True, True]
+    assert compact["vacancy_count"].isna().tolist() == [False, True, True, True, False]
+    assert compact["is_remote"].isna().tolist() == [False, False, True, True, True]
+    assert compact["site"].isna().tolist() == [False, False, True, False, False]
+    assert jobs["is_remote"].dtype == object  # the input frame is left alone
+
+
+def test_compact_dtypes_skips_missing_columns():
+    compact = compact_job_dtypes(pd.DataFrame({"title": ["a"]}))
+    assert list(compact.columns) == ["title"]
+    assert set(CATEGORICAL_COLUMNS).isdisjoint(compact.columns)
+
+
+@requires_pyarrow
+def test_arrow_table_has_the_job_schema():
+    table = to_arrow_table([{"id": "in-0", "title": "Engineer"}])
+    assert table.column_names == desired_order
+    assert table.schema.field("date_posted").type == pa.date32()
+    assert table.schema.field("min_amount").type == pa.float64()
+    assert table.schema.field("is_remote").type == pa.bool_()
+    assert table.schema.field("vacancy_count").type == pa.int64()
+    assert table.schema.field("title").type == pa.string()
+
+
+@requires_pyarrow
+@pytest.mark.parametrize(
+    "column, present, expected",
+    [
+        ("title", "Engineer", "Engineer"),
+        ("is_remote", False, False),
+        ("min_amount", 90000, 90000.0),
+        ("vacancy_count", 3.0, 3),
+        ("date_posted", date(2024, 5, 17), date(2024, 5, 17)),
+    ],
+)
+def test_missing_values_become_null(column, present, expected):
+    table = to_arrow_table(rows_with(column, [present] + MISSING))
+    assert table.column(column).to_pylist() == [expected] + [None] * len(MISSING)
+
+
+@requires_pyarrow
+def test_dates_are_normalized():
+    values = [datetime(2024, 5, 17, 13, 30), "2024-05-17", pd.Timestamp("2024-05-17"), "30+ days ago"]
+    table = to_arrow_table(rows_with("date_posted", values))
+    assert table.column("date_posted").to_pylist() == [date(2024, 5, 17)] * 3 + [None]
+
+
+@requires_pyarrow
+def test_unparseable_numbers_become_null():
+    table = to_arrow_table(rows_with("company_rating", ["4.2", "n/a", 3]))
+    assert table.column("company_rating").to_pylist() == [4.2, None, 3.0]
+
+
+@requires_pyarrow
+def test_raw_descriptions_are_optional():
+    rows = [{"id": "in-0", "description_raw": b"\x78\x9c"}]
+    assert "description_raw" not in to_arrow_table(rows).column_names
+    table = to_arrow_table(rows, include_raw_description=True)
+    assert table.column("description_raw").to_pylist() == [b"\x78\x9c"]
@@ -0,0 +1,124 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from jobspy.exception import GoogleJobsException
+from jobspy.google.util import (
+    decode_async_page,
+    find_job_info,
+    find_job_info_initial_page,
+    get_async_cursor,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "google"
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+# The parser before the single-scan decoder, kept as the reference the new one must agree with
+
+
+def legacy_decode_async_page(job_data: str) -> list:
+    start_idx = job_data.find("[[[")
+    end_idx = job_data.rindex("]]]") + 3
+    return json.loads(job_data[start_idx:end_idx])[0]
+
+
+def legacy_get_async_cursor(job_data: str) -> str | None:
+    match_fc = re.search(r'data-async-fc="([^"]+)"', job_data)
+    return match_fc.group(1) if match_fc else None
+
+
+def legacy_find_job_info(jobs_data: list | dict) -> list | None:
+    if isinstance(jobs_data, dict):
+        for key, value in jobs_data.items():
+            if key == "520084652" and isinstance(value, list):
+                return value
+            else:
+                result = legacy_find_job_info(value)
+                if result:
+                    return result
+    elif isinstance(jobs_data, list):
+        for item in jobs_data:
+            result = legacy_find_job_info(item)
+            if result:
+                return result
+    return None
+
+
+def legacy_find_job_info_initial_page(html_text: str) -> list:
+    pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
+    return [json.loads(match.group(1)) for match in re.finditer(pattern, html_text)]
+
+
+@pytest.fixture(scope="module")
+def async_page():
+    return read_fixture("async_page.txt")
+
+
+@pytest.fixture(scope="module")
+def initial_page():
+    return read_fixture("initial_page.html")
+
+
+def test_async_cursor_matches_legacy(async_page, initial_page):
+    assert get_async_cursor(async_page) == legacy_get_async_cursor(async_page)
+    assert get_async_cursor(async_page) == "EqQCQUJ6dF9jbEl6ZXh0Q3Vyc29yX3Nhbml0aXplZA"
+    assert get_async_cursor("<div>no cursor</div>") is None
+
+
+def test_async_blobs_match_legacy(async_page):
+    blobs = decode_async_page(async_page)
+    assert blobs == legacy_decode_async_page(async_page)
+    assert len(blobs) == 11
+
+
+def test_async_job_info_matches_legacy(async_page):
+    jobs = []
+    for _, blob in decode_async_page(async_page):
+        if not blob.startswith("[[["):
+            continue
+        job_info = find_job_info(blob)
+        assert job_info == legacy_find_job_info(json.loads(blob))
+        jobs.append(job_info)
+    assert len(jobs) == 10
+    # The fields Google._parse_job reads
+    first = jobs[0]
+    assert first[0] == "Software Engineer"
+    assert first[1] == "Example Corp"
+    assert first[2] == "Austin, TX"
+    assert first[3][0][0] == "https://jobs.example.com/async/0?utm_source=google"
+    assert first[12] == "1 days ago"
+    assert first[19].startswith("About the role\nSoftware Engineer")
+    assert first[28] == "async0000xYz=="
+
+
+def test_initial_page_matches_legacy(initial_page):
+    jobs = find_job_info_initial_page(initial_page)
+    assert jobs == legacy_find_job_info_initial_page(initial_page)
+    assert [job[28] for job in jobs] == [f"initial{i:04d}xYz==" for i in range(10)]
+
+
+def test_blob_without_job_info():
+    assert find_job_info('[[["0ahUKEwi", {"other": [1, 2]}]]]') is None
+
+
+def test_malformed_job_info_fails_with_context():
+    with pytest.raises(GoogleJobsException, match="malformed job info .* at offset"):
+        find_job_info('[[[{"520084652": ["title", "company", ]]]')
+
+
+def test_malformed_initial_listing_is_skipped(initial_page):
+    broken = '<script>x = {"520084652": ["title", oops]}</script>'
+    assert find_job_info_initial_page(broken + initial_page) == find_job_info_initial_page(initial_page)
+
+
+def test_page_without_payload_fails_with_context():
+    with pytest.raises(GoogleJobsException, match="no job payload"):
+        decode_async_page("<html>Our systems have detected unusual traffic</html>")
+    with pytest.raises(GoogleJobsException, match="malformed async page"):
+        decode_async_page('<script>var d=[[["a", "b"],</script>')
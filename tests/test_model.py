@@ -0,0 +1,103 @@
+from dataclasses import fields
+from datetime import date
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from jobspy import scrape_jobs
+from jobspy.model import (
+    JOB_FIELDS,
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobRecord,
+    JobResponse,
+    JobType,
+    Location,
+    Scraper,
+    ScraperInput,
+    Site,
+)
+
+
+def job_fields(i: int) -> dict:
+    return dict(
+        id=f"in-{i}",
+        title=f"Engineer {i}",
+        company_name="Example Corp",
+        job_url=f"https://example.com/jobs/{i}",
+        location=Location(city="Austin", state="TX", country=Country.USA),
+        description="Full time role. Email jobs@example.com. Remote friendly.",
+        job_type=[JobType.FULL_TIME],
+        compensation=Compensation(
+            interval=CompensationInterval.YEARLY, min_amount=90000 + i, max_amount=120000, currency="USD"
+        ),
+        date_posted=date(2024, 5, 17),
+        emails=["jobs@example.com"],
+        is_remote=True,
+    )
+
+
+class StubScraper(Scraper):
+    """Returns n made-up Indeed jobs, built through create_job like the real scrapers"""
+
+    n = 50
+
+    def __init__(self, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(Site.INDEED, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        self.scraper_input = None
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        self.scraper_input = scraper_input
+        return JobResponse(jobs=[self.create_job(**job_fields(i)) for i in range(self.n)])
+
+
+def stub_scraper(validate_jobs: bool) -> StubScraper:
+    scraper = StubScraper()
+    scraper.scraper_input = ScraperInput(site_type=[Site.INDEED], validate_jobs=validate_jobs)
+    return scraper
+
+
+def test_create_job_validates_by_default():
+    assert isinstance(StubScraper().create_job(**job_fields(0)), JobPost)
+    assert isinstance(stub_scraper(validate_jobs=True).create_job(**job_fields(0)), JobPost)
+
+
+def test_create_job_fast_path_returns_job_record():
+    record = stub_scraper(validate_jobs=False).create_job(**job_fields(0), not_a_field="ignored")
+    assert type(record) is JobRecord
+    assert not hasattr(record, "__dict__")  # slotted
+    assert not hasattr(record, "not_a_field")
+    post = JobPost(**job_fields(0))
+    assert all(getattr(record, name) == getattr(post, name) for name in JOB_FIELDS)
+
+
+def test_job_record_mirrors_job_post():
+    assert tuple(f.name for f in fields(JobRecord)) == JOB_FIELDS == tuple(JobPost.model_fields)
+    assert all(value is None for value in (getattr(JobRecord(), name) for name in JOB_FIELDS))
+
+
+def test_job_response_accepts_records_without_revalidating():
+    record = stub_scraper(validate_jobs=False).create_job(**job_fields(0))
+    assert JobResponse(jobs=[record]).jobs[0] is record
+    with pytest.raises(ValueError):
+        JobResponse(jobs=[{"title": "not a job"}])
+
+
+@pytest.mark.parametrize("output", ["pandas", "arrow"])
+def test_scrape_jobs_output_does_not_depend_on_validation(output):
+    if output == "arrow":
+        pytest.importorskip("pyarrow")
+    with mock.patch("jobspy.Indeed", StubScraper):
+        validated = scrape_jobs(site_name="indeed", search_term="engineer", output=output)
+        unvalidated = scrape_jobs(site_name="indeed", search_term="engineer", output=output, validate=False)
+    if output == "arrow":
+        validated, unvalidated = validated.to_pandas(), unvalidated.to_pandas()
+    assert len(validated) == StubScraper.n
+    pd.testing.assert_frame_equal(validated, unvalidated)
+    row = validated.set_index("id").loc["in-0"]
+    assert row["location"] == "Austin, TX, USA"
+    assert row["job_type"] == "fulltime"
+    assert row["min_amount"] == 90000
@@ -0,0 +1,130 @@
+import pytest
+
+from jobspy import normalize
+from jobspy.glassdoor.util import get_job_type_enum, parse_location as glassdoor_parse_location
+from jobspy.model import Country, JobType, Location
+from jobspy.normalize import (
+    _parse_location,
+    country_from_string,
+    job_type_from_string,
+    load_gazetteer,
+    parse_location,
+)
+from jobspy.util import get_enum_from_job_type, get_enum_from_value
+
+# --- JobType, Country and Site lookups ---
+
+
+def legacy_last_match(job_type_str):
+    # get_enum_from_job_type before the index: no break, so the last member wins
+    res = None
+    for job_type in JobType:
+        if job_type_str in job_type.value:
+            res = job_type
+    return res
+
+
+def legacy_first_match(job_type_str):
+    # get_enum_from_value and glassdoor's get_job_type_enum before the index
+    for job_type in JobType:
+        if job_type_str in job_type.value:
+            return job_type
+    return None
+
+
+@pytest.mark.parametrize(
+    "alias, expected",
+    [
+        ("vollzeit", JobType.FULL_TIME),
+        ("tempsplein", JobType.FULL_TIME),
+        ("fulltime", JobType.FULL_TIME),
+        ("teilzeit", JobType.PART_TIME),
+        ("contractor", JobType.CONTRACT),
+        ("praktikum", JobType.INTERNSHIP),
+        ("全职", JobType.FULL_TIME),
+    ],
+)
+def test_job_type_aliases(alias, expected):
+    assert job_type_from_string(alias) is expected
+    assert get_enum_from_job_type(alias) is expected
+    assert get_enum_from_value(alias) is expected
+    assert get_job_type_enum(alias) == [expected]
+
+
+def test_each_spelling_belongs_to_one_job_type():
+    spellings = [value for job_type in JobType for value in job_type.value]
+    assert len(spellings) == len(set(spellings))
+
+
+def test_job_type_index_matches_legacy_scans():
+    for job_type in JobType:
+        for value in job_type.value:
+            assert job_type_from_string(value) is legacy_last_match(value) is legacy_first_match(value)
+    assert job_type_from_string("not a job type") is None
+    assert get_enum_from_job_type("") is None
+    with pytest.raises(Exception, match="Invalid job type"):
+        get_enum_from_value("not a job type")
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [("usa", Country.USA), (" United States ", Country.USA), ("uk", Country.UK), ("India", Country.INDIA)],
+)
+def test_country_from_string(name, expected):
+    assert country_from_string(name) is expected
+    assert Country.from_string(name) is expected
+
+
+def test_unknown_country():
+    assert country_from_string("atlantis") is None
+    with pytest.raises(ValueError, match="Invalid country string"):
+        Country.from_string("atlantis")
+
+
+# --- Locations ---
+
+
+@pytest.fixture
+def gazetteer(tmp_path, monkeypatch):
+    path = tmp_path / "cities.csv"
+    path.write_text(
+        "city,state,country\nAustin,TX,usa\nDhaka,Dhaka,bangladesh\nBengaluru,Karnataka,india\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(normalize, "GAZETTEER", {})
+    assert load_gazetteer(str(path)) == 3
+    yield
+    _parse_location.cache_clear()
+
+
+def test_without_gazetteer_only_default_country_is_filled():
+    # Two cities from the same search come out the same way
+    assert parse_location("Austin, TX", Country.USA) == Location(city="Austin", state="TX", country=Country.USA)
+    assert parse_location("Denver, CO", Country.USA) == Location(city="Denver", state="CO", country=Country.USA)
+    assert parse_location("Austin, TX") == Location(city="Austin", state="TX")
+
+
+def test_glassdoor_locations_get_the_search_country():
+    assert glassdoor_parse_location("Austin, TX", Country.USA).country is Country.USA
+    assert glassdoor_parse_location("Denver, CO", Country.USA).country is Country.USA
+    assert glassdoor_parse_location("Remote", Country.USA) is None
+
+
+def test_gazetteer_city(gazetteer):
+    assert parse_location("Bengaluru") == Location(city="Bengaluru", state="Karnataka", country=Country.INDIA)
+    assert parse_location("Austin, TX") == Location(city="Austin", state="TX", country=Country.USA)
+
+
+def test_city_not_in_gazetteer(gazetteer):
+    assert parse_location("Denver, CO") == Location(city="Denver", state="CO")
+    assert parse_location("Denver, CO", Country.USA) == Location(city="Denver", state="CO", country=Country.USA)
+
+
+def test_gazetteer_never_copies_city_into_state(gazetteer):
+    assert parse_location("Dhaka") == Location(city="Dhaka", country=Country.BANGLADESH)
+    assert parse_location("Dhaka", Country.BANGLADESH).display_location() == "Dhaka, Bangladesh"
+
+
+def test_gazetteer_does_not_override_a_known_country(gazetteer):
+    assert parse_location("Austin, TX", Country.INDIA).country is Country.INDIA
+    assert parse_location("Austin, TX, Canada").country is Country.CANADA
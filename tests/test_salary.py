@@ -0,0 +1,75 @@
+import math
+
+import pytest
+
+from jobspy.salary import extract_salaries, extract_salary
+
+NO_SALARY = (None, None, None, None)
+
+# (text, expected extract_salary result)
+CORPUS = [
+    ("Pay: $80,000 - $100,000 per year", ("yearly", 80000.0, 100000.0, "USD")),
+    ("$50k-60k", ("yearly", 50000.0, 60000.0, "USD")),
+    ("$4,000 - $5,000 monthly", ("monthly", 4000.0, 5000.0, "USD")),
+    ("$5,000 - $6,000", ("monthly", 5000.0, 6000.0, "USD")),
+    ("$25 - $30", ("hourly", 25.0, 30.0, "USD")),
+    ("$40 - $45 hourly", ("hourly", 40.0, 45.0, "USD")),
+    ("$1,000 - $1,200 /week", ("weekly", 1000.0, 1200.0, "USD")),
+    # "to" ranges
+    ("£30,000 to £35,000 per year", ("yearly", 30000.0, 35000.0, "GBP")),
+    ("$50 to 60 thousand", ("yearly", 50000.0, 60000.0, "USD")),
+    ("$50k to 60k", ("yearly", 50000.0, 60000.0, "USD")),
+    ("$50 to $60 an hour", ("hourly", 50.0, 60.0, "USD")),
+    ("$1 to 2 years experience", NO_SALARY),
+    ("£30,000 to 35,000 per year", NO_SALARY),
+    ("Requires $1 to 2 years experience, pays $70,000 - $90,000", ("yearly", 70000.0, 90000.0, "USD")),
+    # Other currencies
+    ("€25.50 – €30/hr", ("hourly", 25.5, 30.0, "EUR")),
+    ("€45k - €55k", ("yearly", 45000.0, 55000.0, "EUR")),
+    # Out of band, out of limits or reversed
+    ("$20 - $500", NO_SALARY),
+    ("$900,000 - $1,000,000", NO_SALARY),
+    ("$100,000 - $80,000", NO_SALARY),
+    # Nothing to find
+    ("no salary here", NO_SALARY),
+    ("", NO_SALARY),
+    (None, NO_SALARY),
+]
+
+
+@pytest.mark.parametrize("text, expected", CORPUS)
+def test_extract_salary(text, expected):
+    assert extract_salary(text) == expected
+
+
+def test_amounts_are_floats():
+    for text, expected in CORPUS:
+        _, min_amount, max_amount, _ = extract_salary(text)
+        if expected != NO_SALARY:
+            assert type(min_amount) is float and type(max_amount) is float, text
+    salaries = extract_salaries(["$50k-60k", "$25 - $30"])
+    assert salaries["min_amount"].dtype == "float64"
+    assert salaries["max_amount"].dtype == "float64"
+
+
+def _row(record):
+    return tuple(None if isinstance(value, float) and math.isnan(value) else value for value in record)
+
+
+@pytest.mark.parametrize("enforce_annual_salary", [False, True])
+def test_batch_matches_scalar(enforce_annual_salary):
+    texts = [text for text, _ in CORPUS]
+    salaries = extract_salaries(texts, enforce_annual_salary=enforce_annual_salary)
+    assert list(salaries.columns) == ["interval", "min_amount", "max_amount", "currency"]
+    for text, record in zip(texts, salaries.itertuples(index=False)):
+        assert _row(record) == extract_salary(text, enforce_annual_salary=enforce_annual_salary), text
+
+
+def test_enforce_annual_salary():
+    assert extract_salary("$25 - $30", enforce_annual_salary=True) == ("hourly", 52000.0, 62400.0, "USD")
+    assert extract_salary("$4,000 - $5,000 monthly", enforce_annual_salary=True) == (
+        "monthly",
+        48000.0,
+        60000.0,
+        "USD",
+    )
@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from jobspy import scrape_jobs
+from jobspy.model import DescriptionFormat, JobResponse, JobType, Scraper, ScraperInput, Site
+from jobspy.util import analyze_description, description_text, markdown_converter
+
+POSTINGS = [
+    '<div class="job"><h2>About the role</h2><p>This is a <b>full-time</b> position, fully remote.</p>'
+    '<p>Pay: $80,000 - $100,000 per year</p><p>Questions? <a href="mailto:jobs@example.com">Email us</a></p></div>',
+    '<div class="remote-badge hybrid" data-tag="contract"><p>Part time barista &amp; cashier.</p>'
+    "<ul><li>$15 - $18 an hour</li><li>No weekends</li></ul></div>",
+    "<p>Internship for students, on site in Austin.</p><!-- wfh not allowed --><p>Contact hr@example.org</p>",
+]
+
+
+def test_description_text_drops_tags_and_decodes_entities():
+    assert description_text("<p>Part time barista &amp; cashier.</p>").split() == ["Part", "time", "barista", "&", "cashier."]
+    assert description_text("**Markdown** stays as is, 5 < 6") == "**Markdown** stays as is, 5 < 6"
+    assert description_text(None) is None
+
+
+@pytest.mark.parametrize("posting", POSTINGS)
+def test_html_and_markdown_give_the_same_analysis(posting):
+    assert analyze_description(posting) == analyze_description(markdown_converter(posting))
+
+
+def test_markup_is_not_text():
+    # Class names, attributes and comments aren't keywords
+    analysis = analyze_description(POSTINGS[1])
+    assert analysis.is_remote is False
+    assert analysis.job_type == [JobType.PART_TIME]
+    assert analyze_description(POSTINGS[2]).is_remote is False
+
+
+class HtmlScraper(Scraper):
+    """Serves POSTINGS the way the real scrapers do: raw HTML for lazy runs, markdown otherwise"""
+
+    def __init__(self, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(Site.GOOGLE, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        self.scraper_input = None
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        self.scraper_input = scraper_input
+        jobs = []
+        for i, posting in enumerate(POSTINGS):
+            description = (
+                posting
+                if scraper_input.description_format == DescriptionFormat.RAW
+                else markdown_converter(posting)
+            )
+            analysis = analyze_description(description)
+            jobs.append(
+                self.create_job(
+                    id=f"go-{i}",
+                    title="Job",
+                    company_name="Example Corp",
+                    job_url=f"https://example.com/{i}",
+                    location=None,
+                    description=description,
+                    emails=analysis.emails,
+                    job_type=analysis.job_type,
+                    is_remote=analysis.is_remote,
+                )
+            )
+        return JobResponse(jobs=jobs)
+
+
+def test_lazy_descriptions_derive_the_same_fields():
+    columns = ["id", "emails", "job_type", "is_remote", "interval", "min_amount", "max_amount", "salary_source"]
+    with mock.patch("jobspy.Google", HtmlScraper):
+        eager = scrape_jobs(site_name="google", search_term="jobs")
+        lazy = scrape_jobs(site_name="google", search_term="jobs", lazy_descriptions=True)
+    assert lazy["description"].isna().all()
+    eager = eager.sort_values("id", ignore_index=True)[columns]
+    lazy = lazy.sort_values("id", ignore_index=True)[columns]
+    pd.testing.assert_frame_equal(lazy, eager)
+    assert eager["is_remote"].tolist() == [True, False, False]
+    assert eager["emails"].fillna("").tolist() == ["jobs@example.com", "", "hr@example.org"]
+    assert eager["min_amount"].tolist()[:2] == [80000.0, 15.0]